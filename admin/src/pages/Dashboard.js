@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import { Monitor, Disc3, Image, Calendar, FileText, Eye, ArrowRight } from 'lucide-react';
+import { Monitor, Disc3, Image, Calendar, FileText, Eye, ArrowRight, UploadCloud } from 'lucide-react';
 import api from '../services/api';
 
 function Dashboard() {
@@ -12,6 +12,7 @@ function Dashboard() {
   });
   const [recentGigs, setRecentGigs] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [exporting, setExporting] = useState(false);
 
   useEffect(() => {
     loadStats();
@@ -22,7 +23,7 @@ function Dashboard() {
       const [techProjects, djProjects, assets] = await Promise.all([
         api.getProjectsBySectionSlug('tech', false),
         api.getProjectsBySectionSlug('dj', false),
-        api.getAssets(),
+        api.getAssets(null, null, { limit: 1, includeTotal: true }),
       ]);
 
       const techItems = techProjects.items || [];
@@ -32,7 +33,7 @@ function Dashboard() {
       setStats({
         techProjects: techItems.filter(p => p.extra_data?.type === 'featured_project').length,
         djGigs: gigs.length,
-        assets: assets.items?.length || assets.length || 0,
+        assets: assets.total ?? assets.items?.length ?? 0,
         publishedGigs: gigs.filter(g => g.is_published).length,
       });
 
@@ -48,6 +49,18 @@ function Dashboard() {
     }
   };
 
+  const handleExport = async () => {
+    setExporting(true);
+    try {
+      const manifest = await api.exportContent();
+      alert(`Site content exported (version ${manifest.version.slice(0, 8)})`);
+    } catch (err) {
+      alert('Export failed: ' + err.message);
+    } finally {
+      setExporting(false);
+    }
+  };
+
   if (loading) {
     return (
       <div className="flex items-center justify-center h-64">
@@ -58,7 +71,17 @@ function Dashboard() {
 
   return (
     <div>
-      <h1 className="text-2xl font-bold mb-8">Dashboard</h1>
+      <div className="flex items-center justify-between mb-8">
+        <h1 className="text-2xl font-bold">Dashboard</h1>
+        <button
+          onClick={handleExport}
+          disabled={exporting}
+          className="flex items-center gap-2 px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:opacity-50"
+        >
+          <UploadCloud className="w-4 h-4" />
+          {exporting ? 'Exporting...' : 'Publish Site Content'}
+        </button>
+      </div>
 
       {/* Stats Grid */}
       <div className="grid grid-cols-1 md:grid-cols-4 gap-6 mb-8">
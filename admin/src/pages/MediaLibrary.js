@@ -3,9 +3,13 @@ import { Upload, Search, Filter, Trash2, Copy, X, Image, Video, FileText, Loader
 import api from '../services/api';
 import ConfirmDialog from '../components/ConfirmDialog';
 
+const PAGE_SIZE = 60;
+
 export default function MediaLibrary() {
   const [assets, setAssets] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [uploading, setUploading] = useState(false);
   const [error, setError] = useState(null);
   const [selectedAsset, setSelectedAsset] = useState(null);
@@ -22,8 +26,9 @@ export default function MediaLibrary() {
   const loadAssets = async () => {
     try {
       setLoading(true);
-      const data = await api.getAssets(null, filterType || null);
-      setAssets(data.items || data || []);
+      const data = await api.getAssets(null, filterType || null, { limit: PAGE_SIZE });
+      setAssets(data.items || []);
+      setNextCursor(data.next_cursor || null);
       setError(null);
     } catch (err) {
       setError(err.message);
@@ -32,6 +37,21 @@ export default function MediaLibrary() {
     }
   };
 
+  // Each page is a keyset query, so later pages cost the same as the first
+  const loadMoreAssets = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const data = await api.getAssets(null, filterType || null, { cursor: nextCursor, limit: PAGE_SIZE });
+      setAssets((current) => [...current, ...(data.items || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleUpload = async (e) => {
     const files = Array.from(e.target.files || []);
     if (files.length === 0) return;
@@ -212,6 +232,19 @@ export default function MediaLibrary() {
               })}
             </div>
           )}
+
+          {!loading && nextCursor && (
+            <div className="flex justify-center mt-6">
+              <button
+                onClick={loadMoreAssets}
+                disabled={loadingMore}
+                className="flex items-center gap-2 px-4 py-2 text-sm border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore && <Loader2 className="w-4 h-4 animate-spin" />}
+                Load more
+              </button>
+            </div>
+          )}
         </div>
 
         {/* Details Panel */}
@@ -5,6 +5,10 @@ const LOCAL_API = 'http://localhost:8000/api/v1';
 // For local development, create a .env.local file with REACT_APP_API_URL=http://localhost:8000/api/v1
 const API_BASE = process.env.REACT_APP_API_URL || PRODUCTION_API;
 
+// Upload asset bytes straight to S3 via presigned URLs instead of through the API.
+// Requires the bucket's CORS config to allow PUT from the admin origin and expose ETag.
+const DIRECT_UPLOADS = process.env.REACT_APP_DIRECT_UPLOADS === 'true';
+
 class ApiService {
   constructor() {
     this.accessToken = localStorage.getItem('accessToken');
@@ -193,8 +197,31 @@ class ApiService {
     return this.updateProject(id, { is_published: false });
   }
 
+  // operations: [{ op: 'create', data }, { op: 'update', id, data },
+  // { op: 'publish' | 'unpublish' | 'delete', id }]. All or nothing.
+  async batchProjects(operations) {
+    const response = await this.request('/projects/batch', {
+      method: 'POST',
+      body: JSON.stringify({ operations }),
+    });
+    const body = await response.json().catch(() => ({}));
+    if (!response.ok) {
+      const failed = Array.isArray(body.detail)
+        ? body.detail.filter((r) => r.error).map((r) => `#${r.index}: ${r.error}`)
+        : [];
+      const error = new Error(failed.join('; ') || body.detail || 'Failed to apply batch');
+      error.results = Array.isArray(body.detail) ? body.detail : null;
+      throw error;
+    }
+    return body.results;
+  }
+
   // ============ ASSETS ============
   async uploadAsset(file, projectId = null, altText = null, caption = null) {
+    if (DIRECT_UPLOADS) {
+      return this.uploadAssetDirect(file, projectId, altText, caption);
+    }
+
     const formData = new FormData();
     formData.append('file', file);
     if (projectId) formData.append('project_id', projectId);
@@ -217,7 +244,63 @@ class ApiService {
     return response.json();
   }
 
+  async uploadAssetDirect(file, projectId = null, altText = null, caption = null) {
+    const startResponse = await this.request('/assets/uploads', {
+      method: 'POST',
+      body: JSON.stringify({
+        filename: file.name,
+        content_type: file.type,
+        file_size: file.size,
+        project_id: projectId,
+      }),
+    });
+    if (!startResponse.ok) {
+      const error = await startResponse.json().catch(() => ({}));
+      throw new Error(error.detail || 'Upload failed');
+    }
+    const upload = await startResponse.json();
+
+    let parts = null;
+    if (upload.method === 'PUT') {
+      const putResponse = await fetch(upload.url, {
+        method: 'PUT',
+        headers: upload.headers,
+        body: file,
+      });
+      if (!putResponse.ok) throw new Error('Upload to storage failed');
+    } else {
+      parts = await Promise.all(upload.parts.map(async (part) => {
+        const start = (part.part_number - 1) * upload.part_size;
+        const partResponse = await fetch(part.url, {
+          method: 'PUT',
+          body: file.slice(start, start + upload.part_size),
+        });
+        if (!partResponse.ok) throw new Error('Upload to storage failed');
+        return { part_number: part.part_number, etag: partResponse.headers.get('ETag') };
+      }));
+    }
+
+    const completeResponse = await this.request('/assets/uploads/complete', {
+      method: 'POST',
+      body: JSON.stringify({
+        upload_token: upload.upload_token,
+        parts,
+        alt_text: altText,
+        caption,
+      }),
+    });
+    if (!completeResponse.ok) {
+      const error = await completeResponse.json().catch(() => ({}));
+      throw new Error(error.detail || 'Upload failed');
+    }
+    return completeResponse.json();
+  }
+
   async uploadMultipleAssets(files, projectId = null) {
+    if (DIRECT_UPLOADS) {
+      return Promise.all(files.map(file => this.uploadAssetDirect(file, projectId)));
+    }
+
     const formData = new FormData();
     files.forEach(file => formData.append('files', file));
     if (projectId) formData.append('project_id', projectId);
@@ -237,11 +320,14 @@ class ApiService {
     return response.json();
   }
 
-  async getAssets(projectId = null, fileType = null) {
+  async getAssets(projectId = null, fileType = null, { cursor = null, limit = null, includeTotal = false } = {}) {
     let url = '/assets?';
     const params = [];
     if (projectId) params.push(`project_id=${projectId}`);
     if (fileType) params.push(`file_type=${fileType}`);
+    if (cursor) params.push(`cursor=${encodeURIComponent(cursor)}`);
+    if (limit) params.push(`limit=${limit}`);
+    if (includeTotal) params.push('include_total=true');
     url += params.join('&');
 
     const response = await this.request(url);
@@ -278,6 +364,15 @@ class ApiService {
     return response.json();
   }
 
+  async exportContent() {
+    const response = await this.request('/content/export', { method: 'POST' });
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw new Error(error.detail || 'Failed to export content');
+    }
+    return response.json();
+  }
+
   // ============ HELPERS ============
   // Get projects filtered by extra_data.type
   async getProjectsByType(sectionSlug, type) {
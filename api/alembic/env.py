@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.config import settings
 from app.database import Base
-from app.models import Asset, Project, Section, User
+from app.models import Asset, AssetBlob, AssetJob, Project, PublishedSection, Section, User
 
 config = context.config
 
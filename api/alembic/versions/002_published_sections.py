@@ -0,0 +1,176 @@
+"""Published sections read model
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "published_sections",
+        sa.Column("slug", sa.String(50), primary_key=True),
+        sa.Column(
+            "section_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("sections.id", ondelete="CASCADE"),
+            unique=True,
+            nullable=False,
+        ),
+        sa.Column("display_order", sa.Integer(), default=0),
+        sa.Column("document", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            onupdate=sa.func.now(),
+        ),
+    )
+    _backfill()
+
+
+# Tables as of this revision; the app models may have moved on since
+_sections = sa.table(
+    "sections",
+    sa.column("id"), sa.column("slug"), sa.column("title"), sa.column("description"),
+    sa.column("display_order"), sa.column("is_active"),
+)
+_projects = sa.table(
+    "projects",
+    sa.column("id"), sa.column("section_id"), sa.column("slug"), sa.column("title"),
+    sa.column("subtitle"), sa.column("description"), sa.column("content"),
+    sa.column("thumbnail_url"), sa.column("display_order"), sa.column("is_published"),
+    sa.column("is_featured"), sa.column("tags"), sa.column("extra_data"),
+    sa.column("published_at"),
+)
+_assets = sa.table(
+    "assets",
+    sa.column("id"), sa.column("project_id"), sa.column("filename"), sa.column("file_type"),
+    sa.column("cloudfront_url"), sa.column("thumbnail_url"), sa.column("width"),
+    sa.column("height"), sa.column("duration"), sa.column("alt_text"), sa.column("caption"),
+    sa.column("extra_data"),
+)
+_published_sections = sa.table(
+    "published_sections",
+    sa.column("slug"), sa.column("section_id"), sa.column("display_order"),
+    sa.column("document", postgresql.JSONB()),
+)
+
+
+# Frozen copy of ContentService's document builder when this revision was
+# written; importing the live one would break upgrades from an empty
+# database as soon as it reads a column added by a later revision
+_SOURCE_TYPES = (("avif", "image/avif"), ("webp", "image/webp"), ("jpeg", "image/jpeg"))
+
+
+def _srcset_sources(variants: Optional[List[Dict[str, Any]]]) -> List[Dict[str, str]]:
+    sources = []
+    for fmt, mime_type in _SOURCE_TYPES:
+        entries = sorted(
+            (v for v in variants or [] if v.get("format") == fmt),
+            key=lambda v: v["width"],
+        )
+        if entries:
+            sources.append({
+                "type": mime_type,
+                "srcset": ", ".join(f"{v['url']} {v['width']}w" for v in entries),
+            })
+    return sources
+
+
+def _asset_to_dict(asset: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(asset["id"]),
+        "filename": asset["filename"],
+        "file_type": asset["file_type"],
+        "cloudfront_url": asset["cloudfront_url"],
+        "thumbnail_url": asset["thumbnail_url"],
+        "width": asset["width"],
+        "height": asset["height"],
+        "duration": asset["duration"],
+        "alt_text": asset["alt_text"],
+        "caption": asset["caption"],
+        "sources": _srcset_sources((asset["extra_data"] or {}).get("variants")),
+    }
+
+
+def _project_to_dict(
+    project: Mapping[str, Any],
+    assets: List[Mapping[str, Any]],
+) -> Dict[str, Any]:
+    published_at = project["published_at"]
+    return {
+        "id": str(project["id"]),
+        "slug": project["slug"],
+        "title": project["title"],
+        "subtitle": project["subtitle"],
+        "description": project["description"],
+        "content": project["content"],
+        "thumbnail_url": project["thumbnail_url"],
+        "is_featured": project["is_featured"],
+        "tags": project["tags"] or [],
+        "extra_data": project["extra_data"],
+        "published_at": published_at.isoformat() if published_at else None,
+        "assets": [_asset_to_dict(a) for a in assets],
+    }
+
+
+def _backfill() -> None:
+    """Build the document of every active section, as ContentService would.
+
+    The public content routes read only from this table, so it must not be
+    empty once the migration has run.
+    """
+    bind = op.get_bind()
+
+    assets_by_project = defaultdict(list)
+    for asset in bind.execute(
+        sa.select(_assets).where(_assets.c.project_id.isnot(None))
+    ).mappings():
+        assets_by_project[asset["project_id"]].append(asset)
+
+    projects_by_section = defaultdict(list)
+    for project in bind.execute(
+        sa.select(_projects)
+        .where(_projects.c.is_published.is_(True))
+        .order_by(_projects.c.display_order)
+    ).mappings():
+        projects_by_section[project["section_id"]].append(
+            _project_to_dict(project, assets_by_project[project["id"]])
+        )
+
+    rows = [
+        {
+            "slug": section.slug,
+            "section_id": section.id,
+            "display_order": section.display_order,
+            "document": {
+                "id": str(section.id),
+                "slug": section.slug,
+                "title": section.title,
+                "description": section.description,
+                "projects": projects_by_section[section.id],
+            },
+        }
+        for section in bind.execute(
+            sa.select(_sections).where(_sections.c.is_active.is_(True))
+        )
+    ]
+    if rows:
+        op.bulk_insert(_published_sections, rows)
+
+
+def downgrade() -> None:
+    op.drop_table("published_sections")
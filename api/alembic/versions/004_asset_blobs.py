@@ -0,0 +1,39 @@
+"""Content-addressed asset storage
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_blobs",
+        sa.Column("content_hash", sa.String(64), primary_key=True),
+        sa.Column("s3_key", sa.String(500), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+
+    op.add_column("assets", sa.Column("content_hash", sa.String(64)))
+    op.create_index("ix_assets_content_hash", "assets", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_content_hash", table_name="assets")
+    op.drop_column("assets", "content_hash")
+    op.drop_table("asset_blobs")
@@ -0,0 +1,29 @@
+"""Partial index for published projects in display order
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_projects_published_order",
+        "projects",
+        ["section_id", "display_order"],
+        postgresql_where=sa.text("is_published"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_published_order", table_name="projects")
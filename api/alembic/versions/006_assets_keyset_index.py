@@ -0,0 +1,23 @@
+"""Index for keyset pagination of assets
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_assets_created_at_id", "assets", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_created_at_id", table_name="assets")
@@ -44,7 +44,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await AuthService.get_user_by_id(db, UUID(user_id))
+    user = await AuthService.get_principal(db, UUID(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
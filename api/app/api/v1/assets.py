@@ -1,14 +1,29 @@
+import asyncio
+from datetime import datetime, timedelta
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile, status
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 
 from app.api.deps import AdminUser, DBSession
 from app.models.asset import Asset
 from app.models.project import Project
-from app.schemas.asset import AssetListResponse, AssetResponse, AssetUpdate
-from app.services.s3_service import s3_service
+from app.config import settings
+from app.schemas.asset import (
+    AssetListResponse,
+    AssetResponse,
+    AssetUpdate,
+    AssetUploadComplete,
+    AssetUploadRequest,
+    AssetUploadResponse,
+)
+from app.services.asset_blob_service import AssetBlobService
+from app.services.content_service import ContentService
+from app.services.job_service import JobService
+from app.services.s3_service import FileTooLargeError, s3_service
+from app.utils.pagination import InvalidCursor, decode_cursor, encode_cursor
+from app.utils.security import create_upload_token, decode_token
 
 router = APIRouter(prefix="/assets", tags=["Assets"])
 
@@ -30,37 +45,79 @@ ALLOWED_MIME_TYPES = {
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 
 
+async def _share_stored_content(db: DBSession, asset: Asset) -> None:
+    """Reference the stored object for the asset's content hash.
+
+    Identical content re-uses the existing object and, once processed, its
+    thumbnail, variants and dimensions instead of being processed again.
+    """
+    stored_key = await AssetBlobService.acquire(db, asset.content_hash, asset.s3_key)
+    if stored_key != asset.s3_key:
+        # A concurrent upload of the same bytes registered first; drop our copy
+        await s3_service.delete_file(asset.s3_key)
+        asset.s3_key = stored_key
+        asset.filename = stored_key.rsplit("/", 1)[-1]
+        asset.cloudfront_url = s3_service._get_cloudfront_url(stored_key)
+
+    source = await AssetBlobService.find_processed_asset(db, asset.content_hash)
+    if source:
+        asset.thumbnail_url = source.thumbnail_url
+        asset.width = source.width
+        asset.height = source.height
+        asset.duration = source.duration
+        variants = (source.extra_data or {}).get("variants")
+        if variants:
+            asset.extra_data = {**(asset.extra_data or {}), "variants": variants}
+        asset.processing_status = "ready"
+
+
 @router.get("", response_model=AssetListResponse)
 async def list_assets(
     db: DBSession,
     admin: AdminUser,
     project_id: Optional[UUID] = None,
     file_type: Optional[str] = None,
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     limit: int = Query(50, ge=1, le=100),
+    include_total: bool = False,
 ):
-    query = select(Asset)
-
+    filters = []
     if project_id:
-        query = query.where(Asset.project_id == project_id)
+        filters.append(Asset.project_id == project_id)
     if file_type:
-        query = query.where(Asset.file_type == file_type)
+        filters.append(Asset.file_type == file_type)
 
-    query = query.order_by(Asset.created_at.desc()).offset(skip).limit(limit)
+    query = select(Asset).where(*filters)
+
+    if cursor:
+        try:
+            created_at, last_id = decode_cursor(cursor, (datetime.fromisoformat, UUID))
+        except InvalidCursor as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        query = query.where(
+            tuple_(Asset.created_at, Asset.id) < tuple_(created_at, last_id)
+        )
+
+    # Newest first; one extra row tells whether there is a next page
+    query = query.order_by(Asset.created_at.desc(), Asset.id.desc()).limit(limit + 1)
 
     result = await db.execute(query)
     assets = result.scalars().all()
 
-    count_query = select(func.count(Asset.id))
-    if project_id:
-        count_query = count_query.where(Asset.project_id == project_id)
-    if file_type:
-        count_query = count_query.where(Asset.file_type == file_type)
+    next_cursor = None
+    if len(assets) > limit:
+        assets = assets[:limit]
+        next_cursor = encode_cursor([assets[-1].created_at, assets[-1].id])
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    total = None
+    if include_total:
+        count_result = await db.execute(select(func.count(Asset.id)).where(*filters))
+        total = count_result.scalar() or 0
 
-    return AssetListResponse(items=assets, total=total)
+    return AssetListResponse(items=assets, total=total, next_cursor=next_cursor)
 
 
 @router.get("/{asset_id}", response_model=AssetResponse)
@@ -103,7 +160,18 @@ async def upload_asset(
             )
 
     try:
-        upload_result = await s3_service.upload_file(file, folder="assets")
+        upload_result = await s3_service.upload_file(
+            file,
+            folder="assets",
+            generate_thumbnail=False,
+            max_size=MAX_FILE_SIZE,
+            existing_key_for=lambda content_hash: AssetBlobService.find_key(db, content_hash),
+        )
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -123,12 +191,18 @@ async def upload_asset(
         thumbnail_url=upload_result.get("thumbnail_url"),
         width=upload_result.get("width"),
         height=upload_result.get("height"),
+        extra_data=upload_result.get("extra_data"),
+        content_hash=upload_result["content_hash"],
         alt_text=alt_text,
         caption=caption,
     )
 
+    await _share_stored_content(db, asset)
     db.add(asset)
     await db.flush()
+    JobService.enqueue_asset_processing(db, asset)
+    await db.flush()
+    await ContentService.refresh_projects(db, [project_id])
     await db.refresh(asset)
 
     return asset
@@ -164,38 +238,214 @@ async def upload_multiple_assets(
                 detail="Project not found",
             )
 
-    assets = []
-    for file in files:
-        try:
-            upload_result = await s3_service.upload_file(file, folder="assets")
-
-            asset = Asset(
-                project_id=project_id,
-                filename=upload_result["filename"],
-                original_filename=upload_result["original_filename"],
-                file_type=upload_result["file_type"],
-                mime_type=upload_result["mime_type"],
-                file_size=upload_result["file_size"],
-                s3_key=upload_result["s3_key"],
-                s3_bucket=upload_result["s3_bucket"],
-                cloudfront_url=upload_result["cloudfront_url"],
-                thumbnail_url=upload_result.get("thumbnail_url"),
-                width=upload_result.get("width"),
-                height=upload_result.get("height"),
+    # Uploads run concurrently but share one session, so lookups take turns
+    lookup_lock = asyncio.Lock()
+
+    async def existing_key_for(content_hash: str) -> Optional[str]:
+        async with lookup_lock:
+            return await AssetBlobService.find_key(db, content_hash)
+
+    upload_results = await asyncio.gather(
+        *(
+            s3_service.upload_file(
+                file,
+                folder="assets",
+                generate_thumbnail=False,
+                max_size=MAX_FILE_SIZE,
+                existing_key_for=existing_key_for,
             )
+            for file in files
+        ),
+        return_exceptions=True,
+    )
 
-            db.add(asset)
-            assets.append(asset)
-        except Exception as e:
+    assets = []
+    for upload_result in upload_results:
+        if isinstance(upload_result, Exception):
             continue
 
+        asset = Asset(
+            project_id=project_id,
+            filename=upload_result["filename"],
+            original_filename=upload_result["original_filename"],
+            file_type=upload_result["file_type"],
+            mime_type=upload_result["mime_type"],
+            file_size=upload_result["file_size"],
+            s3_key=upload_result["s3_key"],
+            s3_bucket=upload_result["s3_bucket"],
+            cloudfront_url=upload_result["cloudfront_url"],
+            thumbnail_url=upload_result.get("thumbnail_url"),
+            width=upload_result.get("width"),
+            height=upload_result.get("height"),
+            extra_data=upload_result.get("extra_data"),
+            content_hash=upload_result["content_hash"],
+        )
+
+        await _share_stored_content(db, asset)
+        db.add(asset)
+        assets.append(asset)
+
+    await db.flush()
+    for asset in assets:
+        JobService.enqueue_asset_processing(db, asset)
     await db.flush()
+    await ContentService.refresh_projects(db, [project_id])
     for asset in assets:
         await db.refresh(asset)
 
     return assets
 
 
+@router.post("/uploads", response_model=AssetUploadResponse, status_code=status.HTTP_201_CREATED)
+async def create_asset_upload(
+    db: DBSession,
+    admin: AdminUser,
+    upload_data: AssetUploadRequest,
+):
+    """Start a direct-to-S3 upload; finish it with ``POST /assets/uploads/complete``."""
+    if upload_data.content_type not in ALLOWED_MIME_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_MIME_TYPES)}",
+        )
+
+    if upload_data.file_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds maximum size of {MAX_FILE_SIZE // (1024 * 1024)}MB",
+        )
+
+    if upload_data.project_id:
+        project_result = await db.execute(
+            select(Project).where(Project.id == upload_data.project_id)
+        )
+        if not project_result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+
+    s3_key = s3_service._generate_key(upload_data.filename, folder="assets")
+
+    try:
+        presigned = await s3_service.create_presigned_upload(
+            s3_key, upload_data.content_type, upload_data.file_size
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start upload: {str(e)}",
+        )
+
+    upload_token = create_upload_token(
+        {
+            "key": s3_key,
+            "filename": upload_data.filename,
+            "mime_type": upload_data.content_type,
+            "upload_id": presigned["upload_id"],
+            "project_id": str(upload_data.project_id) if upload_data.project_id else None,
+        },
+        timedelta(seconds=settings.s3_presigned_url_expire_seconds),
+    )
+
+    return AssetUploadResponse(
+        upload_token=upload_token,
+        s3_key=s3_key,
+        method=presigned["method"],
+        url=presigned["url"],
+        headers=presigned["headers"],
+        part_size=presigned["part_size"],
+        parts=presigned["parts"],
+        expires_in=presigned["expires_in"],
+    )
+
+
+@router.post("/uploads/complete", response_model=AssetResponse, status_code=status.HTTP_201_CREATED)
+async def complete_asset_upload(
+    db: DBSession,
+    admin: AdminUser,
+    complete_data: AssetUploadComplete,
+):
+    payload = decode_token(complete_data.upload_token)
+    if not payload or payload.get("type") != "asset_upload":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired upload token",
+        )
+
+    if payload["upload_id"] and not complete_data.parts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Multipart uploads require the uploaded parts",
+        )
+
+    existing = await db.execute(select(Asset.id).where(Asset.s3_key == payload["key"]))
+    if existing.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload already completed",
+        )
+
+    project_id = UUID(payload["project_id"]) if payload["project_id"] else None
+    if project_id:
+        project_result = await db.execute(
+            select(Project).where(Project.id == project_id)
+        )
+        if not project_result.scalar_one_or_none():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+
+    try:
+        upload_result = await s3_service.finalize_presigned_upload(
+            payload["key"],
+            original_filename=payload["filename"],
+            mime_type=payload["mime_type"],
+            upload_id=payload["upload_id"],
+            parts=[p.model_dump() for p in complete_data.parts or []],
+            max_size=MAX_FILE_SIZE,
+            generate_thumbnail=False,
+        )
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to complete upload: {str(e)}",
+        )
+
+    asset = Asset(
+        project_id=project_id,
+        filename=upload_result["filename"],
+        original_filename=upload_result["original_filename"],
+        file_type=upload_result["file_type"],
+        mime_type=upload_result["mime_type"],
+        file_size=upload_result["file_size"],
+        s3_key=upload_result["s3_key"],
+        s3_bucket=upload_result["s3_bucket"],
+        cloudfront_url=upload_result["cloudfront_url"],
+        thumbnail_url=upload_result.get("thumbnail_url"),
+        width=upload_result.get("width"),
+        height=upload_result.get("height"),
+        extra_data=upload_result.get("extra_data"),
+        alt_text=complete_data.alt_text,
+        caption=complete_data.caption,
+    )
+
+    db.add(asset)
+    await db.flush()
+    JobService.enqueue_asset_processing(db, asset)
+    await db.flush()
+    await ContentService.refresh_projects(db, [project_id])
+    await db.refresh(asset)
+
+    return asset
+
+
 @router.put("/{asset_id}", response_model=AssetResponse)
 async def update_asset(
     db: DBSession,
@@ -222,11 +472,22 @@ async def update_asset(
                 detail="Project not found",
             )
 
+    previous_project_id = asset.project_id
     update_data = asset_data.model_dump(exclude_unset=True)
+    if "extra_data" in update_data:
+        # Merged over the stored dict; the rendered variants are managed here
+        # (srcset, S3 cleanup on delete) and never taken from the client
+        stored = asset.extra_data or {}
+        extra_data = {**stored, **(update_data["extra_data"] or {})}
+        extra_data.pop("variants", None)
+        if "variants" in stored:
+            extra_data["variants"] = stored["variants"]
+        update_data["extra_data"] = extra_data
     for field, value in update_data.items():
         setattr(asset, field, value)
 
     await db.flush()
+    await ContentService.refresh_projects(db, [previous_project_id, asset.project_id])
     await db.refresh(asset)
 
     return asset
@@ -248,6 +509,12 @@ async def delete_asset(db: DBSession, admin: AdminUser, asset_id: UUID):
         thumb_key = asset.thumbnail_url.split(f"/{s3_service.cloudfront_domain}/")[-1]
         if thumb_key != asset.s3_key:
             keys_to_delete.append(thumb_key)
+    for variant in (asset.extra_data or {}).get("variants", []):
+        keys_to_delete.append(variant["key"])
 
-    await s3_service.delete_files(keys_to_delete)
+    # Objects shared with other assets of the same content stay until the last one goes
+    if not asset.content_hash or await AssetBlobService.release(db, asset.content_hash):
+        await s3_service.delete_files(keys_to_delete)
     await db.delete(asset)
+    await db.flush()
+    await ContentService.refresh_projects(db, [asset.project_id])
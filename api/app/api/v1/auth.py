@@ -1,23 +1,67 @@
-from typing import Optional
+import math
+from typing import Iterable, Optional, Tuple
 
-from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi import APIRouter, Body, HTTPException, Query, Request, status
 
 from app.api.deps import CurrentUser, DBSession
+from app.config import settings
 from app.schemas.user import Token, UserLogin, UserResponse
 from app.services.auth_service import AuthService
+from app.utils.rate_limit import RateLimiter
+from app.utils.security import PasswordHasherBusy
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+login_rate_limiter = RateLimiter(
+    max_attempts=settings.login_rate_limit_attempts,
+    window_seconds=settings.login_rate_limit_window_seconds,
+)
+login_email_rate_limiter = RateLimiter(
+    max_attempts=settings.login_rate_limit_email_attempts,
+    window_seconds=settings.login_rate_limit_window_seconds,
+)
+
+
+def _forget_attempts(buckets: Iterable[Tuple[RateLimiter, str]]) -> None:
+    for limiter, key in buckets:
+        limiter.undo(key)
+
 
 @router.post("/login", response_model=Token)
-async def login(db: DBSession, credentials: UserLogin):
-    user = await AuthService.authenticate(db, credentials.email, credentials.password)
+async def login(db: DBSession, request: Request, credentials: UserLogin):
+    client_ip = request.client.host if request.client else "unknown"
+    buckets = [
+        (login_rate_limiter, f"ip:{client_ip}"),
+        (login_email_rate_limiter, f"email:{credentials.email.lower()}"),
+    ]
+    # Counted up front so concurrent guesses can't all slip past the check;
+    # only failed attempts stay counted
+    for i, (limiter, key) in enumerate(buckets):
+        retry_after = limiter.hit(key)
+        if retry_after:
+            _forget_attempts(buckets[:i])
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    try:
+        user = await AuthService.authenticate(db, credentials.email, credentials.password)
+    except PasswordHasherBusy:
+        _forget_attempts(buckets)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Login temporarily unavailable, try again shortly",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
+    _forget_attempts(buckets)
     return AuthService.create_tokens(str(user.id))
 
 
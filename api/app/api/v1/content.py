@@ -1,47 +1,91 @@
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
-from app.api.deps import DBSession
+from app.api.deps import AdminUser, DBSession
+from app.services.content_cache import ContentSnapshot
 from app.services.content_service import ContentService
+from app.services.export_service import ContentExportService
 
 router = APIRouter(prefix="/content", tags=["Public Content"])
 
+# Shared caches (CloudFront) and browsers may store the body but must
+# revalidate; an unchanged snapshot costs a 304 with no body.
+CACHE_CONTROL = "public, no-cache"
 
-@router.get("", response_model=Dict[str, Any])
-async def get_all_content(db: DBSession):
-    content = await ContentService.get_all_content(db)
-    return content
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match uses weak comparison
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
 
-@router.get("/tech", response_model=Dict[str, Any])
-async def get_tech_content(db: DBSession):
-    content = await ContentService.get_section_content(db, "tech")
-    if not content:
+
+def _snapshot_response(request: Request, snapshot: ContentSnapshot) -> Response:
+    headers = {"ETag": snapshot.etag, "Cache-Control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=snapshot.body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get("", response_class=Response)
+async def get_all_content(db: DBSession, request: Request):
+    snapshot = await ContentService.get_all_content_snapshot(db)
+    return _snapshot_response(request, snapshot)
+
+
+@router.get("/tech", response_class=Response)
+async def get_tech_content(db: DBSession, request: Request):
+    snapshot = await ContentService.get_section_snapshot(db, "tech")
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tech section not found",
         )
-    return content
+    return _snapshot_response(request, snapshot)
 
 
-@router.get("/dj", response_model=Dict[str, Any])
-async def get_dj_content(db: DBSession):
-    content = await ContentService.get_section_content(db, "dj")
-    if not content:
+@router.get("/dj", response_class=Response)
+async def get_dj_content(db: DBSession, request: Request):
+    snapshot = await ContentService.get_section_snapshot(db, "dj")
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="DJ section not found",
         )
-    return content
+    return _snapshot_response(request, snapshot)
+
+
+@router.post("/export", response_model=Dict[str, Any])
+async def export_content(db: DBSession, admin: AdminUser):
+    try:
+        return await ContentExportService.export(db)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to export content: {str(e)}",
+        )
 
 
-@router.get("/{section_slug}", response_model=Dict[str, Any])
-async def get_section_content(db: DBSession, section_slug: str):
-    content = await ContentService.get_section_content(db, section_slug)
-    if not content:
+@router.get("/{section_slug}", response_class=Response)
+async def get_section_content(db: DBSession, request: Request, section_slug: str):
+    snapshot = await ContentService.get_section_snapshot(db, section_slug)
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Section not found",
         )
-    return content
+    return _snapshot_response(request, snapshot)
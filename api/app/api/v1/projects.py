@@ -2,20 +2,28 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, HTTPException, Path, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import AdminUser, DBSession
 from app.models.project import Project
 from app.models.section import Section
 from app.schemas.project import (
+    ProjectBatchRequest,
+    ProjectBatchResponse,
     ProjectCreate,
     ProjectListResponse,
     ProjectReorderRequest,
     ProjectResponse,
     ProjectUpdate,
+    ProjectUpsert,
 )
+from app.services.content_service import ContentService
+from app.services.project_service import SLUG_CONFLICT, ProjectBatchError, ProjectService
+from app.utils.pagination import InvalidCursor, decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -26,35 +34,49 @@ async def list_projects(
     section_id: Optional[UUID] = None,
     published_only: bool = True,
     featured_only: bool = False,
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     limit: int = Query(50, ge=1, le=100),
+    include_total: bool = False,
 ):
-    query = select(Project).options(selectinload(Project.assets))
-
+    filters = []
     if section_id:
-        query = query.where(Project.section_id == section_id)
+        filters.append(Project.section_id == section_id)
     if published_only:
-        query = query.where(Project.is_published == True)
+        filters.append(Project.is_published == True)
     if featured_only:
-        query = query.where(Project.is_featured == True)
+        filters.append(Project.is_featured == True)
 
-    query = query.order_by(Project.display_order).offset(skip).limit(limit)
+    query = select(Project).options(selectinload(Project.assets)).where(*filters)
+
+    if cursor:
+        try:
+            display_order, last_id = decode_cursor(cursor, (int, UUID))
+        except InvalidCursor as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        query = query.where(
+            tuple_(Project.display_order, Project.id) > tuple_(display_order, last_id)
+        )
+
+    # One extra row tells whether there is a next page
+    query = query.order_by(Project.display_order, Project.id).limit(limit + 1)
 
     result = await db.execute(query)
     projects = result.scalars().all()
 
-    count_query = select(func.count(Project.id))
-    if section_id:
-        count_query = count_query.where(Project.section_id == section_id)
-    if published_only:
-        count_query = count_query.where(Project.is_published == True)
-    if featured_only:
-        count_query = count_query.where(Project.is_featured == True)
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        next_cursor = encode_cursor([projects[-1].display_order, projects[-1].id])
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    total = None
+    if include_total:
+        count_result = await db.execute(select(func.count(Project.id)).where(*filters))
+        total = count_result.scalar() or 0
 
-    return ProjectListResponse(items=projects, total=total)
+    return ProjectListResponse(items=projects, total=total, next_cursor=next_cursor)
 
 
 @router.get("/by-section/{section_slug}", response_model=ProjectListResponse)
@@ -91,6 +113,56 @@ async def list_projects_by_section_slug(
     return ProjectListResponse(items=projects, total=len(projects))
 
 
+@router.put("/by-section/{section_slug}/{project_slug}", response_model=ProjectResponse)
+async def upsert_project_by_slug(
+    db: DBSession,
+    admin: AdminUser,
+    response: Response,
+    section_slug: str,
+    project_data: ProjectUpsert,
+    project_slug: str = Path(..., min_length=1, max_length=100),
+    overwrite: bool = True,
+):
+    """Create or replace a project by section and project slug.
+
+    Idempotent: repeating the request leaves the same project. Responds 201
+    when the project was created. With ``overwrite=false`` an existing
+    project is returned unchanged.
+    """
+    section_result = await db.execute(
+        select(Section.id).where(Section.slug == section_slug)
+    )
+    section_id = section_result.scalar_one_or_none()
+
+    if not section_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Section not found",
+        )
+
+    project_id, created = await ProjectService.upsert(
+        db,
+        section_id,
+        project_slug,
+        project_data.model_dump(),
+        overwrite=overwrite,
+    )
+    result = await db.execute(
+        select(Project)
+        .options(selectinload(Project.assets))
+        .where(Project.id == project_id)
+        .execution_options(populate_existing=True)
+    )
+    project = result.scalar_one()
+    # An overwrite may have unpublished the project, so it always rebuilds
+    if (created and project.is_published) or (not created and overwrite):
+        await ContentService.refresh_sections(db, [section_id])
+
+    if created:
+        response.status_code = status.HTTP_201_CREATED
+    return project
+
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(db: DBSession, project_id: UUID):
     result = await db.execute(
@@ -120,21 +192,23 @@ async def create_project(db: DBSession, admin: AdminUser, project_data: ProjectC
             detail="Section not found",
         )
 
-    existing = await db.execute(
-        select(Project).where(
-            Project.section_id == project_data.section_id,
-            Project.slug == project_data.slug,
-        )
-    )
-    if existing.scalar_one_or_none():
+    project = Project(**project_data.model_dump())
+    db.add(project)
+    # The unique constraint, not a prior lookup, decides slug conflicts; no
+    # savepoint needed, the 409 aborts the request and get_db rolls back
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        if not ProjectService.is_slug_conflict(e):
+            raise
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Project with this slug already exists in this section",
+            detail=SLUG_CONFLICT,
         )
 
-    project = Project(**project_data.model_dump())
-    db.add(project)
-    await db.flush()
+    # Drafts are not in the published documents
+    if project.is_published:
+        await ContentService.refresh_sections(db, [project.section_id])
     await db.refresh(project)
 
     return project
@@ -170,26 +244,23 @@ async def update_project(
                 detail="Section not found",
             )
 
-    if project_data.slug:
-        section_id = project_data.section_id or project.section_id
-        existing = await db.execute(
-            select(Project).where(
-                Project.section_id == section_id,
-                Project.slug == project_data.slug,
-                Project.id != project_id,
-            )
-        )
-        if existing.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Project with this slug already exists in this section",
-            )
-
+    previous_section_id = project.section_id
+    was_published = project.is_published
     update_data = project_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(project, field, value)
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        if not ProjectService.is_slug_conflict(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=SLUG_CONFLICT,
+        )
 
-    await db.flush()
+    if was_published or project.is_published:
+        await ContentService.refresh_sections(db, [previous_section_id, project.section_id])
     await db.refresh(project)
 
     return project
@@ -215,6 +286,7 @@ async def publish_project(db: DBSession, admin: AdminUser, project_id: UUID):
         project.published_at = datetime.now(timezone.utc)
 
     await db.flush()
+    await ContentService.refresh_sections(db, [project.section_id])
     await db.refresh(project)
 
     return project
@@ -235,9 +307,12 @@ async def unpublish_project(db: DBSession, admin: AdminUser, project_id: UUID):
             detail="Project not found",
         )
 
+    was_published = project.is_published
     project.is_published = False
 
     await db.flush()
+    if was_published:
+        await ContentService.refresh_sections(db, [project.section_id])
     await db.refresh(project)
 
     return project
@@ -249,11 +324,58 @@ async def reorder_projects(
     admin: AdminUser,
     reorder_data: ProjectReorderRequest,
 ):
-    for index, project_id in enumerate(reorder_data.project_ids):
-        result = await db.execute(select(Project).where(Project.id == project_id))
-        project = result.scalar_one_or_none()
-        if project:
-            project.display_order = index
+    project_ids = reorder_data.project_ids
+    if len(set(project_ids)) != len(project_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate project ids",
+        )
+
+    result = await db.execute(
+        select(Project.id, Project.section_id, Project.is_published)
+        .where(Project.id.in_(project_ids))
+    )
+    rows = result.all()
+
+    if len(rows) != len(project_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    section_ids = {row.section_id for row in rows}
+    if len(section_ids) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="All projects must belong to the same section",
+        )
+
+    await ProjectService.reorder(db, project_ids)
+    if any(row.is_published for row in rows):
+        await ContentService.refresh_sections(db, section_ids)
+
+
+@router.post("/batch", response_model=ProjectBatchResponse)
+async def batch_projects(
+    db: DBSession,
+    admin: AdminUser,
+    batch: ProjectBatchRequest,
+):
+    """Apply create/update/publish/unpublish/delete operations atomically.
+
+    If any operation is invalid nothing is written and the response is a 400
+    whose detail lists every operation with its error (or null).
+    """
+    try:
+        results, section_ids = await ProjectService.apply_batch(db, batch.operations)
+    except ProjectBatchError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=jsonable_encoder(e.results),
+        )
+
+    await ContentService.refresh_sections(db, section_ids)
+    return ProjectBatchResponse(results=results)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -268,3 +390,6 @@ async def delete_project(db: DBSession, admin: AdminUser, project_id: UUID):
         )
 
     await db.delete(project)
+    await db.flush()
+    if project.is_published:
+        await ContentService.refresh_sections(db, [project.section_id])
@@ -12,6 +12,7 @@ from app.schemas.section import (
     SectionResponse,
     SectionUpdate,
 )
+from app.services.content_service import ContentService
 
 router = APIRouter(prefix="/sections", tags=["Sections"])
 
@@ -60,6 +61,7 @@ async def create_section(db: DBSession, admin: AdminUser, section_data: SectionC
     section = Section(**section_data.model_dump())
     db.add(section)
     await db.flush()
+    await ContentService.refresh_sections(db, [section.id])
     await db.refresh(section)
 
     return section
@@ -99,6 +101,7 @@ async def update_section(
         setattr(section, field, value)
 
     await db.flush()
+    await ContentService.refresh_sections(db, [section.id])
     await db.refresh(section)
 
     return section
@@ -116,3 +119,5 @@ async def delete_section(db: DBSession, admin: AdminUser, section_id: UUID):
         )
 
     await db.delete(section)
+    await db.flush()
+    await ContentService.refresh_sections(db, [section_id])
@@ -1,6 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,6 +18,18 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: int = 30
+    db_connect_timeout_seconds: int = 10
+
+    # Database pool inside Lambda: connections survive warm invocations of a
+    # container; idle ones are dropped before Neon closes them server-side.
+    # Set db_lambda_pool_size to 0 to fall back to one connection per request.
+    db_lambda_pool_size: int = 1
+    db_lambda_max_overflow: int = 2
+    db_lambda_idle_timeout_seconds: int = 240
+    db_lambda_pool_recycle_seconds: int = 1800
 
     # Security
     secret_key: str
@@ -25,12 +37,71 @@ class Settings(BaseSettings):
     refresh_token_expire_days: int = 7
     algorithm: str = "HS256"
 
+    # Password hashing runs on a bounded thread pool off the event loop
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 16
+
+    # Failed logins allowed per client IP within the window, and per email
+    # across all IPs (higher, so one client can't lock the account out)
+    login_rate_limit_attempts: int = 10
+    login_rate_limit_email_attempts: int = 100
+    login_rate_limit_window_seconds: int = 300
+
+    # Verified-principal cache for authenticated requests (0 disables it)
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_size: int = 256
+
     # AWS S3 (optional — Lambda uses IAM role, local uses explicit keys)
     aws_access_key_id: str = ""
     aws_secret_access_key: str = ""
     aws_region: str = "us-east-1"
     s3_bucket: str = "utworld-assets"
     cloudfront_domain: str = "d1q048o59d0tgk.cloudfront.net"
+    s3_max_concurrency: int = 10
+    s3_multipart_part_size: int = 8 * 1024 * 1024
+    s3_presigned_url_expire_seconds: int = 3600
+    # Images above this size are stored but not decoded for thumbnails
+    image_processing_max_bytes: int = 25 * 1024 * 1024
+
+    # Responsive image variants rendered per upload; formats the installed
+    # Pillow can't encode (e.g. avif without a plugin) are skipped
+    image_variant_widths: List[int] = [320, 640, 1024, 1600]
+    image_variant_formats: List[str] = ["avif", "webp"]
+    image_variant_quality: int = 80
+
+    # Image decoding/resizing runs on a bounded process pool (threads on Lambda)
+    image_process_workers: int = 2
+    image_process_max_pending: int = 8
+    image_process_timeout_seconds: float = 30.0
+
+    # Background asset processing (thumbnails, variants, durations)
+    asset_job_max_attempts: int = 3
+    asset_job_retry_delay_seconds: int = 30
+    asset_job_lease_seconds: int = 300
+    asset_worker_poll_seconds: float = 2.0
+
+    # Public content cache (0 disables it)
+    content_cache_ttl_seconds: int = 60
+
+    # Per-request SQL statement counts and timings (Server-Timing + logs)
+    query_stats_enabled: bool = True
+    query_stats_slow_query_ms: float = 100.0
+    # The same statement this many times in one request is flagged as N+1
+    query_stats_n_plus_one_threshold: int = 5
+
+    # Prometheus /metrics (servers) and EMF logs (Lambda). /metrics requires
+    # the token as a bearer token; without one it is served only in debug
+    metrics_enabled: bool = True
+    metrics_namespace: str = "UTWorld/API"
+    metrics_token: Optional[str] = None
+
+    # /health/ready: probe results are cached so checks can't add load
+    health_cache_seconds: float = 5.0
+    health_probe_timeout_seconds: float = 2.0
+    health_db_degraded_ms: float = 250.0
+    health_s3_degraded_ms: float = 1000.0
+    # Share of pool connections checked out at which the pool is degraded
+    health_pool_degraded_ratio: float = 0.8
 
     # CORS
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:5173"]
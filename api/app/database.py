@@ -1,57 +1,206 @@
 import os
 import ssl
-from typing import AsyncGenerator
-
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from app.config import settings
+from app.utils import metrics
+from app.utils.query_stats import instrument_engine
 
 
 class Base(DeclarativeBase):
     pass
 
 
-# Remove query params that asyncpg doesn't understand
-db_url = settings.database_url.split("?")[0]
-
-# Create SSL context for Neon
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
-
-# Use NullPool for Lambda (no persistent connections), regular pool for server
+# Lambda containers keep a small pool across warm invocations; servers use a
+# regular pool
 is_lambda = bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
 
-engine_kwargs = dict(
-    echo=settings.debug,
-    future=True,
-    connect_args={"ssl": ssl_context},
+# The engine (asyncpg dialect + SSL context) is built on first use rather than
+# at import, so cold starts of routes that never hit the database don't pay
+# for it. `engine` and `async_session_maker` remain importable names.
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+
+DB_POOL_CHECKOUT_SECONDS = metrics.histogram(
+    "db_pool_checkout_seconds",
+    "Time to get a pooled connection, including waiting for one and pre-ping",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = metrics.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after db_pool_timeout_seconds",
 )
 
-if is_lambda:
-    # Lambda: no connection pool — each invocation opens/closes its own connection
-    engine_kwargs["poolclass"] = NullPool
-else:
-    # Server: use connection pool
-    engine_kwargs["pool_pre_ping"] = True
-    engine_kwargs["pool_size"] = 5
-    engine_kwargs["max_overflow"] = 10
-
-engine = create_async_engine(db_url, **engine_kwargs)
-
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that times checkouts.
+
+    SQLAlchemy has no event that fires before a checkout starts waiting, so
+    the pool's ``connect`` entry point is timed instead.
+    """
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started_at)
+
+
+def _pool_connections() -> List[Tuple[Dict[str, Any], float]]:
+    pool = _engine.pool if _engine is not None else None
+    if not isinstance(pool, QueuePool):
+        return []
+    return [
+        ({"state": "checked_out"}, pool.checkedout()),
+        ({"state": "idle"}, pool.checkedin()),
+        # Connections opened beyond pool_size
+        ({"state": "overflow"}, max(pool.overflow(), 0)),
+    ]
+
+
+metrics.gauge(
+    "db_pool_connections",
+    "Pooled database connections by state",
+    _pool_connections,
+    ["state"],
 )
 
 
+def _pool_kwargs(lambda_mode: bool) -> Dict[str, Any]:
+    if lambda_mode and settings.db_lambda_pool_size <= 0:
+        return {"poolclass": NullPool}
+
+    if lambda_mode:
+        # Mangum reuses the container's event loop between invocations, so
+        # asyncpg connections stay usable while the container is warm.
+        return {
+            "poolclass": InstrumentedQueuePool,
+            "pool_pre_ping": True,
+            "pool_size": settings.db_lambda_pool_size,
+            "max_overflow": settings.db_lambda_max_overflow,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+            "pool_recycle": settings.db_lambda_pool_recycle_seconds,
+        }
+
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_pre_ping": True,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+    }
+
+
+def pool_capacity() -> Optional[int]:
+    """Most connections the engine's pool may hold open, or None without pooling."""
+    kwargs = _pool_kwargs(is_lambda)
+    if kwargs["poolclass"] is NullPool:
+        return None
+    return kwargs["pool_size"] + kwargs["max_overflow"]
+
+
+def discard_idle_connections(engine: AsyncEngine, idle_timeout: float) -> None:
+    """Drop pooled connections that sat unused for longer than ``idle_timeout``.
+
+    A Lambda container can be frozen for minutes between invocations, during
+    which the server or a NAT may silently close its sockets; pinging such a
+    connection can stall until TCP gives up. Wall-clock time is used because
+    the monotonic clock doesn't advance while the container is frozen.
+    """
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.time()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _check_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.pop("checked_in_at", None)
+        if checked_in_at is not None and time.time() - checked_in_at > idle_timeout:
+            # The pool invalidates this connection and retries with a fresh one
+            raise DisconnectionError("Pooled connection idle for too long")
+
+
+def _create_engine() -> AsyncEngine:
+    # Remove query params that asyncpg doesn't understand
+    db_url = settings.database_url.split("?")[0]
+
+    # Create SSL context for Neon
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+
+    engine = create_async_engine(
+        db_url,
+        echo=settings.debug,
+        future=True,
+        connect_args={
+            "ssl": ssl_context,
+            "timeout": settings.db_connect_timeout_seconds,
+        },
+        **_pool_kwargs(is_lambda),
+    )
+
+    if is_lambda and settings.db_lambda_pool_size > 0:
+        discard_idle_connections(engine, settings.db_lambda_idle_timeout_seconds)
+
+    if settings.query_stats_enabled:
+        instrument_engine(engine)
+
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        _engine = _create_engine()
+    return _engine
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    global _session_maker
+    if _session_maker is None:
+        _session_maker = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _session_maker
+
+
+def __getattr__(name: str):
+    if name == "engine":
+        return get_engine()
+    if name == "async_session_maker":
+        return get_session_maker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def dispose_engine() -> None:
+    if _engine is not None:
+        await _engine.dispose()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         try:
             yield session
             await session.commit()
@@ -63,5 +212,5 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
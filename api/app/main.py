@@ -1,18 +1,28 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from typing import Optional
+
+from fastapi import FastAPI, Header, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api.v1.router import api_router
 from app.config import settings
-from app.database import engine
+from app.database import dispose_engine, get_engine
+from app.services import image_service
+from app.services.health_service import health_service
+from app.utils import metrics
+from app.utils.query_stats import QueryStatsMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Long-running servers warm up eagerly; Lambda runs with lifespan="off"
+    # and builds the engine and clients lazily on first use instead.
+    get_engine()
     yield
-    await engine.dispose()
+    await dispose_engine()
+    image_service.shutdown_executor()
 
 
 app = FastAPI(
@@ -32,6 +42,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.query_stats_enabled:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.metrics_enabled:
+    # Added last so it wraps (and times) everything else
+    app.add_middleware(metrics.MetricsMiddleware)
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -52,6 +69,43 @@ async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """Dependency probes for load balancers.
+
+    ``degraded`` (slow database, busy pool, S3 unreachable) still answers
+    200; a failed database or exhausted pool answers 503.
+    """
+    report = await health_service.readiness()
+    return JSONResponse(
+        status_code=(
+            status.HTTP_503_SERVICE_UNAVAILABLE
+            if report["status"] == "failed"
+            else status.HTTP_200_OK
+        ),
+        content=report,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint(authorization: Optional[str] = Header(None)):
+    # Lambda exports through EMF, and its HttpApi catch-all would make the
+    # route public; elsewhere an open endpoint is only for local debugging
+    if (
+        not settings.metrics_enabled
+        or metrics.registry.emf_enabled
+        or not (settings.metrics_token or settings.debug)
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if settings.metrics_token and authorization != f"Bearer {settings.metrics_token}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return Response(
+        metrics.registry.render_prometheus(),
+        media_type=metrics.PROMETHEUS_CONTENT_TYPE,
+    )
+
+
 @app.get("/")
 async def root():
     return {
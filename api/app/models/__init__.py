@@ -2,5 +2,8 @@ from app.models.user import User
 from app.models.section import Section
 from app.models.project import Project
 from app.models.asset import Asset
+from app.models.asset_blob import AssetBlob
+from app.models.asset_job import AssetJob
+from app.models.published_section import PublishedSection
 
-__all__ = ["User", "Section", "Project", "Asset"]
+__all__ = ["User", "Section", "Project", "Asset", "AssetBlob", "AssetJob", "PublishedSection"]
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,6 +14,10 @@ if TYPE_CHECKING:
 
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        # Keyset pagination of the media library, newest first
+        Index("ix_assets_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -31,6 +35,8 @@ class Asset(Base):
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
     file_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
     s3_key: Mapped[str] = mapped_column(String(500), nullable=False)
+    # SHA-256 of the bytes; assets with the same hash share one AssetBlob
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)
     s3_bucket: Mapped[str] = mapped_column(String(100), nullable=False)
     cloudfront_url: Mapped[str] = mapped_column(String(500), nullable=False)
     thumbnail_url: Mapped[Optional[str]] = mapped_column(String(500))
@@ -40,6 +46,9 @@ class Asset(Base):
     alt_text: Mapped[Optional[str]] = mapped_column(String(255))
     caption: Mapped[Optional[str]] = mapped_column(Text)
     extra_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)
+    # pending / processing / ready / failed; NULL for assets uploaded before
+    # background processing existed
+    processing_status: Mapped[Optional[str]] = mapped_column(String(20))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
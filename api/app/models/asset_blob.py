@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class AssetBlob(Base):
+    """A stored S3 object shared by every asset with the same content.
+
+    ``ref_count`` counts the assets pointing at it; the object and its
+    derived images are deleted when the last reference goes.
+    """
+
+    __tablename__ = "asset_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    s3_key: Mapped[str] = mapped_column(String(500), nullable=False)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AssetBlob {self.content_hash[:12]} x{self.ref_count}>"
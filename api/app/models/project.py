@@ -2,7 +2,18 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +28,13 @@ class Project(Base):
     __tablename__ = "projects"
     __table_args__ = (
         UniqueConstraint("section_id", "slug", name="uq_project_section_slug"),
+        # Public content reads only published projects, in display order
+        Index(
+            "ix_projects_published_order",
+            "section_id",
+            "display_order",
+            postgresql_where=text("is_published"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PublishedSection(Base):
+    """Denormalized public payload of an active section.
+
+    Rebuilt by ``ContentService.refresh_sections`` whenever an admin write
+    touches the section, so public reads are a single primary-key fetch.
+    """
+
+    __tablename__ = "published_sections"
+
+    slug: Mapped[str] = mapped_column(String(50), primary_key=True)
+    section_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("sections.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+    display_order: Mapped[int] = mapped_column(Integer, default=0)
+    document: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PublishedSection {self.slug}>"
@@ -23,6 +23,9 @@ from app.schemas.asset import (
     AssetUpdate,
     AssetResponse,
     AssetListResponse,
+    AssetUploadRequest,
+    AssetUploadResponse,
+    AssetUploadComplete,
 )
 
 __all__ = [
@@ -44,4 +47,7 @@ __all__ = [
     "AssetUpdate",
     "AssetResponse",
     "AssetListResponse",
+    "AssetUploadRequest",
+    "AssetUploadResponse",
+    "AssetUploadComplete",
 ]
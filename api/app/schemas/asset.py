@@ -22,6 +22,41 @@ class AssetUpdate(BaseModel):
     extra_data: Optional[Dict[str, Any]] = None
 
 
+class AssetUploadRequest(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str = Field(..., max_length=100)
+    file_size: int = Field(..., ge=0)
+    project_id: Optional[UUID] = None
+
+
+class AssetUploadPart(BaseModel):
+    part_number: int
+    url: str
+
+
+class AssetUploadResponse(BaseModel):
+    upload_token: str
+    s3_key: str
+    method: str
+    url: Optional[str] = None
+    headers: Dict[str, str] = {}
+    part_size: Optional[int] = None
+    parts: List[AssetUploadPart] = []
+    expires_in: int
+
+
+class AssetUploadedPart(BaseModel):
+    part_number: int = Field(..., ge=1)
+    etag: str
+
+
+class AssetUploadComplete(BaseModel):
+    upload_token: str
+    parts: Optional[List[AssetUploadedPart]] = None
+    alt_text: Optional[str] = Field(None, max_length=255)
+    caption: Optional[str] = None
+
+
 class AssetResponse(BaseModel):
     id: UUID
     project_id: Optional[UUID] = None
@@ -40,6 +75,7 @@ class AssetResponse(BaseModel):
     alt_text: Optional[str] = None
     caption: Optional[str] = None
     extra_data: Optional[Dict[str, Any]] = None
+    processing_status: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -49,4 +85,7 @@ class AssetResponse(BaseModel):
 
 class AssetListResponse(BaseModel):
     items: List[AssetResponse]
-    total: int
+    # Only counted when requested with include_total
+    total: Optional[int] = None
+    # Pass as ``cursor`` to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -1,12 +1,11 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 
-class ProjectBase(BaseModel):
-    slug: str = Field(..., min_length=1, max_length=100)
+class ProjectFields(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     subtitle: Optional[str] = Field(None, max_length=300)
     description: Optional[str] = None
@@ -19,10 +18,18 @@ class ProjectBase(BaseModel):
     extra_data: Optional[Dict[str, Any]] = None
 
 
+class ProjectBase(ProjectFields):
+    slug: str = Field(..., min_length=1, max_length=100)
+
+
 class ProjectCreate(ProjectBase):
     section_id: UUID
 
 
+class ProjectUpsert(ProjectFields):
+    """Full project body for the by-section upsert; the slug comes from the path."""
+
+
 class ProjectUpdate(BaseModel):
     slug: Optional[str] = Field(None, min_length=1, max_length=100)
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -51,8 +58,49 @@ class ProjectResponse(ProjectBase):
 
 class ProjectListResponse(BaseModel):
     items: List[ProjectResponse]
-    total: int
+    # Only counted when requested with include_total
+    total: Optional[int] = None
+    # Pass as ``cursor`` to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
 
 
 class ProjectReorderRequest(BaseModel):
     project_ids: List[UUID] = Field(..., description="Ordered list of project IDs")
+
+
+class ProjectBatchCreate(BaseModel):
+    op: Literal["create"]
+    data: ProjectCreate
+
+
+class ProjectBatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: UUID
+    data: ProjectUpdate
+
+
+class ProjectBatchAction(BaseModel):
+    op: Literal["publish", "unpublish", "delete"]
+    id: UUID
+
+
+ProjectBatchOperation = Annotated[
+    Union[ProjectBatchCreate, ProjectBatchUpdate, ProjectBatchAction],
+    Field(discriminator="op"),
+]
+
+
+class ProjectBatchRequest(BaseModel):
+    operations: List[ProjectBatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class ProjectBatchResult(BaseModel):
+    index: int
+    op: str
+    id: Optional[UUID] = None
+    # None when the operation was valid
+    error: Optional[str] = None
+
+
+class ProjectBatchResponse(BaseModel):
+    results: List[ProjectBatchResult]
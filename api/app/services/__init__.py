@@ -1,5 +1,19 @@
 from app.services.s3_service import S3Service
 from app.services.auth_service import AuthService
 from app.services.content_service import ContentService
+from app.services.export_service import ContentExportService
+from app.services.job_service import JobService
+from app.services.asset_blob_service import AssetBlobService
+from app.services.project_service import ProjectService
+from app.services.health_service import HealthService
 
-__all__ = ["S3Service", "AuthService", "ContentService"]
+__all__ = [
+    "S3Service",
+    "AuthService",
+    "ContentService",
+    "ContentExportService",
+    "JobService",
+    "AssetBlobService",
+    "ProjectService",
+    "HealthService",
+]
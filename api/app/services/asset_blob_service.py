@@ -0,0 +1,72 @@
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.asset import Asset
+from app.models.asset_blob import AssetBlob
+
+
+class AssetBlobService:
+    @staticmethod
+    async def find_key(db: AsyncSession, content_hash: str) -> Optional[str]:
+        """The key already holding this content, locked until the transaction ends.
+
+        The caller skips its own S3 write on a hit, so a concurrent ``release``
+        must not drop the last reference (and delete the objects) before
+        ``acquire`` adds ours. FOR NO KEY UPDATE rather than FOR SHARE: two
+        uploads of the same bytes would otherwise both hold share locks and
+        deadlock on ``acquire``'s update.
+        """
+        result = await db.execute(
+            select(AssetBlob.s3_key)
+            .where(AssetBlob.content_hash == content_hash)
+            .with_for_update(key_share=True)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def acquire(db: AsyncSession, content_hash: str, s3_key: str) -> str:
+        """Add a reference to the content, registering ``s3_key`` if it's new.
+
+        Returns the key that holds the content, which differs from
+        ``s3_key`` when a concurrent upload of the same bytes got there first.
+        """
+        stmt = insert(AssetBlob).values(content_hash=content_hash, s3_key=s3_key, ref_count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AssetBlob.content_hash],
+            set_={"ref_count": AssetBlob.ref_count + 1},
+        ).returning(AssetBlob.s3_key)
+        result = await db.execute(stmt)
+        return result.scalar_one()
+
+    @staticmethod
+    async def release(db: AsyncSession, content_hash: str) -> bool:
+        """Drop a reference; True when no asset uses the stored objects anymore."""
+        result = await db.execute(
+            update(AssetBlob)
+            .where(AssetBlob.content_hash == content_hash)
+            .values(ref_count=AssetBlob.ref_count - 1)
+            .returning(AssetBlob.ref_count)
+        )
+        remaining = result.scalar_one_or_none()
+        if remaining is None:
+            return True
+        if remaining <= 0:
+            await db.execute(delete(AssetBlob).where(AssetBlob.content_hash == content_hash))
+            return True
+        return False
+
+    @staticmethod
+    async def find_processed_asset(db: AsyncSession, content_hash: str) -> Optional[Asset]:
+        """An asset with this content whose thumbnails/metadata are ready to reuse."""
+        result = await db.execute(
+            select(Asset)
+            .where(Asset.content_hash == content_hash, Asset.processing_status == "ready")
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+
+asset_blob_service = AssetBlobService()
@@ -1,27 +1,40 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.user import User
 from app.schemas.user import Token, UserCreate
+from app.utils.cache import TTLCache
 from app.utils.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 
+# Column snapshots of active users keyed by token `sub`, so authenticated
+# requests can skip the user lookup. Entries are dropped when `is_active` or
+# `role` change in this process; the TTL bounds staleness elsewhere.
+principal_cache = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    name="principal",
+)
+
+_PRINCIPAL_FIELDS = ("id", "email", "name", "role", "is_active", "last_login", "created_at")
+
 
 class AuthService:
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
         user = User(
             email=user_data.email,
-            password_hash=hash_password(user_data.password),
+            password_hash=await hash_password_async(user_data.password),
             name=user_data.name,
         )
         db.add(user)
@@ -39,6 +52,30 @@ class AuthService:
         result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_principal(db: AsyncSession, user_id: UUID) -> Optional[User]:
+        """Like ``get_user_by_id`` but served from the principal cache when possible.
+
+        Cache hits return a transient ``User`` built from the snapshot; it is
+        meant for authorization checks and reads, not for persisting changes.
+        """
+        cache_key = str(user_id)
+        snapshot: Optional[Dict[str, Any]] = principal_cache.get(cache_key)
+        if snapshot is not None:
+            return User(**snapshot)
+
+        user = await AuthService.get_user_by_id(db, user_id)
+        if user and user.is_active:
+            principal_cache.set(
+                cache_key,
+                {field: getattr(user, field) for field in _PRINCIPAL_FIELDS},
+            )
+        return user
+
+    @staticmethod
+    def invalidate_principal(user_id: UUID) -> None:
+        principal_cache.pop(str(user_id))
+
     @staticmethod
     async def authenticate(
         db: AsyncSession,
@@ -48,7 +85,7 @@ class AuthService:
         user = await AuthService.get_user_by_email(db, email)
         if not user:
             return None
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             return None
         if not user.is_active:
             return None
@@ -87,3 +124,16 @@ class AuthService:
 
 
 auth_service = AuthService()
+
+
+@event.listens_for(User.is_active, "set")
+@event.listens_for(User.role, "set")
+def _invalidate_on_access_change(target: User, value, oldvalue, initiator) -> None:
+    # Transient instances (including cache hits) have no identity to evict
+    if inspect(target).has_identity and value != oldvalue:
+        AuthService.invalidate_principal(target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_on_delete(mapper, connection, target: User) -> None:
+    AuthService.invalidate_principal(target.id)
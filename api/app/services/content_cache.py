@@ -0,0 +1,96 @@
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.utils.cache import CACHE_LOOKUPS
+
+# Session.info flag set by mutating routes; the version is bumped again once
+# the surrounding transaction commits so that snapshots built from data read
+# before the commit can never outlive it.
+_PENDING_INVALIDATION = "content_cache_pending"
+
+
+class ContentSnapshot:
+    """A content payload together with its pre-encoded JSON body and ETag."""
+
+    __slots__ = ("data", "body", "etag")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        # Same encoding as FastAPI's JSONResponse, done once per snapshot
+        self.body = json.dumps(
+            data,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+
+class ContentCache:
+    """In-process cache of public content snapshots keyed by a global version.
+
+    Every admin write bumps ``version``; entries stored under an older version
+    are treated as misses. The TTL bounds staleness across processes (e.g.
+    several warm Lambda containers) that never see each other's bumps.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._entries: Dict[str, Tuple[int, float, ContentSnapshot]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[ContentSnapshot]:
+        snapshot = self._lookup(key)
+        CACHE_LOOKUPS.inc(cache="content", result="miss" if snapshot is None else "hit")
+        return snapshot
+
+    def _lookup(self, key: str) -> Optional[ContentSnapshot]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        version, stored_at, value = entry
+        if version != self.version or time.monotonic() - stored_at > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def set(self, key: str, value: ContentSnapshot, version: int) -> None:
+        # A write landed while the snapshot was being built — don't keep it.
+        if not self.enabled or version != self.version:
+            return
+        self._entries[key] = (version, time.monotonic(), value)
+
+    def bump(self) -> None:
+        self.version += 1
+        self._entries.clear()
+
+    def invalidate(self, db: AsyncSession) -> None:
+        self.bump()
+        db.sync_session.info[_PENDING_INVALIDATION] = True
+
+
+content_cache = ContentCache(ttl_seconds=settings.content_cache_ttl_seconds)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(session: Session) -> None:
+    if session.info.pop(_PENDING_INVALIDATION, False):
+        content_cache.bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATION, None)
@@ -1,67 +1,158 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.asset import Asset
 from app.models.project import Project
+from app.models.published_section import PublishedSection
 from app.models.section import Section
+from app.services.content_cache import ContentSnapshot, content_cache
+from app.services.image_service import srcset_sources
 
 
 class ContentService:
     @staticmethod
     async def get_all_content(db: AsyncSession) -> Dict[str, Any]:
+        snapshot = await ContentService.get_all_content_snapshot(db)
+        return snapshot.data
+
+    @staticmethod
+    async def get_section_content(
+        db: AsyncSession,
+        section_slug: str,
+    ) -> Optional[Dict[str, Any]]:
+        snapshot = await ContentService.get_section_snapshot(db, section_slug)
+        return snapshot.data if snapshot else None
+
+    @staticmethod
+    async def get_all_content_snapshot(db: AsyncSession) -> ContentSnapshot:
+        version = content_cache.version
+        snapshot = content_cache.get("all")
+        if snapshot is None:
+            snapshot = ContentSnapshot(await ContentService._load_all_content(db))
+            content_cache.set("all", snapshot, version)
+        return snapshot
+
+    @staticmethod
+    async def get_section_snapshot(
+        db: AsyncSession,
+        section_slug: str,
+    ) -> Optional[ContentSnapshot]:
+        cache_key = f"section:{section_slug}"
+        version = content_cache.version
+        snapshot = content_cache.get(cache_key)
+        if snapshot is None:
+            content = await ContentService._load_section_content(db, section_slug)
+            if content is None:
+                return None
+            snapshot = ContentSnapshot(content)
+            content_cache.set(cache_key, snapshot, version)
+        return snapshot
+
+    @staticmethod
+    async def _load_all_content(db: AsyncSession) -> Dict[str, Any]:
         result = await db.execute(
-            select(Section)
-            .where(Section.is_active == True)
-            .options(selectinload(Section.projects).selectinload(Project.assets))
-            .order_by(Section.display_order)
+            select(PublishedSection).order_by(PublishedSection.display_order)
         )
-        sections = result.scalars().all()
-
-        content = {}
-        for section in sections:
-            published_projects = [
-                p for p in section.projects
-                if p.is_published
-            ]
-            published_projects.sort(key=lambda x: x.display_order)
-
-            content[section.slug] = {
-                "id": str(section.id),
-                "title": section.title,
-                "description": section.description,
-                "projects": [
-                    ContentService._project_to_dict(p)
-                    for p in published_projects
-                ],
-            }
-
-        return content
+        return {
+            row.slug: {k: v for k, v in row.document.items() if k != "slug"}
+            for row in result.scalars().all()
+        }
 
     @staticmethod
-    async def get_section_content(
+    async def _load_section_content(
         db: AsyncSession,
         section_slug: str,
     ) -> Optional[Dict[str, Any]]:
+        row = await db.get(PublishedSection, section_slug, populate_existing=True)
+        return row.document if row else None
+
+    @staticmethod
+    async def refresh_sections(
+        db: AsyncSession,
+        section_ids: Iterable[Optional[UUID]],
+    ) -> None:
+        """Rebuild the published documents of the given sections.
+
+        Must run after the triggering write has been flushed. Also
+        invalidates the in-process content cache.
+        """
+        # A fixed order, so transactions rebuilding several sections lock
+        # them in the same order and can't deadlock
+        for section_id in sorted({s for s in section_ids if s}):
+            await ContentService._rebuild_section(db, section_id)
+        content_cache.invalidate(db)
+
+    @staticmethod
+    async def refresh_projects(
+        db: AsyncSession,
+        project_ids: Iterable[Optional[UUID]],
+    ) -> None:
+        """Rebuild the sections of the given projects that are published.
+
+        For writes that leave publish state alone (e.g. assets); drafts are
+        not in any document, so changes to them skip the rebuild.
+        """
+        project_ids = {p for p in project_ids if p}
+        section_ids = set()
+        if project_ids:
+            result = await db.execute(
+                select(Project.section_id).where(
+                    Project.id.in_(project_ids),
+                    Project.is_published.is_(True),
+                )
+            )
+            section_ids = set(result.scalars().all())
+        await ContentService.refresh_sections(db, section_ids)
+
+    @staticmethod
+    async def refresh_all(db: AsyncSession) -> None:
+        result = await db.execute(select(Section.id))
+        await ContentService.refresh_sections(db, result.scalars().all())
+
+    @staticmethod
+    async def _rebuild_section(db: AsyncSession, section_id: UUID) -> None:
+        # Plain columns: loading the entity would eager-load every project
+        # through the Section.projects selectin relationship
         result = await db.execute(
-            select(Section)
-            .where(Section.slug == section_slug, Section.is_active == True)
-            .options(selectinload(Section.projects).selectinload(Project.assets))
+            select(
+                Section.id,
+                Section.slug,
+                Section.title,
+                Section.description,
+                Section.display_order,
+                Section.is_active,
+            )
+            .where(Section.id == section_id)
+            # Serializes rebuilds of a section: a concurrent one waits for our
+            # commit, then reads the projects we wrote instead of racing our
+            # DELETE/INSERT on the slug primary key. NO KEY so project inserts
+            # (FK key-share locks) don't block on it.
+            .with_for_update(key_share=True)
         )
-        section = result.scalar_one_or_none()
+        section = result.one_or_none()
 
-        if not section:
-            return None
+        await db.execute(
+            delete(PublishedSection).where(PublishedSection.section_id == section_id)
+        )
+        if not section or not section.is_active:
+            return
 
-        published_projects = [
-            p for p in section.projects
-            if p.is_published
-        ]
-        published_projects.sort(key=lambda x: x.display_order)
+        # Drafts (and their assets) are never loaded; backed by the partial
+        # index ix_projects_published_order
+        result = await db.execute(
+            select(Project)
+            .where(Project.section_id == section_id, Project.is_published.is_(True))
+            .order_by(Project.display_order)
+            .options(selectinload(Project.assets))
+            .execution_options(populate_existing=True)
+        )
+        published_projects = result.scalars().all()
 
-        return {
+        document = {
             "id": str(section.id),
             "slug": section.slug,
             "title": section.title,
@@ -72,6 +163,15 @@ class ContentService:
             ],
         }
 
+        await db.execute(
+            insert(PublishedSection).values(
+                slug=section.slug,
+                section_id=section.id,
+                display_order=section.display_order,
+                document=document,
+            )
+        )
+
     @staticmethod
     def _project_to_dict(project: Project) -> Dict[str, Any]:
         return {
@@ -105,6 +205,8 @@ class ContentService:
             "duration": asset.duration,
             "alt_text": asset.alt_text,
             "caption": asset.caption,
+            # <picture> sources, best format first: [{"type", "srcset"}]
+            "sources": srcset_sources((asset.extra_data or {}).get("variants")),
         }
 
 
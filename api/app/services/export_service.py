@@ -0,0 +1,72 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.content_cache import ContentSnapshot
+from app.services.content_service import ContentService
+from app.services.s3_service import S3Service, s3_service
+
+EXPORT_PREFIX = "content"
+MANIFEST_KEY = f"{EXPORT_PREFIX}/manifest.json"
+
+# Versioned documents never change once written; only the manifest moves.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MANIFEST_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+
+class ContentExportService:
+    """Publishes the public content API responses as static JSON on S3.
+
+    Each document is written under a content-addressed key, so unchanged
+    sections keep their URL and CloudFront copy across exports. The
+    manifest is the only mutable object and points at the current set.
+    """
+
+    @staticmethod
+    def _document_key(name: str, snapshot: ContentSnapshot) -> str:
+        digest = snapshot.etag.strip('"')
+        return f"{EXPORT_PREFIX}/{digest}/{name}.json"
+
+    @staticmethod
+    async def export(
+        db: AsyncSession,
+        storage: Optional[S3Service] = None,
+    ) -> Dict[str, Any]:
+        storage = storage or s3_service
+
+        # Straight from published_sections: the per-process content cache may
+        # trail writes made on other instances, and exports are immutable
+        snapshots = {"all": ContentSnapshot(await ContentService._load_all_content(db))}
+        for slug in snapshots["all"].data:
+            content = await ContentService._load_section_content(db, slug)
+            if content is not None:
+                snapshots[slug] = ContentSnapshot(content)
+
+        urls = {}
+        for name, snapshot in snapshots.items():
+            urls[name] = await storage.upload_bytes(
+                ContentExportService._document_key(name, snapshot),
+                snapshot.body,
+                content_type="application/json",
+                cache_control=IMMUTABLE_CACHE_CONTROL,
+            )
+
+        manifest = {
+            "version": snapshots["all"].etag.strip('"'),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "content": urls.pop("all"),
+            "sections": urls,
+        }
+        await storage.upload_bytes(
+            MANIFEST_KEY,
+            json.dumps(manifest, separators=(",", ":")).encode("utf-8"),
+            content_type="application/json",
+            cache_control=MANIFEST_CACHE_CONTROL,
+        )
+
+        return manifest
+
+
+content_export_service = ContentExportService()
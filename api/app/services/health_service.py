@@ -0,0 +1,128 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app import database
+from app.config import settings
+from app.services.s3_service import s3_service
+
+# A failure of these makes the instance unready; S3 only backs uploads, so
+# losing it degrades the instance instead
+CRITICAL_CHECKS = ("database", "pool")
+
+
+def _result(status: str, started_at: Optional[float] = None, **details: Any) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"status": status}
+    if started_at is not None:
+        result["latency_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+    result.update(details)
+    return result
+
+
+class HealthService:
+    """Readiness probes for the database, its pool and S3.
+
+    Results are cached for ``health_cache_seconds`` and concurrent callers
+    share one in-flight run, so however often the load balancer asks, each
+    process makes at most one database round trip and one S3 request per
+    interval.
+    """
+
+    def __init__(self):
+        self._report: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return (
+            self._report is not None
+            and time.monotonic() - self._checked_at < settings.health_cache_seconds
+        )
+
+    async def readiness(self) -> Dict[str, Any]:
+        if self._fresh():
+            return self._report
+
+        async with self._lock:
+            if not self._fresh():
+                self._report = await self._run_checks()
+                self._checked_at = time.monotonic()
+        return self._report
+
+    def clear(self) -> None:
+        self._report = None
+
+    async def _run_checks(self) -> Dict[str, Any]:
+        # Pool occupancy first, before the database probe takes a connection
+        pool = self._check_pool()
+        database_check, s3_check = await asyncio.gather(
+            self._timed(self._database_round_trip, settings.health_db_degraded_ms),
+            self._timed(self._s3_round_trip, settings.health_s3_degraded_ms),
+        )
+        checks = {"database": database_check, "pool": pool, "s3": s3_check}
+
+        if any(checks[name]["status"] == "failed" for name in CRITICAL_CHECKS):
+            status = "failed"
+        elif any(check["status"] != "ok" for check in checks.values()):
+            status = "degraded"
+        else:
+            status = "ok"
+
+        return {
+            "status": status,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": checks,
+        }
+
+    @staticmethod
+    async def _timed(probe: Callable[[], Awaitable[None]], degraded_ms: float) -> Dict[str, Any]:
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe(), settings.health_probe_timeout_seconds)
+        except asyncio.TimeoutError:
+            return _result("failed", started_at, error="Timed out")
+        except Exception as e:
+            return _result("failed", started_at, error=type(e).__name__)
+
+        result = _result("ok", started_at)
+        if result["latency_ms"] > degraded_ms:
+            result["status"] = "degraded"
+        return result
+
+    @staticmethod
+    async def _database_round_trip() -> None:
+        async with database.get_session_maker()() as session:
+            await session.execute(text("SELECT 1"))
+
+    @staticmethod
+    async def _s3_round_trip() -> None:
+        await s3_service._call("head_bucket", Bucket=s3_service.bucket)
+
+    @staticmethod
+    def _check_pool() -> Dict[str, Any]:
+        pool = database.get_engine().pool
+        capacity = database.pool_capacity()
+        if not isinstance(pool, QueuePool) or not capacity:
+            return _result("ok", pooled=False)
+
+        in_use = pool.checkedout()
+        saturation = in_use / capacity
+        if saturation >= 1:
+            status = "failed"
+        elif saturation >= settings.health_pool_degraded_ratio:
+            status = "degraded"
+        else:
+            status = "ok"
+        return _result(
+            status,
+            in_use=in_use,
+            capacity=capacity,
+            saturation=round(saturation, 2),
+        )
+
+
+health_service = HealthService()
@@ -0,0 +1,225 @@
+import asyncio
+import io
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.config import settings
+
+THUMBNAIL_SIZE = 400
+
+# Served in this order of preference inside <picture>
+VARIANT_FORMATS = {
+    "avif": ("AVIF", "image/avif"),
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+
+
+def supported_formats(formats: Sequence[str]) -> List[str]:
+    """The requested variant formats this Pillow build can encode."""
+    from PIL import Image
+
+    Image.init()
+    return [
+        fmt for fmt in VARIANT_FORMATS
+        if fmt in formats and VARIANT_FORMATS[fmt][0] in Image.SAVE
+    ]
+
+
+def variant_widths(original_width: int, widths: Sequence[int]) -> List[int]:
+    """Configured widths below the original, topped by the original width.
+
+    The top variant is the native resolution (capped at the largest
+    configured width) so HiDPI screens get every available pixel; never
+    upscales.
+    """
+    configured = [w for w in widths if w > 0]
+    if not configured:
+        return [original_width]
+    top = min(original_width, max(configured))
+    return sorted({w for w in configured if w < top} | {top})
+
+
+def derived_key(original_key: str, suffix: str, ext: str) -> str:
+    directory, _, filename = original_key.rpartition("/")
+    stem = filename.rsplit(".", 1)[0]
+    return f"{directory}/{stem}-{suffix}.{ext}" if directory else f"{stem}-{suffix}.{ext}"
+
+
+def process_image(
+    content: bytes,
+    widths: Sequence[int],
+    formats: Sequence[str],
+    quality: int = 80,
+) -> Dict[str, Any]:
+    """Decode an image and render its thumbnail and responsive variants.
+
+    Pure CPU work with no I/O so it can run in a worker process. Returns the
+    original dimensions, an optional thumbnail and a list of encoded variants.
+    """
+    from PIL import Image, ImageOps
+
+    image = Image.open(io.BytesIO(content))
+    animated = getattr(image, "is_animated", False)
+    # Phone photos are often stored sideways with an EXIF orientation; turn
+    # them upright once so the thumbnail, variants and dimensions agree
+    base = ImageOps.exif_transpose(image)
+    width, height = base.size
+
+    thumbnail: Optional[Dict[str, Any]] = None
+    if max(width, height) > THUMBNAIL_SIZE:
+        thumb = base.copy()
+        thumb.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS)
+
+        thumb_buffer = io.BytesIO()
+        thumb_format = "JPEG" if base.mode == "RGB" else "PNG"
+        thumb.save(thumb_buffer, format=thumb_format, quality=85)
+        thumbnail = {
+            "format": thumb_format.lower(),
+            "mime_type": f"image/{thumb_format.lower()}",
+            "body": thumb_buffer.getvalue(),
+        }
+
+    variants: List[Dict[str, Any]] = []
+    if animated:
+        # Resizing would drop every frame but the first
+        return {"width": width, "height": height, "thumbnail": thumbnail, "variants": variants}
+
+    if base.mode not in ("RGB", "RGBA"):
+        base = base.convert("RGBA" if "transparency" in base.info or base.mode in ("LA", "PA") else "RGB")
+
+    for variant_width in variant_widths(base.width, widths):
+        if variant_width == base.width:
+            resized = base
+        else:
+            variant_height = max(1, round(base.height * variant_width / base.width))
+            resized = base.resize((variant_width, variant_height), Image.Resampling.LANCZOS)
+
+        for fmt in supported_formats(formats):
+            pil_format, mime_type = VARIANT_FORMATS[fmt]
+            frame = resized.convert("RGB") if pil_format == "JPEG" else resized
+            buffer = io.BytesIO()
+            frame.save(buffer, format=pil_format, quality=quality)
+            variants.append({
+                "width": resized.width,
+                "height": resized.height,
+                "format": fmt,
+                "mime_type": mime_type,
+                "body": buffer.getvalue(),
+            })
+
+    return {"width": width, "height": height, "thumbnail": thumbnail, "variants": variants}
+
+
+class ImageProcessingBusy(Exception):
+    """Raised when too many images are already queued for processing."""
+
+
+_executor: Optional[Executor] = None
+_pending = 0
+
+
+def _get_executor() -> Executor:
+    """Worker processes so Pillow's CPU work runs outside this interpreter's GIL.
+
+    Lambda has no /dev/shm for multiprocessing primitives, so it (and
+    ``image_process_workers <= 0``) falls back to a thread pool.
+    """
+    global _executor
+    if _executor is None:
+        workers = settings.image_process_workers
+        if workers > 0 and not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                # Forking a process that runs an event loop and thread pools is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(workers, 1),
+                thread_name_prefix="image",
+            )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def process_image_async(
+    content: bytes,
+    widths: Sequence[int],
+    formats: Sequence[str],
+    quality: int = 80,
+) -> Dict[str, Any]:
+    """``process_image`` on the bounded worker pool.
+
+    Raises ``ImageProcessingBusy`` instead of queueing beyond
+    ``image_process_max_pending`` and ``asyncio.TimeoutError`` after
+    ``image_process_timeout_seconds``.
+    """
+    global _pending
+    if _pending >= settings.image_process_max_pending:
+        raise ImageProcessingBusy("Too many images being processed")
+
+    loop = asyncio.get_running_loop()
+    try:
+        future = _get_executor().submit(
+            process_image, content, list(widths), list(formats), quality
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM on a huge image); start a fresh pool next time
+        shutdown_executor()
+        raise
+
+    # The slot is held until the worker is done with the image, not until we
+    # stop waiting: a timed-out image keeps its worker busy
+    _pending += 1
+    future.add_done_callback(lambda _: _release_slot(loop))
+
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), settings.image_process_timeout_seconds
+        )
+    except BrokenProcessPool:
+        shutdown_executor()
+        raise
+
+
+def _release_slot(loop: asyncio.AbstractEventLoop) -> None:
+    """Done callback of a worker future; runs on the executor's thread."""
+
+    def release() -> None:
+        global _pending
+        _pending -= 1
+
+    try:
+        loop.call_soon_threadsafe(release)
+    except RuntimeError:
+        # The loop is closed; nobody is left to count
+        pass
+
+
+def srcset_sources(variants: Optional[List[Dict[str, Any]]]) -> List[Dict[str, str]]:
+    """Group stored variants into ``<source type srcset>`` entries, best format first."""
+    if not variants:
+        return []
+
+    sources = []
+    for fmt, (_, mime_type) in VARIANT_FORMATS.items():
+        entries = sorted(
+            (v for v in variants if v.get("format") == fmt),
+            key=lambda v: v["width"],
+        )
+        if entries:
+            sources.append({
+                "type": mime_type,
+                "srcset": ", ".join(f"{v['url']} {v['width']}w" for v in entries),
+            })
+    return sources
@@ -0,0 +1,148 @@
+import asyncio
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.asset import Asset
+from app.models.asset_job import AssetJob
+from app.services import media_probe
+from app.services.content_service import ContentService
+from app.services.s3_service import s3_service
+
+# File types with metadata worth extracting after upload
+PROCESSABLE_FILE_TYPES = {"image", "audio", "video"}
+
+
+class JobService:
+    @staticmethod
+    def enqueue_asset_processing(db: AsyncSession, asset: Asset) -> Optional[AssetJob]:
+        """Queue post-upload processing for a flushed asset.
+
+        Assets with nothing to extract (documents) or that reuse an already
+        processed copy of the same content are marked ready directly.
+        """
+        if asset.processing_status == "ready" or asset.file_type not in PROCESSABLE_FILE_TYPES:
+            asset.processing_status = "ready"
+            return None
+
+        asset.processing_status = "pending"
+        job = AssetJob(asset_id=asset.id, status="pending")
+        db.add(job)
+        return job
+
+    @staticmethod
+    async def claim_next(db: AsyncSession) -> Optional[AssetJob]:
+        """Claim one due job and commit the claim.
+
+        ``SKIP LOCKED`` lets concurrent workers pass over rows another worker
+        is claiming instead of blocking on them. Running jobs whose lease
+        expired (a crashed worker) are claimed again.
+        """
+        now = datetime.now(timezone.utc)
+        lease_expired = now - timedelta(seconds=settings.asset_job_lease_seconds)
+
+        result = await db.execute(
+            select(AssetJob)
+            .where(
+                or_(
+                    and_(AssetJob.status == "pending", AssetJob.run_after <= now),
+                    and_(AssetJob.status == "running", AssetJob.locked_at < lease_expired),
+                )
+            )
+            .order_by(AssetJob.run_after)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is not None:
+            job.status = "running"
+            job.attempts += 1
+            job.locked_at = now
+        await db.commit()
+        return job
+
+    @staticmethod
+    async def process_next(db: AsyncSession) -> bool:
+        """Claim and run one job. Returns False when no job was due."""
+        job = await JobService.claim_next(db)
+        if job is None:
+            return False
+
+        asset = await db.get(Asset, job.asset_id, populate_existing=True)
+        if asset is None:
+            job.status = "done"
+            await db.commit()
+            return True
+
+        asset.processing_status = "processing"
+        await db.commit()
+
+        try:
+            updates = await JobService._process_asset(asset)
+        except Exception as e:
+            job.last_error = f"{type(e).__name__}: {e}"[:1000]
+            job.locked_at = None
+            if job.attempts >= settings.asset_job_max_attempts:
+                job.status = "failed"
+                asset.processing_status = "failed"
+            else:
+                job.status = "pending"
+                job.run_after = datetime.now(timezone.utc) + timedelta(
+                    seconds=settings.asset_job_retry_delay_seconds * 2 ** (job.attempts - 1)
+                )
+                asset.processing_status = "pending"
+            await db.commit()
+            return True
+
+        for field, value in updates.items():
+            setattr(asset, field, value)
+        asset.processing_status = "ready"
+        job.status = "done"
+        job.last_error = None
+        job.locked_at = None
+
+        await db.flush()
+        await ContentService.refresh_projects(db, [asset.project_id])
+        await db.commit()
+        return True
+
+    @staticmethod
+    async def run_pending(db: AsyncSession, max_jobs: int = 100) -> int:
+        processed = 0
+        while processed < max_jobs and await JobService.process_next(db):
+            processed += 1
+        return processed
+
+    @staticmethod
+    async def _process_asset(asset: Asset) -> Dict[str, Any]:
+        """Extract metadata for an asset; returns the column updates."""
+        if asset.file_type == "image":
+            if asset.file_size > settings.image_processing_max_bytes:
+                return {}
+            content = await s3_service._get_object_bytes(asset.s3_key)
+            image = await s3_service._process_image(content, asset.s3_key)
+            return {
+                "width": image["width"],
+                "height": image["height"],
+                "thumbnail_url": image["thumbnail_url"],
+                "extra_data": {**(asset.extra_data or {}), "variants": image["variants"]},
+            }
+
+        if not media_probe.supports(asset.mime_type):
+            return {}
+
+        # Audio/video: only container headers are read, but the moov box of a
+        # non-faststart MP4 sits at the end, so spool the object to disk
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as fileobj:
+            await s3_service.download_to_file(asset.s3_key, fileobj)
+            duration = await asyncio.to_thread(
+                media_probe.probe_duration, fileobj, asset.mime_type
+            )
+        return {"duration": round(duration)} if duration is not None else {}
+
+
+job_service = JobService()
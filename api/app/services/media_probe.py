@@ -0,0 +1,107 @@
+import struct
+import wave
+from typing import BinaryIO, Optional, Tuple
+
+
+def supports(mime_type: str) -> bool:
+    return mime_type in _PROBES
+
+
+def probe_duration(fileobj: BinaryIO, mime_type: str) -> Optional[float]:
+    """Duration in seconds of an audio/video file, or None if unknown.
+
+    Reads only container headers (and the tail of Ogg files); formats without
+    a cheap header-level duration (MP3, WebM) return None.
+    """
+    probe = _PROBES.get(mime_type)
+    if probe is None:
+        return None
+    try:
+        fileobj.seek(0)
+        return probe(fileobj)
+    except (EOFError, OSError, ValueError, struct.error, wave.Error):
+        return None
+
+
+def _wav_duration(fileobj: BinaryIO) -> Optional[float]:
+    with wave.open(fileobj, "rb") as wav:
+        rate = wav.getframerate()
+        return wav.getnframes() / rate if rate else None
+
+
+def _find_box(fileobj: BinaryIO, start: int, end: int, box_type: bytes) -> Optional[Tuple[int, int]]:
+    """Payload start and end offsets of the first ``box_type`` box in [start, end)."""
+    position = start
+    while position + 8 <= end:
+        fileobj.seek(position)
+        size, current_type = struct.unpack(">I4s", fileobj.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", fileobj.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - position
+        if size < header:
+            return None
+        if current_type == box_type:
+            return position + header, position + size
+        position += size
+    return None
+
+
+def _mp4_duration(fileobj: BinaryIO) -> Optional[float]:
+    # ISO base media (MP4/MOV/M4A): moov/mvhd holds timescale and duration
+    fileobj.seek(0, 2)
+    file_end = fileobj.tell()
+
+    moov = _find_box(fileobj, 0, file_end, b"moov")
+    if moov is None:
+        return None
+    mvhd = _find_box(fileobj, moov[0], moov[1], b"mvhd")
+    if mvhd is None:
+        return None
+
+    fileobj.seek(mvhd[0])
+    version = fileobj.read(4)[0]
+    if version == 1:
+        fileobj.seek(16, 1)  # creation + modification time
+        timescale, duration = struct.unpack(">IQ", fileobj.read(12))
+    else:
+        fileobj.seek(8, 1)
+        timescale, duration = struct.unpack(">II", fileobj.read(8))
+    return duration / timescale if timescale else None
+
+
+def _ogg_duration(fileobj: BinaryIO) -> Optional[float]:
+    # The identification header gives the sample rate and the last page's
+    # granule position the total sample count
+    head = fileobj.read(4096)
+    if head.find(b"\x01vorbis") >= 0:
+        offset = head.find(b"\x01vorbis") + 7
+        rate = struct.unpack("<I", head[offset + 5:offset + 9])[0]
+        pre_skip = 0
+    elif head.find(b"OpusHead") >= 0:
+        offset = head.find(b"OpusHead") + 8
+        # Opus granules always count 48 kHz samples
+        rate = 48000
+        pre_skip = struct.unpack("<H", head[offset + 2:offset + 4])[0]
+    else:
+        return None
+
+    fileobj.seek(0, 2)
+    size = fileobj.tell()
+    fileobj.seek(max(0, size - 65536))
+    tail = fileobj.read()
+    last_page = tail.rfind(b"OggS")
+    if last_page < 0 or not rate:
+        return None
+    granule = struct.unpack("<q", tail[last_page + 6:last_page + 14])[0]
+    return max(granule - pre_skip, 0) / rate
+
+
+_PROBES = {
+    "audio/wav": _wav_duration,
+    "audio/ogg": _ogg_duration,
+    "video/mp4": _mp4_duration,
+    "video/quicktime": _mp4_duration,
+}
@@ -0,0 +1,296 @@
+import uuid
+from typing import Any, Dict, List, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Integer,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.section import Section
+from app.schemas.project import ProjectBatchOperation
+
+SLUG_CONFLICT = "Project with this slug already exists in this section"
+
+
+class ProjectBatchError(Exception):
+    """A batch was rejected; ``results`` carries the per-item errors."""
+
+    def __init__(self, results: List[Dict[str, Any]]):
+        super().__init__("Batch rejected")
+        self.results = results
+
+
+class ProjectService:
+    @staticmethod
+    def is_slug_conflict(error: IntegrityError) -> bool:
+        """Whether a failed write violated the per-section slug constraint."""
+        return "uq_project_section_slug" in str(error.orig)
+
+    @staticmethod
+    async def upsert(
+        db: AsyncSession,
+        section_id: UUID,
+        slug: str,
+        data: Dict[str, Any],
+        overwrite: bool = True,
+    ) -> Tuple[UUID, bool]:
+        """Insert or replace the project keyed by ``(section_id, slug)``.
+
+        A single ``INSERT ... ON CONFLICT ON CONSTRAINT uq_project_section_slug``
+        so concurrent callers cannot race between a lookup and the write. With
+        ``overwrite=False`` an existing project is left untouched. Returns the
+        project id and whether it was created.
+        """
+        row = {"id": uuid.uuid4(), "section_id": section_id, "slug": slug, **data}
+        if data.get("is_published"):
+            row["published_at"] = func.now()
+
+        stmt = pg_insert(Project).values(**row)
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_project_section_slug",
+                set_={
+                    **{field: stmt.excluded[field] for field in data},
+                    # Keep the first publication time across re-publishes
+                    "published_at": func.coalesce(
+                        Project.published_at, stmt.excluded.published_at
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(constraint="uq_project_section_slug")
+
+        # xmax is 0 only for a row version created by this INSERT
+        result = await db.execute(
+            stmt.returning(Project.id, literal_column("xmax = 0").label("inserted"))
+        )
+        returned = result.first()
+        if returned is not None:
+            return returned.id, returned.inserted
+
+        existing = await db.execute(
+            select(Project.id).where(Project.section_id == section_id, Project.slug == slug)
+        )
+        return existing.scalar_one(), False
+
+    @staticmethod
+    async def reorder(db: AsyncSession, project_ids: Sequence[UUID]) -> None:
+        """Set ``display_order`` to each project's position in one statement.
+
+        Issues ``UPDATE projects ... FROM (VALUES (id, position), ...)``.
+        Loaded Project instances are not synchronized; the content rebuild
+        re-reads them.
+        """
+        if not project_ids:
+            return
+
+        new_order = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("display_order", Integer),
+            name="new_order",
+        ).data([(project_id, index) for index, project_id in enumerate(project_ids)])
+
+        await db.execute(
+            update(Project)
+            .where(Project.id == new_order.c.id)
+            .values(display_order=new_order.c.display_order)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def apply_batch(
+        db: AsyncSession,
+        operations: Sequence[ProjectBatchOperation],
+    ) -> Tuple[List[Dict[str, Any]], Set[UUID]]:
+        """Validate and apply a batch of project operations all-or-nothing.
+
+        Section ids, project ids and slugs are checked with one query each;
+        writes are grouped per operation type (deletes, then updates as an
+        executemany, then one multi-row ``INSERT ... ON CONFLICT DO NOTHING``,
+        then publish/unpublish) inside a savepoint. Returns the per-item
+        results and the ids of the sections whose published content changed.
+        Raises ``ProjectBatchError`` without writing anything if any item is
+        invalid.
+        """
+        results = [
+            {"index": index, "op": op.op, "id": getattr(op, "id", None), "error": None}
+            for index, op in enumerate(operations)
+        ]
+
+        def fail(index: int, message: str) -> None:
+            if results[index]["error"] is None:
+                results[index]["error"] = message
+
+        seen: Set[UUID] = set()
+        for index, op in enumerate(operations):
+            if op.op == "create":
+                continue
+            if op.id in seen:
+                fail(index, "Project appears in more than one operation")
+            seen.add(op.id)
+
+        existing = {}
+        if seen:
+            rows = await db.execute(
+                select(Project.id, Project.section_id, Project.slug, Project.is_published)
+                .where(Project.id.in_(seen))
+            )
+            existing = {row.id: row for row in rows}
+
+        requested_sections = {
+            op.data.section_id
+            for op in operations
+            if op.op in ("create", "update") and op.data.section_id
+        }
+        known_sections: Set[UUID] = set()
+        if requested_sections:
+            rows = await db.execute(
+                select(Section.id).where(Section.id.in_(requested_sections))
+            )
+            known_sections = set(rows.scalars())
+
+        deleted = {op.id for op in operations if op.op == "delete"}
+
+        # (section_id, slug) each create/update will occupy once applied
+        claims: Dict[int, Tuple[UUID, str]] = {}
+        for index, op in enumerate(operations):
+            current = existing.get(getattr(op, "id", None))
+            if op.op != "create" and current is None:
+                fail(index, "Project not found")
+                continue
+            if op.op not in ("create", "update"):
+                continue
+            if op.data.section_id and op.data.section_id not in known_sections:
+                fail(index, "Section not found")
+                continue
+            if op.op == "create":
+                claims[index] = (op.data.section_id, op.data.slug)
+            else:
+                claim = (
+                    op.data.section_id or current.section_id,
+                    op.data.slug or current.slug,
+                )
+                if claim != (current.section_id, current.slug):
+                    claims[index] = claim
+
+        if claims:
+            rows = await db.execute(
+                select(Project.id, Project.section_id, Project.slug).where(
+                    tuple_(Project.section_id, Project.slug).in_(set(claims.values()))
+                )
+            )
+            owners = {(row.section_id, row.slug): row.id for row in rows}
+            claimed = set()
+            for index, claim in claims.items():
+                owner = owners.get(claim)
+                # Deletes run first, so their slugs are free for this batch
+                if claim in claimed or (owner is not None and owner not in deleted):
+                    fail(index, SLUG_CONFLICT)
+                claimed.add(claim)
+
+        if any(result["error"] for result in results):
+            raise ProjectBatchError(results)
+
+        section_ids: Set[UUID] = set()
+        async with db.begin_nested():
+            if deleted:
+                await db.execute(
+                    delete(Project)
+                    .where(Project.id.in_(deleted))
+                    .execution_options(synchronize_session=False)
+                )
+                # Drafts are not in any published document
+                section_ids.update(
+                    existing[project_id].section_id
+                    for project_id in deleted
+                    if existing[project_id].is_published
+                )
+
+            updates = []
+            for op in operations:
+                if op.op != "update":
+                    continue
+                fields = op.data.model_dump(exclude_unset=True)
+                if fields:
+                    updates.append({"id": op.id, **fields})
+                    if existing[op.id].is_published or fields.get("is_published"):
+                        section_ids.add(existing[op.id].section_id)
+                        section_ids.add(fields.get("section_id"))
+            if updates:
+                # ORM bulk UPDATE by primary key: one executemany per key set
+                await db.execute(update(Project), updates)
+                newly_published = {row["id"] for row in updates if row.get("is_published")}
+                if newly_published:
+                    await db.execute(
+                        update(Project)
+                        .where(Project.id.in_(newly_published), Project.published_at.is_(None))
+                        .values(published_at=func.now())
+                        .execution_options(synchronize_session=False)
+                    )
+
+            creates = [
+                (index, {
+                    "id": uuid.uuid4(),
+                    **op.data.model_dump(),
+                    "published_at": func.now() if op.data.is_published else None,
+                })
+                for index, op in enumerate(operations)
+                if op.op == "create"
+            ]
+            if creates:
+                result = await db.execute(
+                    pg_insert(Project)
+                    .values([row for _, row in creates])
+                    .on_conflict_do_nothing(constraint="uq_project_section_slug")
+                    .returning(Project.id)
+                )
+                inserted = set(result.scalars())
+                for index, row in creates:
+                    if row["id"] in inserted:
+                        results[index]["id"] = row["id"]
+                        if row["is_published"]:
+                            section_ids.add(row["section_id"])
+                    else:
+                        # Lost a race with a concurrent insert of the same slug
+                        fail(index, SLUG_CONFLICT)
+                if len(inserted) != len(creates):
+                    raise ProjectBatchError(results)
+
+            for op_name, published in (("publish", True), ("unpublish", False)):
+                project_ids = {op.id for op in operations if op.op == op_name}
+                if not project_ids:
+                    continue
+                changes: Dict[str, Any] = {"is_published": published}
+                if published:
+                    changes["published_at"] = func.coalesce(Project.published_at, func.now())
+                await db.execute(
+                    update(Project)
+                    .where(Project.id.in_(project_ids))
+                    .values(**changes)
+                    .execution_options(synchronize_session=False)
+                )
+                section_ids.update(
+                    existing[project_id].section_id
+                    for project_id in project_ids
+                    if published or existing[project_id].is_published
+                )
+
+        section_ids.discard(None)
+        return results, section_ids
+
+
+project_service = ProjectService()
@@ -1,29 +1,107 @@
-import io
+import asyncio
+import hashlib
+import math
+import shutil
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
-import boto3
-from botocore.exceptions import ClientError
 from fastapi import UploadFile
-from PIL import Image
 
 from app.config import settings
+from app.services import image_service
+from app.utils import metrics
+
+# S3 rejects multipart parts smaller than 5 MiB (except the last one)
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+MAX_MULTIPART_PARTS = 10_000
+
+T = TypeVar("T")
+
+S3_REQUEST_SECONDS = metrics.histogram(
+    "s3_request_duration_seconds",
+    "S3 API call latency, including time queued for an S3 worker thread",
+    ["operation"],
+)
+S3_TRANSFERRED_BYTES = metrics.counter(
+    "s3_transferred_bytes_total",
+    "Object bytes sent to (out) or read from (in) S3",
+    ["operation", "direction"],
+    unit="Bytes",
+)
+
+
+class FileTooLargeError(ValueError):
+    """Raised while streaming an upload once it exceeds the allowed size."""
 
 
 class S3Service:
     def __init__(self):
-        # Use explicit credentials if provided (local dev), otherwise use
-        # default credential chain (Lambda IAM role, EC2 instance profile, etc.)
-        client_kwargs = {"region_name": settings.aws_region}
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
-            client_kwargs["aws_access_key_id"] = settings.aws_access_key_id
-            client_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-
-        self.s3_client = boto3.client("s3", **client_kwargs)
+        self._s3_client: Optional[Any] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.bucket = settings.s3_bucket
         self.cloudfront_domain = settings.cloudfront_domain
 
+    @property
+    def s3_client(self) -> Any:
+        # boto3 is imported and the client built on first use; most cold
+        # starts (public content reads) never touch S3.
+        if self._s3_client is None:
+            import boto3
+            from botocore.config import Config
+
+            # Use explicit credentials if provided (local dev), otherwise use
+            # default credential chain (Lambda IAM role, EC2 instance profile, etc.)
+            client_kwargs = {
+                "region_name": settings.aws_region,
+                "config": Config(max_pool_connections=settings.s3_max_concurrency),
+            }
+            if settings.aws_access_key_id and settings.aws_secret_access_key:
+                client_kwargs["aws_access_key_id"] = settings.aws_access_key_id
+                client_kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
+
+            self._s3_client = boto3.client("s3", **client_kwargs)
+        return self._s3_client
+
+    @s3_client.setter
+    def s3_client(self, client: Any) -> None:
+        self._s3_client = client
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking S3 work on the S3 thread pool.
+
+        boto3 clients are thread-safe; the pool is sized to the client's
+        HTTP connection pool so workers never wait on each other for sockets.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.s3_max_concurrency,
+                thread_name_prefix="s3",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _call(self, operation: str, **kwargs: Any) -> Any:
+        method = getattr(self.s3_client, operation)
+        started_at = time.perf_counter()
+        try:
+            response = await self._run(partial(method, **kwargs))
+        finally:
+            S3_REQUEST_SECONDS.observe(time.perf_counter() - started_at, operation=operation)
+
+        body = kwargs.get("Body")
+        if isinstance(body, (bytes, bytearray)):
+            S3_TRANSFERRED_BYTES.inc(len(body), operation=operation, direction="out")
+        return response
+
+    @staticmethod
+    def _record_download(started_at: float, size: int) -> None:
+        S3_REQUEST_SECONDS.observe(time.perf_counter() - started_at, operation="get_object")
+        S3_TRANSFERRED_BYTES.inc(size, operation="get_object", direction="in")
+
     def _generate_key(self, original_filename: str, folder: str = "uploads") -> str:
         ext = original_filename.rsplit(".", 1)[-1].lower() if "." in original_filename else ""
         unique_id = uuid.uuid4().hex[:12]
@@ -51,30 +129,53 @@ class S3Service:
         file: UploadFile,
         folder: str = "uploads",
         generate_thumbnail: bool = True,
+        max_size: Optional[int] = None,
+        existing_key_for: Optional[Callable[[str], Awaitable[Optional[str]]]] = None,
     ) -> dict:
-        content = await file.read()
-        file_size = len(content)
+        """Stream ``file`` to S3, hashing it on the way.
+
+        If ``existing_key_for`` maps the content's SHA-256 to an already
+        stored object, nothing is written and the result points at that
+        object with ``duplicate`` set.
+        """
         original_filename = file.filename or "unknown"
         mime_type = file.content_type or "application/octet-stream"
-        file_type = self._get_file_type(mime_type)
-
         s3_key = self._generate_key(original_filename, folder)
 
+        from botocore.exceptions import ClientError
+
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket,
-                Key=s3_key,
-                Body=content,
-                ContentType=mime_type,
-                CacheControl="max-age=31536000",
+            file_size, content_hash, stored_key = await self._stream_to_s3(
+                file, s3_key, mime_type, max_size, existing_key_for
             )
         except ClientError as e:
             raise Exception(f"Failed to upload file to S3: {e}")
 
-        result = {
+        result = self._upload_result(original_filename, mime_type, stored_key, file_size)
+        result["content_hash"] = content_hash
+        result["duplicate"] = stored_key != s3_key
+
+        if generate_thumbnail and not result["duplicate"] and self._should_process_image(result):
+            try:
+                await file.seek(0)
+                content = await file.read()
+                await self._add_image_metadata(result, content)
+            except Exception:
+                pass
+
+        return result
+
+    def _upload_result(
+        self,
+        original_filename: str,
+        mime_type: str,
+        s3_key: str,
+        file_size: int,
+    ) -> dict:
+        return {
             "filename": s3_key.rsplit("/", 1)[-1],
             "original_filename": original_filename,
-            "file_type": file_type,
+            "file_type": self._get_file_type(mime_type),
             "mime_type": mime_type,
             "file_size": file_size,
             "s3_key": s3_key,
@@ -83,58 +184,379 @@ class S3Service:
             "thumbnail_url": None,
             "width": None,
             "height": None,
+            "extra_data": None,
         }
 
-        if file_type == "image" and generate_thumbnail:
+    def _should_process_image(self, result: dict) -> bool:
+        return (
+            result["file_type"] == "image"
+            and result["file_size"] <= settings.image_processing_max_bytes
+        )
+
+    async def _add_image_metadata(self, result: dict, content: bytes) -> None:
+        image = await self._process_image(content, result["s3_key"])
+        result["width"] = image["width"]
+        result["height"] = image["height"]
+        result["thumbnail_url"] = image["thumbnail_url"]
+        if image["variants"]:
+            result["extra_data"] = {"variants": image["variants"]}
+
+    async def _stream_to_s3(
+        self,
+        file: UploadFile,
+        s3_key: str,
+        mime_type: str,
+        max_size: Optional[int] = None,
+        existing_key_for: Optional[Callable[[str], Awaitable[Optional[str]]]] = None,
+    ) -> Tuple[int, str, str]:
+        """Upload ``file`` part by part, holding at most one part in memory.
+
+        Files that fit in a single part go up with one ``put_object``; larger
+        ones use a multipart upload, which is aborted if the size limit is
+        exceeded mid-stream or a part fails. The content hash is checked
+        against ``existing_key_for`` before the object is committed; a match
+        skips the put (or aborts the multipart upload).
+
+        Returns the number of bytes, the SHA-256 hex digest and the key of
+        the stored object.
+        """
+        part_size = max(settings.s3_multipart_part_size, MIN_MULTIPART_PART_SIZE)
+
+        def check_size(size: int) -> None:
+            if max_size is not None and size > max_size:
+                raise FileTooLargeError(
+                    f"File exceeds maximum size of {max_size // (1024 * 1024)}MB"
+                )
+
+        digest = hashlib.sha256()
+        chunk = await file.read(part_size)
+        total = len(chunk)
+        check_size(total)
+        digest.update(chunk)
+
+        if len(chunk) < part_size:
+            content_hash = digest.hexdigest()
+            existing_key = existing_key_for and await existing_key_for(content_hash)
+            if existing_key:
+                return total, content_hash, existing_key
+
+            await self._call(
+                "put_object",
+                Bucket=self.bucket,
+                Key=s3_key,
+                Body=chunk,
+                ContentType=mime_type,
+                CacheControl="max-age=31536000",
+            )
+            return total, content_hash, s3_key
+
+        upload = await self._call(
+            "create_multipart_upload",
+            Bucket=self.bucket,
+            Key=s3_key,
+            ContentType=mime_type,
+            CacheControl="max-age=31536000",
+        )
+        upload_id = upload["UploadId"]
+        parts = []
+
+        try:
+            while chunk:
+                part = await self._call(
+                    "upload_part",
+                    Bucket=self.bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    PartNumber=len(parts) + 1,
+                    Body=chunk,
+                )
+                parts.append({"PartNumber": len(parts) + 1, "ETag": part["ETag"]})
+
+                chunk = await file.read(part_size)
+                total += len(chunk)
+                check_size(total)
+                digest.update(chunk)
+
+            content_hash = digest.hexdigest()
+            existing_key = existing_key_for and await existing_key_for(content_hash)
+            if not existing_key:
+                await self._call(
+                    "complete_multipart_upload",
+                    Bucket=self.bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            await self._abort_multipart_upload(s3_key, upload_id)
+            raise
+
+        if existing_key:
+            # Same content is already stored; drop the parts instead of completing
+            await self._abort_multipart_upload(s3_key, upload_id)
+            return total, content_hash, existing_key
+
+        return total, content_hash, s3_key
+
+    async def _abort_multipart_upload(self, s3_key: str, upload_id: str) -> None:
+        await self._call(
+            "abort_multipart_upload",
+            Bucket=self.bucket,
+            Key=s3_key,
+            UploadId=upload_id,
+        )
+
+    async def create_presigned_upload(
+        self,
+        s3_key: str,
+        mime_type: str,
+        file_size: int,
+    ) -> Dict[str, Any]:
+        """Let the client upload ``file_size`` bytes straight to ``s3_key``.
+
+        Small files get a single presigned PUT; larger ones get a multipart
+        upload with one presigned URL per part. The client must send the
+        returned headers with a PUT, and report part ETags back when
+        finalizing a multipart upload.
+        """
+        expires_in = settings.s3_presigned_url_expire_seconds
+        headers = {"Content-Type": mime_type, "Cache-Control": "max-age=31536000"}
+        part_size = max(settings.s3_multipart_part_size, MIN_MULTIPART_PART_SIZE)
+
+        if file_size <= part_size:
+            url = await self._call(
+                "generate_presigned_url",
+                ClientMethod="put_object",
+                Params={
+                    "Bucket": self.bucket,
+                    "Key": s3_key,
+                    "ContentType": mime_type,
+                    "CacheControl": headers["Cache-Control"],
+                },
+                ExpiresIn=expires_in,
+            )
+            return {
+                "method": "PUT",
+                "url": url,
+                "headers": headers,
+                "upload_id": None,
+                "part_size": None,
+                "parts": [],
+                "expires_in": expires_in,
+            }
+
+        part_size = max(part_size, math.ceil(file_size / MAX_MULTIPART_PARTS))
+        part_count = math.ceil(file_size / part_size)
+
+        upload = await self._call(
+            "create_multipart_upload",
+            Bucket=self.bucket,
+            Key=s3_key,
+            ContentType=mime_type,
+            CacheControl=headers["Cache-Control"],
+        )
+        upload_id = upload["UploadId"]
+
+        def presign_parts() -> List[Dict[str, Any]]:
+            # Presigning is local signing work, done in one pool hop
+            return [
+                {
+                    "part_number": part_number,
+                    "url": self.s3_client.generate_presigned_url(
+                        ClientMethod="upload_part",
+                        Params={
+                            "Bucket": self.bucket,
+                            "Key": s3_key,
+                            "UploadId": upload_id,
+                            "PartNumber": part_number,
+                        },
+                        ExpiresIn=expires_in,
+                    ),
+                }
+                for part_number in range(1, part_count + 1)
+            ]
+
+        return {
+            "method": "MULTIPART",
+            "url": None,
+            "headers": {},
+            "upload_id": upload_id,
+            "part_size": part_size,
+            "parts": await self._run(presign_parts),
+            "expires_in": expires_in,
+        }
+
+    async def finalize_presigned_upload(
+        self,
+        s3_key: str,
+        original_filename: str,
+        mime_type: str,
+        upload_id: Optional[str] = None,
+        parts: Optional[List[Dict[str, Any]]] = None,
+        max_size: Optional[int] = None,
+        generate_thumbnail: bool = True,
+    ) -> dict:
+        """Complete a direct upload and extract the same metadata as ``upload_file``.
+
+        The stored object's size is read back from S3; objects over
+        ``max_size`` are deleted and rejected.
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            if upload_id:
+                await self._call(
+                    "complete_multipart_upload",
+                    Bucket=self.bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={
+                        "Parts": [
+                            {"PartNumber": p["part_number"], "ETag": p["etag"]}
+                            for p in sorted(parts or [], key=lambda p: p["part_number"])
+                        ]
+                    },
+                )
+            head = await self._call("head_object", Bucket=self.bucket, Key=s3_key)
+        except ClientError as e:
+            raise Exception(f"Upload not found in S3: {e}")
+
+        file_size = head["ContentLength"]
+        if max_size is not None and file_size > max_size:
+            await self.delete_file(s3_key)
+            raise FileTooLargeError(
+                f"File exceeds maximum size of {max_size // (1024 * 1024)}MB"
+            )
+
+        result = self._upload_result(original_filename, mime_type, s3_key, file_size)
+
+        if generate_thumbnail and self._should_process_image(result):
             try:
-                dimensions, thumbnail_url = await self._process_image(content, s3_key)
-                result["width"] = dimensions[0]
-                result["height"] = dimensions[1]
-                result["thumbnail_url"] = thumbnail_url
+                content = await self._get_object_bytes(s3_key)
+                await self._add_image_metadata(result, content)
             except Exception:
                 pass
 
         return result
 
-    async def _process_image(
+    async def download_to_file(self, s3_key: str, fileobj: Any) -> None:
+        """Stream an object into ``fileobj`` without holding it all in memory."""
+        def download() -> None:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+            shutil.copyfileobj(response["Body"], fileobj, 1024 * 1024)
+
+        started_at = time.perf_counter()
+        await self._run(download)
+        self._record_download(started_at, fileobj.tell())
+
+    async def _get_object_bytes(self, s3_key: str) -> bytes:
+        def download() -> bytes:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+            return response["Body"].read()
+
+        started_at = time.perf_counter()
+        content = await self._run(download)
+        self._record_download(started_at, len(content))
+        return content
+
+    async def upload_bytes(
         self,
-        content: bytes,
-        original_key: str,
-    ) -> Tuple[Tuple[int, int], Optional[str]]:
-        image = Image.open(io.BytesIO(content))
-        width, height = image.size
-
-        thumbnail_url = None
-        if max(width, height) > 400:
-            thumb = image.copy()
-            thumb.thumbnail((400, 400), Image.Resampling.LANCZOS)
-
-            thumb_buffer = io.BytesIO()
-            thumb_format = "JPEG" if image.mode == "RGB" else "PNG"
-            thumb.save(thumb_buffer, format=thumb_format, quality=85)
-            thumb_buffer.seek(0)
-
-            thumb_key = original_key.replace("/uploads/", "/thumbnails/")
-            if thumb_format == "JPEG" and not thumb_key.endswith(".jpg"):
-                thumb_key = thumb_key.rsplit(".", 1)[0] + ".jpg"
+        s3_key: str,
+        body: bytes,
+        content_type: str,
+        cache_control: str = "max-age=31536000",
+    ) -> str:
+        from botocore.exceptions import ClientError
 
-            try:
-                self.s3_client.put_object(
+        try:
+            await self._call(
+                "put_object",
+                Bucket=self.bucket,
+                Key=s3_key,
+                Body=body,
+                ContentType=content_type,
+                CacheControl=cache_control,
+            )
+        except ClientError as e:
+            raise Exception(f"Failed to upload file to S3: {e}")
+
+        return self._get_cloudfront_url(s3_key)
+
+    async def _process_image(self, content: bytes, original_key: str) -> Dict[str, Any]:
+        """Render and store the thumbnail and responsive variants of an image.
+
+        Returns the original dimensions, the thumbnail URL and variant
+        metadata (without bodies) for ``Asset.extra_data["variants"]``.
+        """
+        processed = await image_service.process_image_async(
+            content,
+            widths=settings.image_variant_widths,
+            formats=settings.image_variant_formats,
+            quality=settings.image_variant_quality,
+        )
+
+        uploads = []
+        thumbnail = processed["thumbnail"]
+        if thumbnail:
+            thumbnail["key"] = image_service.derived_key(
+                original_key, "thumb", "jpg" if thumbnail["format"] == "jpeg" else thumbnail["format"]
+            )
+            uploads.append(thumbnail)
+
+        variants = []
+        for variant in processed["variants"]:
+            variant["key"] = image_service.derived_key(
+                original_key, f"{variant['width']}w", variant["format"]
+            )
+            uploads.append(variant)
+            variants.append({
+                "key": variant["key"],
+                "url": self._get_cloudfront_url(variant["key"]),
+                "width": variant["width"],
+                "height": variant["height"],
+                "format": variant["format"],
+                "mime_type": variant["mime_type"],
+            })
+
+        from botocore.exceptions import ClientError
+
+        results = await asyncio.gather(
+            *(
+                self._call(
+                    "put_object",
                     Bucket=self.bucket,
-                    Key=thumb_key,
-                    Body=thumb_buffer.getvalue(),
-                    ContentType=f"image/{thumb_format.lower()}",
+                    Key=upload["key"],
+                    Body=upload["body"],
+                    ContentType=upload["mime_type"],
                     CacheControl="max-age=31536000",
                 )
-                thumbnail_url = self._get_cloudfront_url(thumb_key)
-            except ClientError:
-                pass
+                for upload in uploads
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, ClientError):
+                raise result
+        stored = {
+            upload["key"] for upload, result in zip(uploads, results)
+            if not isinstance(result, BaseException)
+        }
 
-        return (width, height), thumbnail_url
+        return {
+            "width": processed["width"],
+            "height": processed["height"],
+            "thumbnail_url": (
+                self._get_cloudfront_url(thumbnail["key"])
+                if thumbnail and thumbnail["key"] in stored else None
+            ),
+            "variants": [v for v in variants if v["key"] in stored],
+        }
 
     async def delete_file(self, s3_key: str) -> bool:
+        from botocore.exceptions import ClientError
+
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=s3_key)
+            await self._call("delete_object", Bucket=self.bucket, Key=s3_key)
             return True
         except ClientError:
             return False
@@ -143,9 +565,12 @@ class S3Service:
         if not s3_keys:
             return True
 
+        from botocore.exceptions import ClientError
+
         try:
             objects = [{"Key": key} for key in s3_keys]
-            self.s3_client.delete_objects(
+            await self._call(
+                "delete_objects",
                 Bucket=self.bucket,
                 Delete={"Objects": objects},
             )
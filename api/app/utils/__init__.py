@@ -1,15 +1,35 @@
+from app.utils.cache import TTLCache
+from app.utils.pagination import InvalidCursor, decode_cursor, encode_cursor
+from app.utils.query_stats import QueryStats, instrument_engine, track_queries
+from app.utils.rate_limit import RateLimiter
 from app.utils.security import (
+    PasswordHasherBusy,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
+    create_upload_token,
     decode_token,
 )
 
 __all__ = [
+    "TTLCache",
+    "InvalidCursor",
+    "decode_cursor",
+    "encode_cursor",
+    "QueryStats",
+    "instrument_engine",
+    "track_queries",
+    "RateLimiter",
+    "PasswordHasherBusy",
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
+    "create_upload_token",
     "decode_token",
 ]
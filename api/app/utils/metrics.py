@@ -0,0 +1,313 @@
+import json
+import os
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# CloudWatch accepts at most 100 values per metric in one EMF document
+_EMF_MAX_VALUES = 100
+
+LabelKey = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), unit: str = "None"):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        # CloudWatch unit for embedded metric logs
+        self.unit = unit
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), unit: str = "Count"):
+        super().__init__(name, help, labels, unit)
+        self._values: Dict[LabelKey, float] = defaultdict(float)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] += amount
+        registry.buffer(self, key, amount)
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        unit: str = "Seconds",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labels, unit)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (+Inf last), sum, count
+        self._series: Dict[LabelKey, List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+        registry.buffer(self, key, value)
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                labels = _format_labels(self.label_names, key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Gauge(Metric):
+    """A gauge read from ``collect`` at export time (e.g. pool occupancy)."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Iterable[Tuple[Dict[str, Any], float]]],
+        labels: Sequence[str] = (),
+        unit: str = "Count",
+    ):
+        super().__init__(name, help, labels, unit)
+        self.collect = collect
+
+    def samples(self) -> List[Tuple[LabelKey, float]]:
+        return [(self._key(labels), value) for labels, value in self.collect()]
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in self.samples()
+        ]
+
+
+class MetricsRegistry:
+    """Process-wide metrics, exported as Prometheus text or CloudWatch EMF.
+
+    Updates are expected from the event loop thread; nothing here locks.
+    With ``emf_enabled`` every update is also buffered until the next
+    ``flush_emf`` so each Lambda invocation logs only its own observations.
+    """
+
+    def __init__(self, emf_enabled: bool = False, namespace: str = ""):
+        self.emf_enabled = emf_enabled
+        self.namespace = namespace
+        self._metrics: Dict[str, Metric] = {}
+        self._pending: Dict[Tuple[str, LabelKey], List[float]] = defaultdict(list)
+
+    def register(self, metric: Metric) -> Metric:
+        return self._metrics.setdefault(metric.name, metric)
+
+    def buffer(self, metric: Metric, key: LabelKey, value: float) -> None:
+        if self.emf_enabled:
+            self._pending[(metric.name, key)].append(value)
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.render()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def flush_emf(self, stream: Optional[TextIO] = None) -> List[Dict[str, Any]]:
+        """Write buffered observations as CloudWatch embedded metric logs.
+
+        One JSON document per label set; counters are summed, histogram
+        observations sent as value arrays and gauges sampled now. Returns
+        the documents written.
+        """
+        grouped: Dict[Tuple[Tuple[str, ...], LabelKey], Dict[str, Any]] = defaultdict(dict)
+        for (name, key), values in self._pending.items():
+            metric = self._metrics[name]
+            value = sum(values) if isinstance(metric, Counter) else values
+            grouped[(metric.label_names, key)][name] = value
+        self._pending.clear()
+
+        if grouped:
+            for metric in self._metrics.values():
+                if isinstance(metric, Gauge):
+                    for key, value in metric.samples():
+                        grouped[(metric.label_names, key)][metric.name] = value
+
+        timestamp = int(time.time() * 1000)
+        documents = []
+        for (label_names, key), values in grouped.items():
+            for chunk in _emf_chunks(values):
+                document: Dict[str, Any] = {
+                    "_aws": {
+                        "Timestamp": timestamp,
+                        "CloudWatchMetrics": [{
+                            "Namespace": self.namespace,
+                            "Dimensions": [list(label_names)],
+                            "Metrics": [
+                                {"Name": name, "Unit": self._metrics[name].unit}
+                                for name in chunk
+                            ],
+                        }],
+                    },
+                    **dict(zip(label_names, key)),
+                    **chunk,
+                }
+                documents.append(document)
+
+        stream = stream or sys.stdout
+        for document in documents:
+            stream.write(json.dumps(document, separators=(",", ":")) + "\n")
+        stream.flush()
+        return documents
+
+
+def _emf_chunks(values: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    longest = max(len(v) if isinstance(v, list) else 1 for v in values.values())
+    for start in range(0, longest, _EMF_MAX_VALUES):
+        chunk = {}
+        for name, value in values.items():
+            if isinstance(value, list):
+                if value[start:start + _EMF_MAX_VALUES]:
+                    chunk[name] = value[start:start + _EMF_MAX_VALUES]
+            elif start == 0:
+                chunk[name] = value
+        yield chunk
+
+
+# Lambda has no scrape target; its metrics go to CloudWatch as EMF log lines
+registry = MetricsRegistry(
+    emf_enabled=bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME")),
+    namespace=settings.metrics_namespace,
+)
+
+
+def counter(name: str, help: str, labels: Sequence[str] = (), unit: str = "Count") -> Counter:
+    return registry.register(Counter(name, help, labels, unit))
+
+
+def histogram(
+    name: str,
+    help: str,
+    labels: Sequence[str] = (),
+    unit: str = "Seconds",
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return registry.register(Histogram(name, help, labels, unit, buckets))
+
+
+def gauge(
+    name: str,
+    help: str,
+    collect: Callable[[], Iterable[Tuple[Dict[str, Any], float]]],
+    labels: Sequence[str] = (),
+    unit: str = "Count",
+) -> Gauge:
+    return registry.register(Gauge(name, help, collect, labels, unit))
+
+
+HTTP_REQUEST_SECONDS = histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template",
+    ["method", "route", "status"],
+)
+
+
+class MetricsMiddleware:
+    """Records request latency labelled with the matched route's template.
+
+    Unmatched paths share one ``route`` label so scanners can't grow the
+    label set without bound.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Set by the router on the (shared) scope once a route matched
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started_at,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status_code,
+            )
@@ -0,0 +1,31 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Sequence
+from uuid import UUID
+
+
+class InvalidCursor(ValueError):
+    """Raised for cursors that weren't produced by ``encode_cursor``."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for the sort key of the last row on a page."""
+    payload = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, UUID) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """Decode a cursor into its sort-key values, converted with ``types``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return [convert(value) for convert, value in zip(types, values)]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
@@ -0,0 +1,157 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Collectors currently recording; nested ``track_queries`` blocks all see a
+# statement (e.g. a test around a request that the middleware also tracks)
+_active: ContextVar[Tuple["QueryStats", ...]] = ContextVar("query_stats", default=())
+
+
+class QueryStats:
+    """SQL statements executed while a ``track_queries`` block is active."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self.slow: List[Tuple[str, float]] = []
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+        if duration * 1000 >= settings.query_stats_slow_query_ms:
+            self.slow.append((statement, duration))
+
+    def repeated(self, threshold: int = 0) -> List[Tuple[str, int]]:
+        """Statements run at least ``threshold`` times: likely N+1 loads.
+
+        Statements are compared as compiled SQL with bound parameters, so the
+        same lazy load issued per row shows up as one entry.
+        """
+        threshold = threshold or settings.query_stats_n_plus_one_threshold
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the statements instrumented engines run inside the block."""
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def _shorten(statement: str, length: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= length else statement[:length] + "..."
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+    duration = time.perf_counter() - started_at
+
+    for stats in _active.get():
+        stats.record(statement, duration)
+
+    if duration * 1000 >= settings.query_stats_slow_query_ms:
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(duration * 1000, 1),
+            "statement": _shorten(statement),
+        }))
+
+
+def instrument_engine(engine: Any) -> None:
+    """Time every statement an (async or sync) engine executes. Idempotent."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Per-request statement count and DB time.
+
+    Adds a ``Server-Timing`` header (``db`` with the count in ``desc``, and
+    ``total``) and logs one JSON line per request, at WARNING when it ran a
+    slow query or repeated a statement often enough to look like N+1.
+    Statements that run after the response has started (streaming bodies,
+    background tasks) are logged but miss the header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    total_ms = (time.perf_counter() - started_at) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f"{stats.server_timing()}, total;dur={total_ms:.1f}",
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                _log_request(scope, status_code, stats, time.perf_counter() - started_at)
+
+
+def _log_request(scope: Scope, status_code: int, stats: QueryStats, duration: float) -> None:
+    repeated = stats.repeated()
+    record: Dict[str, Any] = {
+        "event": "request",
+        "method": scope["method"],
+        "path": scope["path"],
+        "status": status_code,
+        "duration_ms": round(duration * 1000, 1),
+        "queries": stats.count,
+        "db_ms": round(stats.duration * 1000, 1),
+    }
+    if repeated:
+        record["n_plus_one"] = [
+            {"statement": _shorten(sql), "count": n} for sql, n in repeated
+        ]
+    if stats.slow:
+        record["slow_queries"] = len(stats.slow)
+
+    level = logging.WARNING if repeated or stats.slow else logging.INFO
+    logger.log(level, json.dumps(record))
@@ -0,0 +1,53 @@
+import time
+from collections import deque
+from typing import Deque, Dict, Hashable
+
+
+class RateLimiter:
+    """Sliding-window attempt counter, per key and per process."""
+
+    def __init__(self, max_attempts: int, window_seconds: float, max_keys: int = 10_000):
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._attempts: Dict[Hashable, Deque[float]] = {}
+
+    def hit(self, key: Hashable) -> float:
+        """Record an attempt for ``key``.
+
+        Returns 0 if the attempt is allowed, otherwise the number of seconds
+        until the oldest attempt leaves the window.
+        """
+        now = time.monotonic()
+        if key not in self._attempts and len(self._attempts) >= self.max_keys:
+            self._sweep(now)
+
+        attempts = self._attempts.setdefault(key, deque())
+        while attempts and now - attempts[0] >= self.window_seconds:
+            attempts.popleft()
+
+        if len(attempts) >= self.max_attempts:
+            return self.window_seconds - (now - attempts[0])
+
+        attempts.append(now)
+        return 0.0
+
+    def undo(self, key: Hashable) -> None:
+        """Forget the latest attempt for ``key``, e.g. once it proved legitimate."""
+        attempts = self._attempts.get(key)
+        if attempts:
+            attempts.pop()
+
+    def _sweep(self, now: float) -> None:
+        expired = [
+            key for key, attempts in self._attempts.items()
+            if not attempts or now - attempts[-1] >= self.window_seconds
+        ]
+        for key in expired:
+            del self._attempts[key]
+
+    def reset(self, key: Hashable) -> None:
+        self._attempts.pop(key, None)
+
+    def clear(self) -> None:
+        self._attempts.clear()
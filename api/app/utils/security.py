@@ -1,20 +1,73 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
-
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+# passlib/bcrypt and jose are imported on first use so that public routes
+# don't pay for them on a cold start.
+@lru_cache
+def get_pwd_context() -> "CryptContext":
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash/verify calls are already queued."""
+
+
+T = TypeVar("T")
+
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_pending = 0
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            thread_name_prefix="password-hash",
+        )
+    return _hash_executor
+
+
+async def _run_hasher(func: Callable[..., T], *args: Any) -> T:
+    # bcrypt releases the GIL, so a small thread pool keeps the event loop
+    # free. The pending cap sheds load instead of queueing logins unboundedly.
+    global _hash_pending
+    if _hash_pending >= settings.password_hash_max_pending:
+        raise PasswordHasherBusy("Too many password checks in progress")
+
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hasher(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hasher(verify_password, plain_password, hashed_password)
 
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
@@ -31,6 +84,8 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
         "type": "access",
     }
 
+    from jose import jwt
+
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
@@ -48,10 +103,27 @@ def create_refresh_token(subject: str, expires_delta: Optional[timedelta] = None
         "type": "refresh",
     }
 
+    from jose import jwt
+
+    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+
+
+def create_upload_token(claims: Dict[str, Any], expires_delta: timedelta) -> str:
+    """Sign the server-chosen parameters of a direct-to-S3 upload."""
+    to_encode: Dict[str, Any] = {
+        **claims,
+        "exp": datetime.now(timezone.utc) + expires_delta,
+        "type": "asset_upload",
+    }
+
+    from jose import jwt
+
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(
             token,
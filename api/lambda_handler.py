@@ -2,8 +2,56 @@
 AWS Lambda handler for the FastAPI application.
 Uses Mangum to adapt ASGI (FastAPI) to AWS Lambda + API Gateway.
 """
+import asyncio
+
 from mangum import Mangum
 from app.main import app
+from app.utils import metrics
 
 # Mangum adapter: converts Lambda events → ASGI → FastAPI
-handler = Mangum(app, lifespan="off")
+asgi_handler = Mangum(app, lifespan="off")
+
+LAMBDA_COLD_STARTS = metrics.counter(
+    "lambda_cold_starts_total",
+    "Invocations that initialized a new Lambda container",
+)
+_cold_start = True
+# Event loop of the asset job worker, kept across warm invocations
+_jobs_loop = None
+
+
+def _count_cold_start() -> None:
+    global _cold_start
+    if _cold_start:
+        _cold_start = False
+        LAMBDA_COLD_STARTS.inc()
+
+
+def handler(event, context):
+    _count_cold_start()
+    try:
+        return asgi_handler(event, context)
+    finally:
+        # Metrics of this invocation go to CloudWatch as EMF log lines
+        metrics.registry.flush_emf()
+
+
+async def _drain_asset_jobs() -> int:
+    from app.database import get_session_maker
+    from app.services.job_service import JobService
+
+    async with get_session_maker()() as session:
+        return await JobService.run_pending(session)
+
+
+def asset_jobs_handler(event, context):
+    """Entry point for a scheduled (EventBridge) asset-processing function."""
+    global _jobs_loop
+    _count_cold_start()
+    # One loop per container so pooled connections survive between invocations
+    if _jobs_loop is None:
+        _jobs_loop = asyncio.new_event_loop()
+    try:
+        return {"processed": _jobs_loop.run_until_complete(_drain_asset_jobs())}
+    finally:
+        metrics.registry.flush_emf()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Process queued asset jobs (thumbnails, image variants, media durations).
+
+Run as many workers as needed; jobs are claimed with SKIP LOCKED so they
+never process the same asset twice.
+
+Usage:
+    cd api
+    python -m scripts.asset_worker          # poll forever
+    python -m scripts.asset_worker --once   # drain due jobs and exit
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.database import async_session_maker
+from app.services.job_service import JobService
+
+
+async def work(once: bool):
+    while True:
+        async with async_session_maker() as session:
+            processed = await JobService.run_pending(session)
+        if processed:
+            print(f"✓ Processed {processed} asset jobs")
+        elif once:
+            return
+        else:
+            await asyncio.sleep(settings.asset_worker_poll_seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="Drain due jobs and exit")
+    args = parser.parse_args()
+    asyncio.run(work(args.once))
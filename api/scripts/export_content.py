@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Export the published content as static JSON to S3/CloudFront.
+
+Writes one immutable, content-addressed object per section plus the combined
+payload, then updates content/manifest.json to point at them.
+
+Usage:
+    cd api
+    python -m scripts.export_content
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import async_session_maker
+from app.services.export_service import ContentExportService
+
+
+async def export():
+    async with async_session_maker() as session:
+        manifest = await ContentExportService.export(session)
+
+    print(f"✓ Exported content version {manifest['version']}")
+    print(f"  all: {manifest['content']}")
+    for slug, url in manifest["sections"].items():
+        print(f"  {slug}: {url}")
+
+
+if __name__ == "__main__":
+    asyncio.run(export())
@@ -90,52 +90,25 @@ def ensure_sections(token):
     return sections
 
 
-def get_projects_by_section(token, section_slug):
-    resp = requests.get(
-        f"{API_BASE}/projects/by-section/{section_slug}",
-        params={"published_only": "false"},
-        headers=auth_headers(token),
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    items = data.get("items", data) if isinstance(data, dict) else data
-    return {p["slug"]: p for p in items}
-
-
-def create_project(token, section_id, data):
-    resp = requests.post(
-        f"{API_BASE}/projects",
-        headers=auth_headers(token),
-        json={**data, "section_id": section_id}
-    )
-    if resp.status_code == 201:
-        return resp.json()
-    print(f"Error creating project: {resp.text}")
-    return None
-
-
-def update_project(token, project_id, data):
+def upsert_project(token, section_slug, data):
+    # One idempotent PUT per project; the API resolves create vs. update
+    # atomically on (section, slug)
+    data = dict(data)
+    slug = data.pop("slug")
     resp = requests.put(
-        f"{API_BASE}/projects/{project_id}",
+        f"{API_BASE}/projects/by-section/{section_slug}/{slug}",
         headers=auth_headers(token),
+        params={"overwrite": "true" if OVERWRITE else "false"},
         json=data,
     )
-    if resp.status_code == 200:
+    if resp.status_code in (200, 201):
+        if resp.status_code == 200 and not OVERWRITE:
+            print(f"  ↪︎ Skipping existing {slug}")
         return resp.json()
-    print(f"Error updating project: {resp.text}")
+    print(f"Error upserting project {slug}: {resp.text}")
     return None
 
 
-def upsert_project(token, section_id, existing, data):
-    slug = data.get("slug")
-    if existing and slug in existing:
-        if OVERWRITE:
-            return update_project(token, existing[slug]["id"], data)
-        print(f"  ↪︎ Skipping existing {slug}")
-        return existing[slug]
-    return create_project(token, section_id, data)
-
-
 def with_cdn(path):
     if not path:
         return None
@@ -161,11 +134,9 @@ def main():
     print("✓ Loaded content files")
 
     # ========== DJ SECTION ==========
-    dj_section_id = sections["dj"]
-    existing_dj = get_projects_by_section(token, "dj")
 
     # DJ Hero
-    upsert_project(token, dj_section_id, existing_dj, {
+    upsert_project(token, "dj", {
         "slug": "hero",
         "title": dj_data["hero"]["name"],
         "subtitle": dj_data["hero"]["badge"],
@@ -184,7 +155,7 @@ def main():
     print("  ✓ Created DJ hero")
 
     # DJ Artist
-    upsert_project(token, dj_section_id, existing_dj, {
+    upsert_project(token, "dj", {
         "slug": "artist",
         "title": "Artist",
         "subtitle": dj_data["artist"]["title"],
@@ -202,7 +173,7 @@ def main():
     # DJ Gigs - each gig as a project
     for i, gig in enumerate(dj_data["gigs"]):
         gig_slug = gig["id"] if gig["id"].startswith("gig-") else f"gig-{gig['id']}"
-        upsert_project(token, dj_section_id, existing_dj, {
+        upsert_project(token, "dj", {
             "slug": gig_slug,
             "title": gig["event"],
             "subtitle": f"{gig['collective']} · {gig['location']}",
@@ -226,7 +197,7 @@ def main():
     print(f"  ✓ Created {len(dj_data['gigs'])} gigs")
 
     # DJ Sets
-    upsert_project(token, dj_section_id, existing_dj, {
+    upsert_project(token, "dj", {
         "slug": "sets",
         "title": dj_data["sets"]["title"],
         "description": dj_data["sets"]["description"],
@@ -240,7 +211,7 @@ def main():
     print("  ✓ Created DJ sets")
 
     # DJ Press Kit
-    upsert_project(token, dj_section_id, existing_dj, {
+    upsert_project(token, "dj", {
         "slug": "press-kit",
         "title": dj_data["pressKit"]["title"],
         "description": dj_data["pressKit"]["description"],
@@ -258,7 +229,7 @@ def main():
     print("  ✓ Created DJ press kit")
 
     # DJ Contact
-    upsert_project(token, dj_section_id, existing_dj, {
+    upsert_project(token, "dj", {
         "slug": "contact",
         "title": "Contact",
         "subtitle": dj_data["contact"]["booking_title"],
@@ -274,11 +245,9 @@ def main():
     print("  ✓ Created DJ contact")
 
     # ========== TECH SECTION ==========
-    tech_section_id = sections["tech"]
-    existing_tech = get_projects_by_section(token, "tech")
 
     # Tech Hero
-    upsert_project(token, tech_section_id, existing_tech, {
+    upsert_project(token, "tech", {
         "slug": "hero",
         "title": pro_data["hero"]["name"],
         "subtitle": pro_data["hero"]["title"],
@@ -296,7 +265,7 @@ def main():
     print("  ✓ Created Tech hero")
 
     # Tech Highlights
-    upsert_project(token, tech_section_id, existing_tech, {
+    upsert_project(token, "tech", {
         "slug": "highlights",
         "title": "Highlights",
         "description": "Key achievements and metrics",
@@ -310,7 +279,7 @@ def main():
     print("  ✓ Created Tech highlights")
 
     # Tech About
-    upsert_project(token, tech_section_id, existing_tech, {
+    upsert_project(token, "tech", {
         "slug": "about",
         "title": pro_data["about"]["title"],
         "description": pro_data["about"]["paragraphs"][0],
@@ -325,7 +294,7 @@ def main():
 
     # Tech Education
     for i, edu in enumerate(pro_data["education"]):
-        upsert_project(token, tech_section_id, existing_tech, {
+        upsert_project(token, "tech", {
             "slug": f"education-{i+1}",
             "title": edu["institution"],
             "subtitle": edu["degree"],
@@ -348,7 +317,7 @@ def main():
 
     # Tech Experience
     for i, exp in enumerate(pro_data["experience"]):
-        upsert_project(token, tech_section_id, existing_tech, {
+        upsert_project(token, "tech", {
             "slug": f"experience-{i+1}",
             "title": exp["company"],
             "subtitle": exp["role"],
@@ -368,7 +337,7 @@ def main():
     print(f"  ✓ Created {len(pro_data['experience'])} experience entries")
 
     # Tech Skills
-    upsert_project(token, tech_section_id, existing_tech, {
+    upsert_project(token, "tech", {
         "slug": "skills",
         "title": "Skills",
         "description": "Technical skills and expertise",
@@ -382,7 +351,7 @@ def main():
     print("  ✓ Created Tech skills")
 
     # Tech Certifications
-    upsert_project(token, tech_section_id, existing_tech, {
+    upsert_project(token, "tech", {
         "slug": "certifications",
         "title": "Certifications",
         "description": "Professional certifications and credentials",
@@ -396,7 +365,7 @@ def main():
     print("  ✓ Created Tech certifications")
 
     # Tech Contact
-    upsert_project(token, tech_section_id, existing_tech, {
+    upsert_project(token, "tech", {
         "slug": "contact",
         "title": "Contact",
         "description": "Get in touch",
@@ -409,7 +378,7 @@ def main():
 
     # Featured Projects
     for i, proj in enumerate(projects_data["featured"]):
-        upsert_project(token, tech_section_id, existing_tech, {
+        upsert_project(token, "tech", {
             "slug": f"project-{proj['title'].lower().replace(' ', '-').replace(':', '')[:50]}",
             "title": proj["title"],
             "subtitle": proj["category"],
@@ -435,7 +404,7 @@ def main():
     order = 50
     for category, projs in projects_data["github_projects"].items():
         for proj in projs:
-            upsert_project(token, tech_section_id, existing_tech, {
+            upsert_project(token, "tech", {
                 "slug": f"github-{proj['name'].lower().replace(' ', '-')[:40]}",
                 "title": proj["name"],
                 "subtitle": category.replace("_", " ").title(),
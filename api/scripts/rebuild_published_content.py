@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Rebuild the published_sections read model from sections/projects/assets.
+
+Migration 002 fills the table when it is created; run this whenever the
+content tables were edited outside the API.
+
+Usage:
+    cd api
+    python -m scripts.rebuild_published_content
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.database import async_session_maker
+from app.models.published_section import PublishedSection
+from app.services.content_service import ContentService
+
+
+async def rebuild():
+    async with async_session_maker() as session:
+        await ContentService.refresh_all(session)
+        await session.commit()
+
+        result = await session.execute(
+            select(PublishedSection).order_by(PublishedSection.display_order)
+        )
+        for row in result.scalars().all():
+            print(f"✓ {row.slug}: {len(row.document['projects'])} published projects")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
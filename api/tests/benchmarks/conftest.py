@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+import pytest
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks only run with RUN_BENCHMARKS=1")
+    for item in items:
+        if BENCHMARKS_DIR in Path(str(item.fspath)).parents:
+            item.add_marker(skip)
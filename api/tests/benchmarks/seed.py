@@ -0,0 +1,126 @@
+"""Portfolio data at production-like volumes for the API benchmarks."""
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset, Project, Section, User
+from app.services.content_service import ContentService
+from app.utils.security import hash_password
+
+GIGS = 300
+TECH_PROJECTS = 60
+ASSETS = 3000
+# Share of assets not attached to any project (media library only)
+UNATTACHED_EVERY = 5
+
+ADMIN_EMAIL = "bench@example.com"
+ADMIN_PASSWORD = "benchmark-password"
+
+CDN = "https://cdn.example.com"
+
+
+def _asset_row(index: int, project_id, created_at: datetime) -> Dict:
+    key = f"uploads/bench/{index:05d}.jpg"
+    return {
+        "id": uuid.uuid4(),
+        "project_id": project_id,
+        "filename": f"{index:05d}.jpg",
+        "original_filename": f"photo-{index}.jpg",
+        "file_type": "image",
+        "mime_type": "image/jpeg",
+        "file_size": 350_000 + index,
+        "s3_key": key,
+        "content_hash": f"{index:064x}",
+        "s3_bucket": "bench",
+        "cloudfront_url": f"{CDN}/{key}",
+        "thumbnail_url": f"{CDN}/uploads/bench/{index:05d}-thumb.jpg",
+        "width": 1600,
+        "height": 1067,
+        "alt_text": f"Photo {index}",
+        "extra_data": {
+            "variants": [
+                {"format": fmt, "width": width, "height": round(width / 1.5),
+                 "url": f"{CDN}/uploads/bench/{index:05d}-{width}w.{fmt}"}
+                for fmt in ("avif", "webp")
+                for width in (320, 640, 1024)
+            ],
+        },
+        "processing_status": "ready",
+        "created_at": created_at,
+    }
+
+
+async def seed(
+    session: AsyncSession,
+    gigs: int = GIGS,
+    tech_projects: int = TECH_PROJECTS,
+    assets: int = ASSETS,
+) -> Dict[str, int]:
+    """Insert sections, an admin, projects and assets, then build the read model."""
+    dj = Section(slug="dj", title="DJ", display_order=1, is_active=True)
+    tech = Section(slug="tech", title="Technology", display_order=0, is_active=True)
+    admin = User(
+        email=ADMIN_EMAIL,
+        password_hash=hash_password(ADMIN_PASSWORD),
+        name="Benchmark Admin",
+        role="admin",
+        is_active=True,
+    )
+    session.add_all([dj, tech, admin])
+    await session.flush()
+
+    projects = [
+        {
+            "id": uuid.uuid4(),
+            "section_id": dj.id,
+            "slug": f"gig-{i}",
+            "title": f"Gig {i}",
+            "subtitle": "Collective · Berlin",
+            "description": "Four hours of deep, hypnotic techno. " * 4,
+            "content": {"date": "2024-05-01", "time": "23:00", "genre": ["techno", "house"]},
+            "thumbnail_url": f"{CDN}/gigs/{i}.jpg",
+            "display_order": 10 + i,
+            # Every tenth gig is still a draft
+            "is_published": i % 10 != 0,
+            "tags": ["gig", "techno"],
+            "extra_data": {"type": "gig", "collective": "Collective", "location": "Berlin"},
+        }
+        for i in range(gigs)
+    ] + [
+        {
+            "id": uuid.uuid4(),
+            "section_id": tech.id,
+            "slug": f"project-{i}",
+            "title": f"Project {i}",
+            "description": "A project with a long description. " * 8,
+            "content": {"stack": ["python", "react"], "links": {"github": "https://github.com"}},
+            "display_order": i,
+            "is_published": True,
+            "is_featured": i < 6,
+            "tags": ["python", "react"],
+        }
+        for i in range(tech_projects)
+    ]
+    await session.execute(insert(Project), projects)
+
+    now = datetime.now(timezone.utc)
+    await session.execute(
+        insert(Asset),
+        [
+            _asset_row(
+                i,
+                None if i % UNATTACHED_EVERY == 0 else projects[i % len(projects)]["id"],
+                now - timedelta(seconds=i),
+            )
+            for i in range(assets)
+        ],
+    )
+
+    await session.flush()
+    await ContentService.refresh_all(session)
+    await session.commit()
+
+    return {"gigs": gigs, "tech_projects": tech_projects, "assets": assets}
@@ -0,0 +1,25 @@
+import statistics
+from typing import Dict, Sequence
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99/max of latency samples, in milliseconds."""
+    ordered = sorted(samples)
+    if len(ordered) < 2:
+        value = ordered[0] * 1000 if ordered else 0.0
+        return {"p50": value, "p95": value, "p99": value, "max": value}
+
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {
+        "p50": cuts[49] * 1000,
+        "p95": cuts[94] * 1000,
+        "p99": cuts[98] * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def format_row(name: str, summary: Dict[str, float]) -> str:
+    return (
+        f"{name:<28} p50={summary['p50']:8.2f}ms  p95={summary['p95']:8.2f}ms  "
+        f"p99={summary['p99']:8.2f}ms  max={summary['max']:8.2f}ms"
+    )
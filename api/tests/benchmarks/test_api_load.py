@@ -0,0 +1,195 @@
+"""Latency and SQL statements per request for the public and admin APIs.
+
+Seeds hundreds of gigs and thousands of assets (see seed.py), then drives each
+endpoint with concurrent clients through httpx.ASGITransport against the test
+database, one session per request as in production. Statements per request
+come from the Server-Timing header. Results are compared with the stored
+baseline in baselines/api_load.json: more queries per request than the
+baseline fails; latency is reported, and fails only beyond
+BENCHMARK_LATENCY_TOLERANCE (e.g. 1.5 = 50% slower p95) when that is set,
+since baselines come from a different machine. Run with:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_api_load.py -s
+
+Set BENCHMARK_UPDATE_BASELINE=1 to store the run as the new baseline.
+"""
+import asyncio
+import json
+import os
+import platform
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.main import app
+from app.services.auth_service import principal_cache
+from app.services.content_cache import content_cache
+from tests.benchmarks.conftest import BENCHMARKS_DIR
+from tests.benchmarks.seed import ADMIN_EMAIL, ADMIN_PASSWORD, seed
+from tests.benchmarks.stats import format_row, summarize
+from tests.conftest import async_session_maker
+
+BASELINE_PATH = BENCHMARKS_DIR / "baselines" / "api_load.json"
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    json: Optional[Dict[str, Any]] = None
+    requests: int = 200
+    concurrency: int = 8
+    admin: bool = False
+    # Serve public content from the database instead of the snapshot cache
+    uncached: bool = False
+
+
+SCENARIOS = [
+    Scenario("GET /content", "GET", "/api/v1/content"),
+    Scenario("GET /content uncached", "GET", "/api/v1/content", requests=100, uncached=True),
+    Scenario("GET /content/dj uncached", "GET", "/api/v1/content/dj", requests=100, uncached=True),
+    Scenario("GET /projects", "GET", "/api/v1/projects", params={"published_only": "false"}),
+    Scenario(
+        "GET /projects +total",
+        "GET",
+        "/api/v1/projects",
+        params={"published_only": "false", "include_total": "true"},
+    ),
+    Scenario("GET /assets", "GET", "/api/v1/assets", admin=True),
+    Scenario(
+        "POST /auth/login",
+        "POST",
+        "/api/v1/auth/login",
+        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+        requests=16,
+        concurrency=4,
+    ),
+]
+
+
+async def _get_db():
+    async with async_session_maker() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def _run_scenario(client: AsyncClient, scenario: Scenario, headers: Dict[str, str]):
+    latencies = []
+    queries = []
+    pending = iter(range(scenario.requests))
+
+    async def worker():
+        # Workers share one iterator, so each request is sent exactly once
+        for _ in pending:
+            start = time.perf_counter()
+            response = await client.request(
+                scenario.method,
+                scenario.path,
+                params=scenario.params,
+                json=scenario.json,
+                headers=headers if scenario.admin else None,
+            )
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+            queries.append(int(_QUERIES.search(response.headers["server-timing"]).group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(scenario.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        **{k: round(v, 2) for k, v in summarize(latencies).items()},
+        "rps": round(len(latencies) / elapsed, 1),
+        "queries_per_request": round(statistics.mean(queries), 2),
+        "max_queries": max(queries),
+    }
+
+
+def _compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any]):
+    tolerance = os.getenv("BENCHMARK_LATENCY_TOLERANCE")
+    failures = []
+
+    print(f"\nvs. baseline from {baseline['recorded_on']} ({baseline['machine']})")
+    for name, result in results.items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"  {name:<28} (no baseline)")
+            continue
+
+        ratio = result["p95"] / before["p95"] if before["p95"] else 1.0
+        print(
+            f"  {name:<28} p95 {before['p95']:8.2f}ms -> {result['p95']:8.2f}ms ({ratio:5.2f}x)"
+            f"  queries {before['queries_per_request']:5.2f} -> {result['queries_per_request']:5.2f}"
+        )
+        # Slack for cache misses of the first concurrent requests
+        if result["queries_per_request"] > before["queries_per_request"] + 0.05:
+            failures.append(f"{name}: more queries per request than the baseline")
+        if tolerance and ratio > float(tolerance):
+            failures.append(f"{name}: p95 {ratio:.2f}x the baseline")
+    return failures
+
+
+@pytest.mark.asyncio
+async def test_api_load(db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch):
+    volumes = await seed(db_session)
+
+    app.dependency_overrides[get_db] = _get_db
+    content_cache.bump()
+    principal_cache.clear()
+
+    results = {}
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            login = await client.post(
+                "/api/v1/auth/login",
+                json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+            )
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            for scenario in SCENARIOS:
+                with monkeypatch.context() as patch:
+                    if scenario.uncached:
+                        patch.setattr(content_cache, "ttl_seconds", 0)
+                    results[scenario.name] = await _run_scenario(client, scenario, headers)
+    finally:
+        app.dependency_overrides.clear()
+
+    print()
+    print(", ".join(f"{count} {name}" for name, count in volumes.items()))
+    for name, result in results.items():
+        print(
+            format_row(name, result)
+            + f"  {result['rps']:7.1f} req/s  {result['queries_per_request']:5.2f} queries/req"
+        )
+
+    failures = []
+    if BASELINE_PATH.exists():
+        failures = _compare(results, json.loads(BASELINE_PATH.read_text()))
+
+    if os.getenv("BENCHMARK_UPDATE_BASELINE") == "1":
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps({
+            "recorded_on": time.strftime("%Y-%m-%d"),
+            "machine": f"{platform.machine()}, {os.cpu_count()} CPU, Python {platform.python_version()}",
+            "volumes": volumes,
+            "scenarios": results,
+        }, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return
+
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,93 @@
+"""Image processing throughput and event-loop latency during gallery uploads.
+
+Compares Pillow work inline on the event loop with the bounded worker pool
+used by S3Service, at one worker and at one worker per core. Run with:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_image_processing.py -s
+"""
+import asyncio
+import io
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from app.config import settings
+from app.services import image_service
+from tests.benchmarks.stats import format_row, summarize
+
+IMAGES = 8
+WIDTHS = [320, 640, 1024, 1600]
+FORMATS = ["webp"]
+
+
+def _photo(seed: int) -> bytes:
+    # Noise defeats the encoder's shortcuts, like a real photo would
+    image = Image.effect_noise((3000, 2000), 40 + seed).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+async def _inline(content: bytes):
+    return image_service.process_image(content, WIDTHS, FORMATS)
+
+
+async def _pooled(content: bytes):
+    return await image_service.process_image_async(content, WIDTHS, FORMATS)
+
+
+async def _run_scenario(process, images):
+    loop_lag = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            loop_lag.append(time.perf_counter() - start - 0.005)
+
+    async def uploads():
+        await asyncio.sleep(0.02)
+        results = await asyncio.gather(*(process(content) for content in images))
+        assert all(r["variants"] for r in results)
+        done.set()
+
+    started = time.perf_counter()
+    await asyncio.gather(uploads(), ticker())
+    elapsed = time.perf_counter() - started
+
+    return summarize(loop_lag), len(images) / elapsed
+
+
+@pytest.mark.asyncio
+async def test_image_processing_pool(monkeypatch):
+    images = [_photo(i) for i in range(IMAGES)]
+    cores = os.cpu_count() or 1
+    monkeypatch.setattr(settings, "image_process_max_pending", IMAGES)
+
+    inline_lag, inline_ips = await _run_scenario(_inline, images)
+
+    results = {}
+    for workers in sorted({1, cores}):
+        monkeypatch.setattr(settings, "image_process_workers", workers)
+        image_service.shutdown_executor()
+        # Spawn and import the workers outside the measurement
+        await _pooled(images[0])
+        results[workers] = await _run_scenario(_pooled, images)
+    image_service.shutdown_executor()
+
+    print()
+    print(format_row("inline loop lag", inline_lag))
+    print(f"inline throughput: {inline_ips:.2f} images/s")
+    for workers, (lag, ips) in results.items():
+        print(format_row(f"pool x{workers} loop lag", lag))
+        print(f"pool x{workers} throughput: {ips:.2f} images/s")
+
+    pool_lag, pool_ips = results[cores]
+    # Inline processing blocks the loop for a whole image at a time
+    assert pool_lag["max"] < inline_lag["max"] / 4
+    assert pool_lag["p99"] < 50
+    if cores > 1:
+        assert pool_ips > results[1][1] * 1.3
@@ -0,0 +1,92 @@
+"""Event-loop latency of public reads while logins verify passwords.
+
+Compares bcrypt verification inline on the event loop with the bounded
+executor used by AuthService.authenticate. Run with:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_login_event_loop.py -s
+"""
+import asyncio
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.services.content_cache import ContentSnapshot, content_cache
+from app.utils.security import hash_password, verify_password, verify_password_async
+from tests.benchmarks.stats import format_row, summarize
+
+CONCURRENT_LOGINS = 8
+READERS = 4
+PASSWORD = "benchmark-password"
+
+
+async def _inline_verify(plain: str, hashed: str) -> bool:
+    return verify_password(plain, hashed)
+
+
+async def _run_scenario(verify, hashed: str):
+    content_cache.bump()
+    content_cache.set(
+        "all",
+        ContentSnapshot({"tech": {"id": "bench", "title": "Tech", "projects": []}}),
+        content_cache.version,
+    )
+
+    read_latencies = []
+    loop_lag = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            loop_lag.append(time.perf_counter() - start - 0.005)
+
+    async def reader(client: AsyncClient):
+        while not done.is_set():
+            start = time.perf_counter()
+            response = await client.get("/api/v1/content")
+            read_latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+
+    async def logins():
+        # Let the readers reach a steady state first
+        await asyncio.sleep(0.05)
+        results = await asyncio.gather(
+            *(verify(PASSWORD, hashed) for _ in range(CONCURRENT_LOGINS))
+        )
+        assert all(results)
+        done.set()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        started = time.perf_counter()
+        await asyncio.gather(
+            logins(),
+            ticker(),
+            *(reader(client) for _ in range(READERS)),
+        )
+        elapsed = time.perf_counter() - started
+
+    return summarize(read_latencies), summarize(loop_lag), len(read_latencies) / elapsed
+
+
+@pytest.mark.asyncio
+async def test_login_does_not_stall_event_loop():
+    hashed = hash_password(PASSWORD)
+
+    inline_reads, inline_lag, inline_rps = await _run_scenario(_inline_verify, hashed)
+    offloaded_reads, offloaded_lag, offloaded_rps = await _run_scenario(
+        verify_password_async, hashed
+    )
+
+    print()
+    print(f"{CONCURRENT_LOGINS} concurrent logins vs {READERS} GET /content readers")
+    print(format_row("reads, bcrypt inline", inline_reads) + f"  {inline_rps:7.1f} req/s")
+    print(format_row("reads, bcrypt offloaded", offloaded_reads) + f"  {offloaded_rps:7.1f} req/s")
+    print(format_row("loop lag, bcrypt inline", inline_lag))
+    print(format_row("loop lag, bcrypt offloaded", offloaded_lag))
+
+    assert offloaded_lag["max"] < inline_lag["max"]
+    assert offloaded_reads["max"] < inline_reads["max"]
+    assert offloaded_rps > inline_rps
@@ -0,0 +1,213 @@
+"""Cost of turning published projects into a content response body.
+
+Measures, without a database, the two serialization steps of the public
+content path at 10, 100 and 1,000 projects (10 image assets each):
+
+- build: ContentService._project_to_dict/_asset_to_dict (run when a section is
+  rebuilt) vs. a precompiled serializer that fetches fields with attrgetter
+- encode: ContentSnapshot (json.dumps + ETag, run on a cache miss) vs. orjson
+  when installed, and vs. FastAPI's default jsonable_encoder + JSONResponse
+  path that the pre-encoded snapshot avoids
+
+The guard is machine independent: per-project cost must stay roughly linear
+from 100 to 1,000 projects, and each current step must stay within
+SERIALIZATION_TOLERANCE (default 1.5x) of its ratio to plain json.dumps
+recorded in baselines/serialization.json. Run with:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_serialization.py -s
+
+Set BENCHMARK_UPDATE_BASELINE=1 to store the run as the new baseline.
+"""
+import gc
+import json
+import os
+import platform
+import time
+import uuid
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models import Asset, Project
+from app.services.content_cache import ContentSnapshot
+from app.services.content_service import ContentService
+from app.services.image_service import srcset_sources
+from tests.benchmarks.conftest import BENCHMARKS_DIR
+
+try:
+    import orjson
+except ImportError:  # optional; only compared when installed
+    orjson = None
+
+BASELINE_PATH = BENCHMARKS_DIR / "baselines" / "serialization.json"
+SCALES = (10, 100, 1000)
+ASSETS_PER_PROJECT = 10
+CDN = "https://cdn.example.com"
+
+
+def _projects(count: int) -> List[Project]:
+    published_at = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    projects = []
+    for i in range(count):
+        assets = [
+            Asset(
+                id=uuid.uuid4(),
+                filename=f"{i}-{a}.jpg",
+                file_type="image",
+                cloudfront_url=f"{CDN}/{i}-{a}.jpg",
+                thumbnail_url=f"{CDN}/{i}-{a}-thumb.jpg",
+                width=1600,
+                height=1067,
+                alt_text=f"Photo {a} of gig {i}",
+                extra_data={"variants": [
+                    {"format": fmt, "width": w, "url": f"{CDN}/{i}-{a}-{w}w.{fmt}"}
+                    for fmt in ("avif", "webp")
+                    for w in (320, 640, 1024)
+                ]},
+            )
+            for a in range(ASSETS_PER_PROJECT)
+        ]
+        projects.append(Project(
+            id=uuid.uuid4(),
+            slug=f"gig-{i}",
+            title=f"Gig {i} — Nachtschicht",
+            subtitle="Collective · Berlin",
+            description="Four hours of deep, hypnotic techno. " * 4,
+            content={"date": "2024-05-01", "time": "23:00", "genre": ["techno", "house"]},
+            thumbnail_url=f"{CDN}/gigs/{i}.jpg",
+            is_featured=i % 7 == 0,
+            tags=["gig", "techno"],
+            extra_data={"type": "gig", "location": "Berlin"},
+            published_at=published_at,
+            assets=assets,
+        ))
+    return projects
+
+
+_ASSET_FIELDS = (
+    "filename", "file_type", "cloudfront_url", "thumbnail_url",
+    "width", "height", "duration", "alt_text", "caption",
+)
+_PROJECT_FIELDS = (
+    "slug", "title", "subtitle", "description", "content", "thumbnail_url", "is_featured",
+)
+# One C-level call fetches every plain column instead of one lookup per key
+_get_asset_fields = attrgetter(*_ASSET_FIELDS)
+_get_project_fields = attrgetter(*_PROJECT_FIELDS)
+
+
+def _precompiled_asset(asset: Asset) -> Dict[str, Any]:
+    data = {"id": str(asset.id)}
+    data.update(zip(_ASSET_FIELDS, _get_asset_fields(asset)))
+    data["sources"] = srcset_sources((asset.extra_data or {}).get("variants"))
+    return data
+
+
+def _precompiled_project(project: Project) -> Dict[str, Any]:
+    data = {"id": str(project.id)}
+    data.update(zip(_PROJECT_FIELDS, _get_project_fields(project)))
+    published_at = project.published_at
+    data["tags"] = project.tags or []
+    data["extra_data"] = project.extra_data
+    data["published_at"] = published_at.isoformat() if published_at else None
+    data["assets"] = [_precompiled_asset(a) for a in project.assets]
+    return data
+
+
+def _document(projects: List[Project], to_dict: Callable[[Project], Dict[str, Any]]):
+    return {"id": "section", "title": "DJ", "description": None,
+            "projects": [to_dict(p) for p in projects]}
+
+
+def _fastapi_default(document: Dict[str, Any]) -> bytes:
+    # What FastAPI does with a dict returned from a route
+    return JSONResponse(jsonable_encoder(document)).body
+
+
+def _best_of(func: Callable[[], Any], min_time: float = 0.2, repeat: int = 5) -> float:
+    """Fastest average time of one call, in milliseconds (GC off, as in timeit)."""
+    start = time.perf_counter()
+    func()
+    loops = max(1, int(min_time / max(time.perf_counter() - start, 1e-6) / repeat))
+
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            best = min(best, (time.perf_counter() - start) / loops)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def _measure(count: int) -> Dict[str, float]:
+    projects = _projects(count)
+    document = _document(projects, ContentService._project_to_dict)
+
+    # The candidates must produce exactly what they would replace
+    assert _document(projects, _precompiled_project) == document
+    snapshot_body = ContentSnapshot(document).body
+    assert json.loads(_fastapi_default(document)) == json.loads(snapshot_body)
+
+    results = {
+        "json.dumps": _best_of(lambda: json.dumps(document)),
+        "build": _best_of(lambda: _document(projects, ContentService._project_to_dict)),
+        "build precompiled": _best_of(lambda: _document(projects, _precompiled_project)),
+        "encode snapshot": _best_of(lambda: ContentSnapshot(document)),
+        "encode fastapi default": _best_of(lambda: _fastapi_default(document)),
+    }
+    if orjson is not None:
+        assert json.loads(orjson.dumps(document)) == json.loads(snapshot_body)
+        results["encode orjson"] = _best_of(lambda: orjson.dumps(document))
+    return {name: round(ms, 4) for name, ms in results.items()}
+
+
+def test_serialization_hot_path():
+    results = {str(count): _measure(count) for count in SCALES}
+
+    print()
+    print(f"{'ms per call':<24}" + "".join(f"{count:>12} proj" for count in SCALES))
+    for name in results[str(SCALES[-1])]:
+        print(f"{name:<24}" + "".join(f"{results[str(c)][name]:>17.3f}" for c in SCALES))
+
+    # Cost relative to plain json.dumps of the same document on this machine
+    ratios = {
+        step: round(results["1000"][step] / results["1000"]["json.dumps"], 3)
+        for step in ("build", "encode snapshot")
+    }
+    print("ratio to json.dumps at 1000 projects: " + ", ".join(f"{k}={v}" for k, v in ratios.items()))
+
+    failures = []
+    for step in ("build", "encode snapshot"):
+        per_project_100 = results["100"][step] / 100
+        per_project_1000 = results["1000"][step] / 1000
+        if per_project_1000 > 2 * per_project_100:
+            failures.append(f"{step}: per-project cost grows with size ({per_project_100:.4f} -> {per_project_1000:.4f} ms)")
+
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text())
+        tolerance = float(os.getenv("SERIALIZATION_TOLERANCE", "1.5"))
+        for step, ratio in ratios.items():
+            before = baseline["ratios"][step]
+            print(f"  {step:<20} {before:.3f} -> {ratio:.3f} x json.dumps")
+            if ratio > before * tolerance:
+                failures.append(f"{step}: {ratio:.3f}x json.dumps, baseline {before:.3f}x")
+
+    if os.getenv("BENCHMARK_UPDATE_BASELINE") == "1":
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps({
+            "recorded_on": time.strftime("%Y-%m-%d"),
+            "machine": f"{platform.machine()}, {os.cpu_count()} CPU, Python {platform.python_version()}",
+            "ratios": ratios,
+            "ms": results,
+        }, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return
+
+    assert not failures, "\n".join(failures)
@@ -1,6 +1,10 @@
 import asyncio
+import io
 import os
-from typing import AsyncGenerator, Generator
+import threading
+import time
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, ContextManager, Generator
 
 import pytest
 import pytest_asyncio
@@ -9,8 +13,14 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.config import settings
 from app.database import Base, get_db
+from app.api.v1.auth import login_email_rate_limiter, login_rate_limiter
 from app.main import app
 from app.models import Asset, Project, Section, User
+from app.services.auth_service import principal_cache
+from app.services.health_service import health_service
+from app.services.content_cache import content_cache
+from app.services.s3_service import s3_service
+from app.utils.query_stats import QueryStats, instrument_engine, track_queries
 from app.utils.security import hash_password
 
 
@@ -22,6 +32,7 @@ if not TEST_DATABASE_URL:
     )
 
 engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+instrument_engine(engine)
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -29,6 +40,88 @@ async_session_maker = async_sessionmaker(
 )
 
 
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client calls S3Service makes."""
+
+    def __init__(self, latency: float = 0.0):
+        # Simulated network time per call; blocks the calling thread like boto3
+        self.latency = latency
+        self.objects = {}
+        self.multipart_uploads = {}
+        self.aborted_uploads = []
+        self.max_part_size = 0
+        # Most put_object calls seen running at once (they run on threads)
+        self.max_concurrent_puts = 0
+        self._puts_in_flight = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        with self._lock:
+            self._puts_in_flight += 1
+            self.max_concurrent_puts = max(self.max_concurrent_puts, self._puts_in_flight)
+        try:
+            time.sleep(self.latency)
+            self.objects[Key] = {"Body": Body, **kwargs}
+        finally:
+            with self._lock:
+                self._puts_in_flight -= 1
+        return {"ETag": f'"{len(Body)}"'}
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        upload_id = f"upload-{len(self.multipart_uploads) + len(self.aborted_uploads)}"
+        self.multipart_uploads[upload_id] = {"Key": Key, "Parts": {}, **kwargs}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        time.sleep(self.latency)
+        self.max_part_size = max(self.max_part_size, len(Body))
+        self.multipart_uploads[UploadId]["Parts"][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        upload = self.multipart_uploads.pop(UploadId)
+        parts = upload.pop("Parts")
+        body = b"".join(parts[p["PartNumber"]] for p in MultipartUpload["Parts"])
+        self.objects[Key] = {"Body": body, **{k: v for k, v in upload.items() if k != "Key"}}
+        return {"ETag": f'"{len(body)}"'}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.multipart_uploads.pop(UploadId, None)
+        self.aborted_uploads.append(UploadId)
+        return {}
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+        query = "&".join(f"{k}={v}" for k, v in Params.items() if k not in ("Bucket", "Key"))
+        return f"https://{Params['Bucket']}.s3.test/{Params['Key']}?{ClientMethod}&{query}"
+
+    def head_bucket(self, Bucket):
+        time.sleep(self.latency)
+        return {}
+
+    def head_object(self, Bucket, Key):
+        time.sleep(self.latency)
+        if Key not in self.objects:
+            from botocore.exceptions import ClientError
+
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": len(self.objects[Key]["Body"])}
+
+    def get_object(self, Bucket, Key):
+        time.sleep(self.latency)
+        return {"Body": io.BytesIO(self.objects[Key]["Body"])}
+
+    def delete_object(self, Bucket, Key):
+        time.sleep(self.latency)
+        self.objects.pop(Key, None)
+        return {}
+
+    def delete_objects(self, Bucket, Delete):
+        time.sleep(self.latency)
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     loop = asyncio.get_event_loop_policy().new_event_loop()
@@ -51,9 +144,19 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db():
-        yield db_session
+        # Like get_db, a failed request leaves the shared session usable
+        try:
+            yield db_session
+        except Exception:
+            await db_session.rollback()
+            raise
 
     app.dependency_overrides[get_db] = override_get_db
+    content_cache.bump()
+    principal_cache.clear()
+    login_rate_limiter.clear()
+    login_email_rate_limiter.clear()
+    health_service.clear()
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -102,3 +205,26 @@ async def auth_headers(client: AsyncClient, test_user: User) -> dict:
     )
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], ContextManager[QueryStats]]:
+    """``with assert_max_queries(n):`` fails if the block runs more than n statements."""
+
+    @contextmanager
+    def check(limit: int):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"{stats.count} queries, expected at most {limit}:\n"
+            + "\n".join(f"{n}x {sql}" for sql, n in stats.statements.most_common())
+        )
+
+    return check
+
+
+@pytest.fixture
+def fake_s3(monkeypatch: pytest.MonkeyPatch) -> FakeS3Client:
+    client = FakeS3Client()
+    monkeypatch.setattr(s3_service, "_s3_client", client)
+    return client
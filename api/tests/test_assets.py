@@ -0,0 +1,421 @@
+import asyncio
+import io
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import assets as assets_routes
+from app.config import settings
+from app.models import Asset
+from app.services.asset_blob_service import AssetBlobService
+from app.services.job_service import JobService
+from app.services.s3_service import MIN_MULTIPART_PART_SIZE
+from tests.conftest import async_session_maker
+
+
+@pytest.mark.asyncio
+async def test_upload_asset(client: AsyncClient, auth_headers: dict, fake_s3):
+    response = await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": ("press-kit.pdf", b"%PDF-1.4 test", "application/pdf")},
+        data={"alt_text": "Press kit"},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["file_type"] == "document"
+    assert data["file_size"] == len(b"%PDF-1.4 test")
+    assert data["alt_text"] == "Press kit"
+    assert data["processing_status"] == "ready"
+    assert fake_s3.objects[data["s3_key"]]["Body"] == b"%PDF-1.4 test"
+
+
+@pytest.mark.asyncio
+async def test_upload_asset_rejects_mime_type(client: AsyncClient, auth_headers: dict, fake_s3):
+    response = await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": ("script.sh", b"echo hi", "text/x-shellscript")},
+    )
+
+    assert response.status_code == 400
+    assert fake_s3.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_upload_large_asset_streams_multipart(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "s3_multipart_part_size", MIN_MULTIPART_PART_SIZE)
+    body = b"\x00" * (MIN_MULTIPART_PART_SIZE * 2 + 1024)
+
+    response = await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": ("reel.mp4", body, "video/mp4")},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["file_size"] == len(body)
+    assert fake_s3.objects[data["s3_key"]]["Body"] == body
+    # Never more than one part held per upload call
+    assert fake_s3.max_part_size == MIN_MULTIPART_PART_SIZE
+
+
+@pytest.mark.asyncio
+async def test_upload_asset_too_large_aborts_multipart(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "s3_multipart_part_size", MIN_MULTIPART_PART_SIZE)
+    monkeypatch.setattr(assets_routes, "MAX_FILE_SIZE", MIN_MULTIPART_PART_SIZE + 1)
+    body = b"\x00" * (MIN_MULTIPART_PART_SIZE * 3)
+
+    response = await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": ("reel.mp4", body, "video/mp4")},
+    )
+
+    assert response.status_code == 413
+    assert fake_s3.objects == {}
+    assert fake_s3.multipart_uploads == {}
+    assert len(fake_s3.aborted_uploads) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_multiple_assets_concurrently(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+):
+    fake_s3.latency = 0.05
+    files = [
+        ("files", (f"doc-{i}.pdf", f"%PDF-1.4 {i}".encode(), "application/pdf"))
+        for i in range(5)
+    ]
+
+    response = await client.post(
+        "/api/v1/assets/upload-multiple",
+        headers=auth_headers,
+        files=files,
+    )
+
+    assert response.status_code == 201
+    assert len(response.json()) == 5
+    assert len(fake_s3.objects) == 5
+    # Sequential uploads would never overlap
+    assert fake_s3.max_concurrent_puts > 1
+
+
+@pytest.mark.asyncio
+async def test_delete_asset(client: AsyncClient, auth_headers: dict, fake_s3):
+    response = await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": ("press-kit.pdf", b"%PDF-1.4 test", "application/pdf")},
+    )
+    asset = response.json()
+
+    response = await client.delete(f"/api/v1/assets/{asset['id']}", headers=auth_headers)
+
+    assert response.status_code == 204
+    assert asset["s3_key"] not in fake_s3.objects
+
+
+@pytest.mark.asyncio
+async def test_update_asset_merges_extra_data_and_keeps_variants(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+):
+    variants = [{"format": "webp", "width": 320, "key": "assets/a-320w.webp", "url": "https://cdn/a-320w.webp"}]
+    asset = Asset(
+        filename="a.jpg",
+        original_filename="a.jpg",
+        file_type="image",
+        mime_type="image/jpeg",
+        file_size=1,
+        s3_key="assets/a.jpg",
+        s3_bucket="bucket",
+        cloudfront_url="https://cdn/assets/a.jpg",
+        extra_data={"variants": variants, "credit": "Old"},
+    )
+    db_session.add(asset)
+    await db_session.commit()
+
+    response = await client.put(
+        f"/api/v1/assets/{asset.id}",
+        headers=auth_headers,
+        json={"extra_data": {"credit": "New", "location": "Berlin", "variants": []}},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["extra_data"] == {
+        "variants": variants,
+        "credit": "New",
+        "location": "Berlin",
+    }
+
+
+@pytest.mark.asyncio
+async def test_presigned_upload_and_finalize(client: AsyncClient, auth_headers: dict, fake_s3):
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 600), "red").save(buffer, format="JPEG")
+    body = buffer.getvalue()
+
+    response = await client.post(
+        "/api/v1/assets/uploads",
+        headers=auth_headers,
+        json={"filename": "cover.jpg", "content_type": "image/jpeg", "file_size": len(body)},
+    )
+    assert response.status_code == 201
+    upload = response.json()
+    assert upload["method"] == "PUT"
+    assert upload["s3_key"] in upload["url"]
+
+    # The browser PUTs the bytes straight to S3
+    fake_s3.put_object(Bucket=settings.s3_bucket, Key=upload["s3_key"], Body=body)
+
+    response = await client.post(
+        "/api/v1/assets/uploads/complete",
+        headers=auth_headers,
+        json={"upload_token": upload["upload_token"], "alt_text": "Cover"},
+    )
+    assert response.status_code == 201
+    asset = response.json()
+    assert asset["s3_key"] == upload["s3_key"]
+    assert asset["file_size"] == len(body)
+    assert asset["processing_status"] == "pending"
+    assert asset["alt_text"] == "Cover"
+
+    response = await client.post(
+        "/api/v1/assets/uploads/complete",
+        headers=auth_headers,
+        json={"upload_token": upload["upload_token"]},
+    )
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_presigned_multipart_upload(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "s3_multipart_part_size", MIN_MULTIPART_PART_SIZE)
+    body = b"\x00" * (MIN_MULTIPART_PART_SIZE + 1024)
+
+    response = await client.post(
+        "/api/v1/assets/uploads",
+        headers=auth_headers,
+        json={"filename": "reel.mp4", "content_type": "video/mp4", "file_size": len(body)},
+    )
+    assert response.status_code == 201
+    upload = response.json()
+    assert upload["method"] == "MULTIPART"
+    assert [p["part_number"] for p in upload["parts"]] == [1, 2]
+
+    upload_id = next(iter(fake_s3.multipart_uploads))
+    parts = []
+    for part in upload["parts"]:
+        offset = (part["part_number"] - 1) * upload["part_size"]
+        result = fake_s3.upload_part(
+            Bucket=settings.s3_bucket,
+            Key=upload["s3_key"],
+            UploadId=upload_id,
+            PartNumber=part["part_number"],
+            Body=body[offset:offset + upload["part_size"]],
+        )
+        parts.append({"part_number": part["part_number"], "etag": result["ETag"]})
+
+    response = await client.post(
+        "/api/v1/assets/uploads/complete",
+        headers=auth_headers,
+        json={"upload_token": upload["upload_token"], "parts": parts},
+    )
+    assert response.status_code == 201
+    assert response.json()["file_size"] == len(body)
+    assert fake_s3.objects[upload["s3_key"]]["Body"] == body
+
+
+@pytest.mark.asyncio
+async def test_presigned_upload_rejects_disallowed_and_oversize(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+):
+    response = await client.post(
+        "/api/v1/assets/uploads",
+        headers=auth_headers,
+        json={"filename": "run.sh", "content_type": "text/x-shellscript", "file_size": 10},
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        "/api/v1/assets/uploads",
+        headers=auth_headers,
+        json={
+            "filename": "huge.mp4",
+            "content_type": "video/mp4",
+            "file_size": assets_routes.MAX_FILE_SIZE + 1,
+        },
+    )
+    assert response.status_code == 413
+
+    response = await client.post(
+        "/api/v1/assets/uploads/complete",
+        headers=auth_headers,
+        json={"upload_token": "not-a-token"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_shares_stored_object(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+):
+    uploads = []
+    for _ in range(2):
+        response = await client.post(
+            "/api/v1/assets/upload",
+            headers=auth_headers,
+            files={"file": ("press-kit.pdf", b"%PDF-1.4 same", "application/pdf")},
+        )
+        assert response.status_code == 201
+        uploads.append(response.json())
+
+    first, second = uploads
+    assert first["id"] != second["id"]
+    assert first["s3_key"] == second["s3_key"]
+    assert list(fake_s3.objects) == [first["s3_key"]]
+
+    # The object is reference counted; it goes with the last asset
+    await client.delete(f"/api/v1/assets/{first['id']}", headers=auth_headers)
+    assert first["s3_key"] in fake_s3.objects
+    await client.delete(f"/api/v1/assets/{second['id']}", headers=auth_headers)
+    assert fake_s3.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_found_blob_survives_concurrent_release(db_session: AsyncSession):
+    content_hash = "ab" * 32
+    await AssetBlobService.acquire(db_session, content_hash, "assets/kit.pdf")
+    await db_session.commit()
+
+    async with async_session_maker() as uploader, async_session_maker() as deleter:
+        # The upload found the content and will skip its own S3 write
+        assert await AssetBlobService.find_key(uploader, content_hash) == "assets/kit.pdf"
+
+        release = asyncio.create_task(AssetBlobService.release(deleter, content_hash))
+        await asyncio.sleep(0.2)
+        assert not release.done()
+
+        await AssetBlobService.acquire(uploader, content_hash, "assets/kit.pdf")
+        await uploader.commit()
+
+        # The delete sees the upload's reference and keeps the objects
+        assert await release is False
+        await deleter.commit()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_image_reuses_processed_metadata(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session,
+    fake_s3,
+):
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 600), "red").save(buffer, format="JPEG")
+    files = {"file": ("gig.jpg", buffer.getvalue(), "image/jpeg")}
+
+    await client.post("/api/v1/assets/upload", headers=auth_headers, files=files)
+    assert await JobService.run_pending(db_session) == 1
+    stored_objects = len(fake_s3.objects)
+
+    response = await client.post("/api/v1/assets/upload", headers=auth_headers, files=files)
+    duplicate = response.json()
+
+    assert duplicate["processing_status"] == "ready"
+    assert (duplicate["width"], duplicate["height"]) == (800, 600)
+    assert duplicate["thumbnail_url"].endswith("-thumb.jpg")
+    assert await JobService.run_pending(db_session) == 0
+    assert len(fake_s3.objects) == stored_objects
+
+
+@pytest.mark.asyncio
+async def test_duplicate_multipart_upload_is_aborted(
+    client: AsyncClient,
+    auth_headers: dict,
+    fake_s3,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "s3_multipart_part_size", MIN_MULTIPART_PART_SIZE)
+    body = b"\x01" * (MIN_MULTIPART_PART_SIZE + 1024)
+
+    keys = []
+    for _ in range(2):
+        response = await client.post(
+            "/api/v1/assets/upload",
+            headers=auth_headers,
+            files={"file": ("reel.mp4", body, "video/mp4")},
+        )
+        keys.append(response.json()["s3_key"])
+
+    assert keys[0] == keys[1]
+    assert list(fake_s3.objects) == [keys[0]]
+    assert len(fake_s3.aborted_uploads) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_assets_keyset_pagination(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session,
+):
+    # Inserted in one transaction, so created_at ties and id breaks them
+    db_session.add_all([
+        Asset(
+            filename=f"{i}.pdf",
+            original_filename=f"{i}.pdf",
+            file_type="document",
+            mime_type="application/pdf",
+            file_size=1,
+            s3_key=f"assets/{i}.pdf",
+            s3_bucket="bucket",
+            cloudfront_url=f"https://cdn/assets/{i}.pdf",
+        )
+        for i in range(7)
+    ])
+    await db_session.commit()
+
+    ids = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/assets", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        ids.extend(a["id"] for a in data["items"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(set(ids)) == 7
+    assert ids == sorted(ids, reverse=True)
@@ -1,7 +1,11 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.auth import login_email_rate_limiter, login_rate_limiter
+from app.config import settings
 from app.models import User
+from app.services.auth_service import AuthService
 
 
 @pytest.mark.asyncio
@@ -54,3 +58,144 @@ async def test_get_current_user_no_auth(client: AsyncClient):
     response = await client.get("/api/v1/auth/me")
 
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_current_user_served_from_principal_cache(
+    client: AsyncClient,
+    auth_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    lookups = []
+    original = AuthService.get_user_by_id
+
+    async def counting_get_user_by_id(db, user_id):
+        lookups.append(user_id)
+        return await original(db, user_id)
+
+    monkeypatch.setattr(AuthService, "get_user_by_id", counting_get_user_by_id)
+
+    for _ in range(3):
+        response = await client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+
+    assert len(lookups) == 1
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_rejected_despite_cache(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_user: User,
+):
+    assert (await client.get("/api/v1/auth/me", headers=auth_headers)).status_code == 200
+
+    test_user.is_active = False
+    await db_session.commit()
+
+    response = await client.get("/api/v1/auth/me", headers=auth_headers)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_role_change_rejected_despite_cache(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_user: User,
+):
+    payload = {"slug": "dj", "title": "DJ"}
+    assert (await client.post("/api/v1/sections", headers=auth_headers, json=payload)).status_code == 201
+
+    test_user.role = "editor"
+    await db_session.commit()
+
+    payload = {"slug": "music", "title": "Music"}
+    response = await client.post("/api/v1/sections", headers=auth_headers, json=payload)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limited(
+    client: AsyncClient,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(login_rate_limiter, "max_attempts", 3)
+
+    for _ in range(3):
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": "test@example.com", "password": "wrongpassword"},
+        )
+        assert response.status_code == 401
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "testpassword123"},
+    )
+
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limit_counts_only_failures(
+    client: AsyncClient,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(login_rate_limiter, "max_attempts", 3)
+
+    for _ in range(5):
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": "test@example.com", "password": "testpassword123"},
+        )
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_login_email_limit_spans_ips(
+    client: AsyncClient,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(login_rate_limiter, "max_attempts", 2)
+    monkeypatch.setattr(login_email_rate_limiter, "max_attempts", 4)
+    wrong = {"email": "test@example.com", "password": "wrongpassword"}
+    right = {"email": "test@example.com", "password": "testpassword123"}
+
+    statuses = [(await client.post("/api/v1/auth/login", json=wrong)).status_code for _ in range(3)]
+    assert statuses == [401, 401, 429]
+
+    # The owner on another IP is not locked out by that client
+    login_rate_limiter.clear()
+    assert (await client.post("/api/v1/auth/login", json=right)).status_code == 200
+
+    # Guesses spread over many IPs still hit the per-email limit
+    for _ in range(2):
+        login_rate_limiter.clear()
+        assert (await client.post("/api/v1/auth/login", json=wrong)).status_code == 401
+    login_rate_limiter.clear()
+    assert (await client.post("/api/v1/auth/login", json=right)).status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_login_sheds_load_when_hasher_busy(
+    client: AsyncClient,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "password_hash_max_pending", 0)
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "testpassword123"},
+    )
+
+    assert response.status_code == 503
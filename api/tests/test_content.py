@@ -0,0 +1,313 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset, Project, PublishedSection, Section
+from app.services.content_service import ContentService
+from tests.conftest import async_session_maker, engine
+
+
+@pytest.mark.asyncio
+async def test_get_all_content_only_published(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    db_session.add_all([
+        Project(section=test_section, slug="live", title="Live", is_published=True),
+        Project(section=test_section, slug="draft", title="Draft", is_published=False),
+    ])
+    await db_session.flush()
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    response = await client.get("/api/v1/content")
+
+    assert response.status_code == 200
+    projects = response.json()["tech"]["projects"]
+    assert [p["slug"] for p in projects] == ["live"]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_loads_only_published_projects(
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    def asset(project: Project, name: str) -> Asset:
+        return Asset(
+            project=project,
+            filename=name,
+            original_filename=name,
+            file_type="image",
+            mime_type="image/jpeg",
+            file_size=1,
+            s3_key=f"assets/{name}",
+            s3_bucket="bucket",
+            cloudfront_url=f"https://cdn/assets/{name}",
+        )
+
+    second = Project(section=test_section, slug="second", title="Second", display_order=2, is_published=True)
+    first = Project(section=test_section, slug="first", title="First", display_order=1, is_published=True)
+    drafts = [
+        Project(section=test_section, slug=f"draft-{i}", title="Draft", display_order=0, is_published=False)
+        for i in range(5)
+    ]
+    db_session.add_all([first, second, *drafts])
+    db_session.add_all([asset(first, "a.jpg"), *(asset(d, f"{d.slug}.jpg") for d in drafts)])
+    await db_session.commit()
+
+    statements = []
+    loaded = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def count_row(target, context):
+        loaded.append(target.filename if isinstance(target, Asset) else target.slug)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    event.listen(Project, "load", count_row)
+    event.listen(Asset, "load", count_row)
+    try:
+        async with async_session_maker() as session:
+            await ContentService._rebuild_section(session, test_section.id)
+            await session.commit()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+        event.remove(Project, "load", count_row)
+        event.remove(Asset, "load", count_row)
+
+    # section, published projects, their assets, delete + insert read model
+    assert len(statements) == 5
+    assert sorted(loaded) == ["a.jpg", "first", "second"]
+
+    row = await db_session.get(PublishedSection, "tech", populate_existing=True)
+    assert [p["slug"] for p in row.document["projects"]] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rebuilds_of_one_section(
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    db_session.add(Project(section=test_section, slug="live", title="Live", is_published=True))
+    await db_session.commit()
+
+    async with async_session_maker() as first, async_session_maker() as second:
+        await ContentService._rebuild_section(first, test_section.id)
+
+        # Would otherwise miss the first one's row and fail on the slug key
+        rebuild = asyncio.create_task(ContentService._rebuild_section(second, test_section.id))
+        await asyncio.sleep(0.2)
+        assert not rebuild.done()
+
+        await first.commit()
+        await rebuild
+        await second.commit()
+
+    row = await db_session.get(PublishedSection, "tech", populate_existing=True)
+    assert [p["slug"] for p in row.document["projects"]] == ["live"]
+
+
+@pytest.mark.asyncio
+async def test_draft_writes_skip_rebuild(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_section: Section,
+    fake_s3,
+):
+    response = await client.post(
+        "/api/v1/projects",
+        headers=auth_headers,
+        json={"section_id": str(test_section.id), "slug": "draft", "title": "Draft"},
+    )
+    draft_id = response.json()["id"]
+
+    rebuilds = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "published_sections" in statement:
+            rebuilds.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        await client.put(f"/api/v1/projects/{draft_id}", headers=auth_headers, json={"title": "Still a draft"})
+        await client.post(
+            "/api/v1/assets/upload",
+            headers=auth_headers,
+            files={"file": ("kit.pdf", b"%PDF-1.4", "application/pdf")},
+            data={"project_id": draft_id},
+        )
+        assert rebuilds == []
+
+        await client.post(f"/api/v1/projects/{draft_id}/publish", headers=auth_headers)
+        assert rebuilds
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_content_served_from_cache(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    project = Project(section=test_section, slug="live", title="Live", is_published=True)
+    db_session.add(project)
+    await db_session.flush()
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    first = await client.get("/api/v1/content/tech")
+
+    # Rebuilding the read model without invalidating keeps the old snapshot
+    project.title = "Changed"
+    await db_session.flush()
+    await ContentService._rebuild_section(db_session, test_section.id)
+    await db_session.commit()
+
+    second = await client.get("/api/v1/content/tech")
+
+    assert first.json() == second.json()
+    assert second.json()["projects"][0]["title"] == "Live"
+
+
+@pytest.mark.asyncio
+async def test_content_cache_invalidated_by_admin_write(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    project = Project(section=test_section, slug="live", title="Live", is_published=True)
+    db_session.add(project)
+    await db_session.flush()
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    await client.get("/api/v1/content")
+
+    response = await client.put(
+        f"/api/v1/projects/{project.id}",
+        headers=auth_headers,
+        json={"title": "Updated"},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/content")
+    assert response.json()["tech"]["projects"][0]["title"] == "Updated"
+
+    response = await client.post(
+        f"/api/v1/projects/{project.id}/unpublish",
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/content")
+    assert response.json()["tech"]["projects"] == []
+
+
+@pytest.mark.asyncio
+async def test_content_etag_not_modified(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    db_session.add(Project(section=test_section, slug="live", title="Live", is_published=True))
+    await db_session.flush()
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    response = await client.get("/api/v1/content/tech")
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    response = await client.get(
+        "/api/v1/content/tech",
+        headers={"If-None-Match": f'W/"stale", {etag}'},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_content_etag_changes_after_write(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    project = Project(section=test_section, slug="live", title="Live", is_published=True)
+    db_session.add(project)
+    await db_session.flush()
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    etag = (await client.get("/api/v1/content")).headers["etag"]
+
+    await client.put(
+        f"/api/v1/projects/{project.id}",
+        headers=auth_headers,
+        json={"title": "Updated"},
+    )
+
+    response = await client.get("/api/v1/content", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_published_section_rebuilt_on_publish(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/projects",
+        headers=auth_headers,
+        json={"section_id": str(test_section.id), "slug": "gig", "title": "Gig"},
+    )
+    project_id = response.json()["id"]
+
+    row = await db_session.get(PublishedSection, "tech", populate_existing=True)
+    assert row.document["projects"] == []
+
+    await client.post(f"/api/v1/projects/{project_id}/publish", headers=auth_headers)
+
+    row = await db_session.get(PublishedSection, "tech", populate_existing=True)
+    assert [p["slug"] for p in row.document["projects"]] == ["gig"]
+
+
+@pytest.mark.asyncio
+async def test_inactive_section_removed_from_content(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_section: Section,
+):
+    await client.put(
+        f"/api/v1/sections/{test_section.id}",
+        headers=auth_headers,
+        json={"title": "Technology"},
+    )
+    assert (await client.get("/api/v1/content/tech")).status_code == 200
+
+    await client.put(
+        f"/api/v1/sections/{test_section.id}",
+        headers=auth_headers,
+        json={"is_active": False},
+    )
+
+    assert (await client.get("/api/v1/content/tech")).status_code == 404
+    assert "tech" not in (await client.get("/api/v1/content")).json()
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.database import _pool_kwargs, discard_idle_connections
+from tests.conftest import TEST_DATABASE_URL
+
+
+def test_lambda_pool_kwargs(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "db_lambda_pool_size", 2)
+    monkeypatch.setattr(settings, "db_lambda_max_overflow", 0)
+
+    kwargs = _pool_kwargs(lambda_mode=True)
+
+    assert kwargs["pool_size"] == 2
+    assert kwargs["max_overflow"] == 0
+    assert kwargs["pool_pre_ping"] is True
+
+
+def test_lambda_pool_can_be_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "db_lambda_pool_size", 0)
+
+    assert _pool_kwargs(lambda_mode=True) == {"poolclass": NullPool}
+
+
+async def _backend_pid(engine) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT pg_backend_pid()"))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_warm_connection_reused():
+    engine = create_async_engine(TEST_DATABASE_URL, pool_size=1, max_overflow=0)
+    discard_idle_connections(engine, idle_timeout=60)
+
+    try:
+        assert await _backend_pid(engine) == await _backend_pid(engine)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_replaced_after_thaw():
+    engine = create_async_engine(TEST_DATABASE_URL, pool_size=1, max_overflow=0)
+    discard_idle_connections(engine, idle_timeout=-1)
+
+    try:
+        first = await _backend_pid(engine)
+        second = await _backend_pid(engine)
+
+        assert first != second
+        assert engine.pool.checkedin() == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Project, Section
+from app.services.content_cache import ContentSnapshot, content_cache
+from app.services.content_service import ContentService
+from app.services.export_service import (
+    IMMUTABLE_CACHE_CONTROL,
+    MANIFEST_CACHE_CONTROL,
+    MANIFEST_KEY,
+)
+
+
+@pytest.mark.asyncio
+async def test_export_content(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+    fake_s3,
+):
+    db_session.add(Project(section=test_section, slug="live", title="Live", is_published=True))
+    await db_session.flush()
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    response = await client.post("/api/v1/content/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    manifest = response.json()
+    assert set(manifest["sections"]) == {"tech"}
+
+    stored_manifest = fake_s3.objects[MANIFEST_KEY]
+    assert stored_manifest["CacheControl"] == MANIFEST_CACHE_CONTROL
+    assert json.loads(stored_manifest["Body"]) == manifest
+
+    tech_key = manifest["sections"]["tech"].split("/", 3)[-1]
+    all_key = manifest["content"].split("/", 3)[-1]
+    assert fake_s3.objects[tech_key]["CacheControl"] == IMMUTABLE_CACHE_CONTROL
+
+    # Exported bytes are exactly what the API serves
+    assert fake_s3.objects[tech_key]["Body"] == (await client.get("/api/v1/content/tech")).content
+    assert fake_s3.objects[all_key]["Body"] == (await client.get("/api/v1/content")).content
+
+
+@pytest.mark.asyncio
+async def test_export_keys_change_only_with_content(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_section: Section,
+    fake_s3,
+):
+    await client.put(
+        f"/api/v1/sections/{test_section.id}",
+        headers=auth_headers,
+        json={"title": "Technology"},
+    )
+
+    first = (await client.post("/api/v1/content/export", headers=auth_headers)).json()
+    second = (await client.post("/api/v1/content/export", headers=auth_headers)).json()
+    assert first["sections"] == second["sections"]
+
+    await client.put(
+        f"/api/v1/sections/{test_section.id}",
+        headers=auth_headers,
+        json={"title": "Tech"},
+    )
+
+    third = (await client.post("/api/v1/content/export", headers=auth_headers)).json()
+    assert third["sections"]["tech"] != first["sections"]["tech"]
+    assert third["version"] != first["version"]
+
+
+@pytest.mark.asyncio
+async def test_export_ignores_process_cache(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+    fake_s3,
+):
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+    # A snapshot cached before another instance's write
+    content_cache.set("all", ContentSnapshot({"tech": {"stale": True}}), content_cache.version)
+    content_cache.set("section:tech", ContentSnapshot({"stale": True}), content_cache.version)
+
+    manifest = (await client.post("/api/v1/content/export", headers=auth_headers)).json()
+
+    all_key = manifest["content"].split("/", 3)[-1]
+    tech_key = manifest["sections"]["tech"].split("/", 3)[-1]
+    assert "stale" not in json.loads(fake_s3.objects[all_key]["Body"])["tech"]
+    assert json.loads(fake_s3.objects[tech_key]["Body"])["slug"] == "tech"
+
+
+@pytest.mark.asyncio
+async def test_export_requires_admin(client: AsyncClient, fake_s3):
+    response = await client.post("/api/v1/content/export")
+
+    assert response.status_code == 403
+    assert fake_s3.objects == {}
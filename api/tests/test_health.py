@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app import database
+from app.config import settings
+from tests.conftest import async_session_maker, engine
+
+
+@pytest.fixture
+def probe_test_database(monkeypatch: pytest.MonkeyPatch):
+    # The probes use the application's engine; point it at the test database
+    monkeypatch.setattr(database, "_engine", engine)
+    monkeypatch.setattr(database, "_session_maker", async_session_maker)
+
+
+@pytest.mark.asyncio
+async def test_readiness_ok_and_cached(
+    client: AsyncClient,
+    fake_s3,
+    probe_test_database,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls = []
+    head_bucket = fake_s3.head_bucket
+    monkeypatch.setattr(fake_s3, "head_bucket", lambda **kw: calls.append(kw) or head_bucket(**kw))
+
+    responses = await asyncio.gather(*(client.get("/health/ready") for _ in range(5)))
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["status"] == "ok"
+    assert report["checks"]["database"]["status"] == "ok"
+    assert report["checks"]["database"]["latency_ms"] >= 0
+    assert report["checks"]["pool"]["capacity"] == settings.db_pool_size + settings.db_max_overflow
+    assert report["checks"]["s3"]["status"] == "ok"
+    # Concurrent and repeated checks share one probe run
+    assert len(calls) == 1
+    assert all(r.json() == report for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_readiness_s3_failure_is_degraded(
+    client: AsyncClient,
+    fake_s3,
+    probe_test_database,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    def unreachable(**kwargs):
+        raise ConnectionError("no route to S3")
+
+    monkeypatch.setattr(fake_s3, "head_bucket", unreachable)
+
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "degraded"
+    assert response.json()["checks"]["s3"] == {
+        "status": "failed",
+        "latency_ms": response.json()["checks"]["s3"]["latency_ms"],
+        "error": "ConnectionError",
+    }
+
+
+@pytest.mark.asyncio
+async def test_readiness_fails_when_pool_exhausted(
+    client: AsyncClient,
+    fake_s3,
+    probe_test_database,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(database, "pool_capacity", lambda: 1)
+
+    async with engine.connect():
+        response = await client.get("/health/ready")
+
+    assert response.status_code == 503
+    report = response.json()
+    assert report["status"] == "failed"
+    assert report["checks"]["pool"]["status"] == "failed"
+    assert report["checks"]["pool"]["in_use"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_readiness_fails_when_database_times_out(
+    client: AsyncClient,
+    fake_s3,
+    probe_test_database,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    class StalledSession:
+        async def __aenter__(self):
+            await asyncio.sleep(10)
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(database, "_session_maker", lambda: StalledSession())
+    monkeypatch.setattr(settings, "health_probe_timeout_seconds", 0.05)
+
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"]["error"] == "Timed out"
@@ -0,0 +1,116 @@
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from app.config import settings
+from app.services import image_service
+
+
+def _jpeg(width: int, height: int, orientation: int = 1) -> bytes:
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "blue").save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_process_image_renders_variants_without_upscaling():
+    result = image_service.process_image(
+        _jpeg(1200, 800),
+        widths=[320, 1024, 2048],
+        formats=["webp", "jpeg"],
+    )
+
+    assert (result["width"], result["height"]) == (1200, 800)
+    assert result["thumbnail"]["format"] == "jpeg"
+    # Native width on top for HiDPI screens, 2048 would upscale
+    assert sorted({(v["width"], v["height"]) for v in result["variants"]}) == [
+        (320, 213),
+        (1024, 683),
+        (1200, 800),
+    ]
+    assert {v["format"] for v in result["variants"]} == {"webp", "jpeg"}
+    for variant in result["variants"]:
+        assert Image.open(io.BytesIO(variant["body"])).width == variant["width"]
+
+
+def test_process_image_small_image_keeps_original_width():
+    result = image_service.process_image(_jpeg(200, 100), widths=[320, 640], formats=["webp"])
+
+    assert result["thumbnail"] is None
+    assert [(v["width"], v["format"]) for v in result["variants"]] == [(200, "webp")]
+
+
+def test_variant_widths_caps_original_at_largest_configured():
+    assert image_service.variant_widths(800, [320, 640, 1024]) == [320, 640, 800]
+    assert image_service.variant_widths(3000, [320, 1600]) == [320, 1600]
+    assert image_service.variant_widths(640, [320, 640]) == [320, 640]
+
+
+def test_process_image_applies_exif_orientation_to_thumbnail():
+    # Stored landscape, displayed portrait (rotated 90 degrees)
+    result = image_service.process_image(
+        _jpeg(1200, 800, orientation=6), widths=[640], formats=["webp"]
+    )
+
+    assert (result["width"], result["height"]) == (800, 1200)
+    thumbnail = Image.open(io.BytesIO(result["thumbnail"]["body"]))
+    assert thumbnail.height > thumbnail.width
+    assert [(v["width"], v["height"]) for v in result["variants"]] == [(640, 960)]
+
+
+def test_srcset_sources_orders_formats_and_widths():
+    variants = [
+        {"url": "https://cdn/a-640w.webp", "width": 640, "format": "webp"},
+        {"url": "https://cdn/a-320w.webp", "width": 320, "format": "webp"},
+        {"url": "https://cdn/a-320w.avif", "width": 320, "format": "avif"},
+    ]
+
+    assert image_service.srcset_sources(variants) == [
+        {"type": "image/avif", "srcset": "https://cdn/a-320w.avif 320w"},
+        {
+            "type": "image/webp",
+            "srcset": "https://cdn/a-320w.webp 320w, https://cdn/a-640w.webp 640w",
+        },
+    ]
+    assert image_service.srcset_sources(None) == []
+
+
+def test_derived_key():
+    assert image_service.derived_key("assets/2024/01/02/abc.jpg", "640w", "webp") == (
+        "assets/2024/01/02/abc-640w.webp"
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_image_async_sheds_load(monkeypatch):
+    monkeypatch.setattr(settings, "image_process_max_pending", 0)
+
+    with pytest.raises(image_service.ImageProcessingBusy):
+        await image_service.process_image_async(_jpeg(10, 10), widths=[320], formats=["webp"])
+
+
+@pytest.mark.asyncio
+async def test_timed_out_image_holds_its_slot_until_done(monkeypatch):
+    done = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(image_service, "_get_executor", lambda: executor)
+    monkeypatch.setattr(image_service, "process_image", lambda *args: done.wait(5))
+    monkeypatch.setattr(settings, "image_process_max_pending", 1)
+    monkeypatch.setattr(settings, "image_process_timeout_seconds", 0.01)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await image_service.process_image_async(b"", widths=[320], formats=["webp"])
+
+    # The worker is still busy with the first image
+    with pytest.raises(image_service.ImageProcessingBusy):
+        await image_service.process_image_async(b"", widths=[320], formats=["webp"])
+
+    done.set()
+    executor.shutdown(wait=True)
+    await asyncio.sleep(0)
+    assert image_service._pending == 0
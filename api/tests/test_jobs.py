@@ -0,0 +1,155 @@
+import io
+import struct
+import wave
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Asset, AssetJob
+from app.services import media_probe
+from app.services.job_service import JobService
+from tests.conftest import async_session_maker
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _wav(seconds: int, rate: int = 8000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * rate * seconds)
+    return buffer.getvalue()
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+async def _upload(client: AsyncClient, auth_headers: dict, name: str, body: bytes, mime: str) -> dict:
+    response = await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": (name, body, mime)},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_image_processed_by_job(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    fake_s3,
+):
+    body = _jpeg(800, 600)
+    asset = await _upload(client, auth_headers, "cover.jpg", body, "image/jpeg")
+
+    assert asset["processing_status"] == "pending"
+    assert asset["width"] is None
+
+    assert await JobService.run_pending(db_session) == 1
+
+    response = await client.get(f"/api/v1/assets/{asset['id']}", headers=auth_headers)
+    asset = response.json()
+    assert asset["processing_status"] == "ready"
+    assert (asset["width"], asset["height"]) == (800, 600)
+    assert asset["thumbnail_url"].endswith("-thumb.jpg")
+    variants = asset["extra_data"]["variants"]
+    assert {v["width"] for v in variants} == {320, 640, 800}
+    assert all(v["key"] in fake_s3.objects for v in variants)
+    # Derived images never overwrite the original
+    assert fake_s3.objects[asset["s3_key"]]["Body"] == body
+
+
+@pytest.mark.asyncio
+async def test_audio_duration_probed_by_job(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    fake_s3,
+):
+    asset = await _upload(client, auth_headers, "loop.wav", _wav(3), "audio/wav")
+
+    await JobService.run_pending(db_session)
+
+    response = await client.get(f"/api/v1/assets/{asset['id']}", headers=auth_headers)
+    assert response.json()["duration"] == 3
+    assert response.json()["processing_status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_failed_job_retries_then_fails(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    fake_s3,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "asset_job_max_attempts", 2)
+    monkeypatch.setattr(settings, "asset_job_retry_delay_seconds", 0)
+    asset = await _upload(client, auth_headers, "broken.jpg", b"not an image", "image/jpeg")
+
+    assert await JobService.run_pending(db_session) == 2
+
+    job = (await db_session.execute(select(AssetJob))).scalar_one()
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert "UnidentifiedImageError" in job.last_error
+    response = await client.get(f"/api/v1/assets/{asset['id']}", headers=auth_headers)
+    assert response.json()["processing_status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_locked_jobs(db_session: AsyncSession):
+    assets = [
+        Asset(
+            filename=f"{i}.jpg",
+            original_filename=f"{i}.jpg",
+            file_type="image",
+            mime_type="image/jpeg",
+            file_size=1,
+            s3_key=f"assets/{i}.jpg",
+            s3_bucket="bucket",
+            cloudfront_url=f"https://cdn/assets/{i}.jpg",
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(assets)
+    await db_session.flush()
+    for asset in assets:
+        JobService.enqueue_asset_processing(db_session, asset)
+    await db_session.commit()
+
+    async with async_session_maker() as worker_a, async_session_maker() as worker_b:
+        locked = (
+            await worker_a.execute(
+                select(AssetJob).order_by(AssetJob.run_after).limit(1).with_for_update()
+            )
+        ).scalar_one()
+
+        claimed = await JobService.claim_next(worker_b)
+
+        assert claimed is not None
+        assert claimed.id != locked.id
+        assert claimed.status == "running"
+        await worker_a.rollback()
+
+
+def test_probe_mp4_duration():
+    mvhd = _box(b"mvhd", struct.pack(">B3xIIII", 0, 0, 0, 1000, 12_500) + b"\x00" * 80)
+    mp4 = _box(b"ftyp", b"isom\x00\x00\x02\x00") + _box(b"mdat", b"\x00" * 64) + _box(b"moov", mvhd)
+
+    assert media_probe.probe_duration(io.BytesIO(mp4), "video/mp4") == 12.5
+    assert media_probe.probe_duration(io.BytesIO(b"garbage"), "video/mp4") is None
+    assert media_probe.probe_duration(io.BytesIO(mp4), "audio/mpeg") is None
@@ -0,0 +1,114 @@
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Section
+from app.services.content_service import ContentService
+from app.utils import metrics
+
+
+def _sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{prefix} not in metrics output")
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_routes_caches_and_s3(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+    fake_s3,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+    await ContentService.refresh_sections(db_session, [test_section.id])
+    await db_session.commit()
+
+    await client.get("/api/v1/content/tech")
+    await client.get("/api/v1/content/tech")
+    await client.get("/api/v1/no-such-route")
+    await client.post(
+        "/api/v1/assets/upload",
+        headers=auth_headers,
+        files={"file": ("notes.pdf", b"hello world", "application/pdf")},
+    )
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert _sample(
+        body,
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/content/tech",status="200"}',
+    ) >= 2
+    assert 'route="unmatched",status="404"' in body
+    assert _sample(body, 'cache_lookups_total{cache="content",result="hit"}') >= 1
+    assert _sample(body, 'cache_lookups_total{cache="principal",result="miss"}') >= 1
+    assert _sample(body, 's3_request_duration_seconds_count{operation="put_object"}') >= 1
+    assert _sample(
+        body,
+        's3_transferred_bytes_total{operation="put_object",direction="out"}',
+    ) >= len(b"hello world")
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_token(client: AsyncClient, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 401
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_hidden_without_token(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    assert (await client.get("/metrics")).status_code == 404
+
+    monkeypatch.setattr(settings, "debug", True)
+    assert (await client.get("/metrics")).status_code == 200
+
+    # Lambda exports EMF; its catch-all route must not expose the registry
+    monkeypatch.setattr(metrics.registry, "emf_enabled", True)
+    assert (await client.get("/metrics")).status_code == 404
+
+
+def test_emf_flush_groups_by_dimensions():
+    registry = metrics.MetricsRegistry(emf_enabled=True, namespace="Test")
+    latency = registry.register(metrics.Histogram("latency_seconds", "", ["route"]))
+    requests = registry.register(metrics.Counter("requests_total", "", ["route"]))
+    registry.register(metrics.Gauge("pool", "", lambda: [({}, 3)]))
+
+    # Module-level metrics buffer into the global registry; feed this one directly
+    for value in (0.1, 0.2):
+        registry.buffer(latency, ("/a",), value)
+        registry.buffer(requests, ("/a",), 1)
+    registry.buffer(latency, ("/b",), 0.3)
+
+    stream = io.StringIO()
+    documents = registry.flush_emf(stream)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines == documents
+    by_route = {d.get("route"): d for d in documents}
+    assert by_route["/a"]["latency_seconds"] == [0.1, 0.2]
+    assert by_route["/a"]["requests_total"] == 2
+    assert by_route["/a"]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [["route"]]
+    assert by_route["/a"]["_aws"]["CloudWatchMetrics"][0]["Namespace"] == "Test"
+    assert by_route[None]["pool"] == 3
+
+    # Each flush only carries observations made since the previous one
+    assert registry.flush_emf(io.StringIO()) == []
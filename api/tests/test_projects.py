@@ -0,0 +1,293 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Project, Section
+from tests.conftest import engine
+
+
+@pytest.mark.asyncio
+async def test_list_projects_keyset_pagination(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    # Ties on display_order are broken by id
+    db_session.add_all([
+        Project(section=test_section, slug=f"p{i}", title=f"P{i}", display_order=i // 2, is_published=True)
+        for i in range(5)
+    ])
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "section_id": str(test_section.id)}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/projects", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        seen.extend((p["display_order"], p["id"]) for p in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+    response = await client.get("/api/v1/projects", params={"include_total": True, "limit": 1})
+    assert response.json()["total"] == 5
+
+    response = await client.get("/api/v1/projects", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_reorder_projects_single_statement(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    projects = [
+        Project(section=test_section, slug=f"p{i}", title=f"P{i}", display_order=i, is_published=True)
+        for i in range(4)
+    ]
+    db_session.add_all(projects)
+    await db_session.commit()
+    new_order = [str(p.id) for p in reversed(projects)]
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE PROJECTS"):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        response = await client.post(
+            "/api/v1/projects/reorder",
+            headers=auth_headers,
+            json={"project_ids": new_order},
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    assert response.status_code == 204
+    assert len(statements) == 1
+    assert "VALUES" in statements[0]
+
+    response = await client.get("/api/v1/content/tech")
+    assert [p["id"] for p in response.json()["projects"]] == new_order
+
+
+@pytest.mark.asyncio
+async def test_reorder_projects_rejects_mixed_sections(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    other = Section(slug="dj", title="DJ", display_order=1, is_active=True)
+    tech_project = Project(section=test_section, slug="a", title="A")
+    dj_project = Project(section=other, slug="b", title="B")
+    db_session.add_all([other, tech_project, dj_project])
+    await db_session.commit()
+    # Rejected requests roll the shared session back, expiring the objects
+    tech_id, dj_id = tech_project.id, dj_project.id
+
+    response = await client.post(
+        "/api/v1/projects/reorder",
+        headers=auth_headers,
+        json={"project_ids": [str(tech_id), str(dj_id)]},
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        "/api/v1/projects/reorder",
+        headers=auth_headers,
+        json={"project_ids": [str(tech_id), str(uuid.uuid4())]},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_projects_applies_all_operations(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    to_update = Project(section=test_section, slug="old", title="Old")
+    to_publish = Project(section=test_section, slug="draft", title="Draft")
+    to_delete = Project(section=test_section, slug="gone", title="Gone", is_published=True)
+    db_session.add_all([to_update, to_publish, to_delete])
+    await db_session.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.post(
+            "/api/v1/projects/batch",
+            headers=auth_headers,
+            json={"operations": [
+                {"op": "create", "data": {
+                    "section_id": str(test_section.id), "slug": "new-1", "title": "New 1", "is_published": True,
+                }},
+                {"op": "create", "data": {
+                    # Reuses the slug of the project deleted in this batch
+                    "section_id": str(test_section.id), "slug": "gone", "title": "New 2",
+                }},
+                {"op": "update", "id": str(to_update.id), "data": {"title": "Renamed", "is_published": True}},
+                {"op": "publish", "id": str(to_publish.id)},
+                {"op": "delete", "id": str(to_delete.id)},
+            ]},
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["error"] for r in results] == [None] * 5
+    assert results[0]["id"] and results[1]["id"]
+
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT INTO PROJECTS")]
+    assert len(inserts) == 1
+    assert "ON CONFLICT" in inserts[0]
+
+    response = await client.get("/api/v1/content/tech")
+    published = {p["slug"]: p for p in response.json()["projects"]}
+    assert set(published) == {"new-1", "old", "draft"}
+    assert published["old"]["title"] == "Renamed"
+    # Published by create, update and publish alike
+    assert all(p["published_at"] is not None for p in published.values())
+
+
+@pytest.mark.asyncio
+async def test_batch_projects_rejects_whole_batch(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    existing = Project(section=test_section, slug="taken", title="Taken")
+    db_session.add(existing)
+    await db_session.commit()
+    section_id, existing_id = str(test_section.id), str(existing.id)
+
+    response = await client.post(
+        "/api/v1/projects/batch",
+        headers=auth_headers,
+        json={"operations": [
+            {"op": "create", "data": {"section_id": section_id, "slug": "fresh", "title": "Fresh"}},
+            {"op": "create", "data": {"section_id": section_id, "slug": "taken", "title": "Dup"}},
+            {"op": "create", "data": {"section_id": str(uuid.uuid4()), "slug": "x", "title": "X"}},
+            {"op": "delete", "id": str(uuid.uuid4())},
+            {"op": "update", "id": existing_id, "data": {"title": "A"}},
+            {"op": "publish", "id": existing_id},
+        ]},
+    )
+    assert response.status_code == 400
+    errors = [r["error"] for r in response.json()["detail"]]
+    assert errors[0] is None
+    assert "slug" in errors[1]
+    assert errors[2] == "Section not found"
+    assert errors[3] == "Project not found"
+    assert errors[4] is None
+    assert errors[5] == "Project appears in more than one operation"
+
+    response = await client.get(
+        "/api/v1/projects",
+        params={"published_only": "false", "section_id": section_id},
+    )
+    assert [p["slug"] for p in response.json()["items"]] == ["taken"]
+    assert response.json()["items"][0]["title"] == "Taken"
+
+
+@pytest.mark.asyncio
+async def test_upsert_project_by_slug(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_section: Section,
+):
+    url = "/api/v1/projects/by-section/tech/portfolio"
+    body = {"title": "Portfolio", "is_published": True, "tags": ["react"]}
+
+    response = await client.put(url, headers=auth_headers, json=body)
+    assert response.status_code == 201
+    created = response.json()
+    assert created["slug"] == "portfolio"
+    assert created["section_id"] == str(test_section.id)
+    assert created["published_at"] is not None
+
+    response = await client.put(url, headers=auth_headers, json={**body, "title": "Portfolio v2"})
+    assert response.status_code == 200
+    updated = response.json()
+    assert updated["id"] == created["id"]
+    assert updated["title"] == "Portfolio v2"
+    assert updated["published_at"] == created["published_at"]
+
+    response = await client.put(
+        url,
+        headers=auth_headers,
+        params={"overwrite": "false"},
+        json={**body, "title": "Ignored"},
+    )
+    assert response.status_code == 200
+    assert response.json()["title"] == "Portfolio v2"
+
+    response = await client.get("/api/v1/content/tech")
+    assert [p["title"] for p in response.json()["projects"]] == ["Portfolio v2"]
+
+    response = await client.put(
+        "/api/v1/projects/by-section/missing/portfolio",
+        headers=auth_headers,
+        json=body,
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_project_slug_conflicts(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    first = Project(section=test_section, slug="first", title="First")
+    second = Project(section=test_section, slug="second", title="Second")
+    db_session.add_all([first, second])
+    await db_session.commit()
+    section_id, second_id = test_section.id, second.id
+
+    response = await client.post(
+        "/api/v1/projects",
+        headers=auth_headers,
+        json={"section_id": str(section_id), "slug": "first", "title": "Dup"},
+    )
+    assert response.status_code == 409
+
+    response = await client.put(
+        f"/api/v1/projects/{second_id}",
+        headers=auth_headers,
+        json={"slug": "first"},
+    )
+    assert response.status_code == 409
+
+    # The session is still usable after the rejected writes
+    response = await client.put(
+        f"/api/v1/projects/{second_id}",
+        headers=auth_headers,
+        json={"slug": "renamed"},
+    )
+    assert response.status_code == 200
+    assert response.json()["slug"] == "renamed"
@@ -0,0 +1,76 @@
+import json
+import logging
+import re
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Project, Section
+from app.utils.query_stats import track_queries
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_and_request_log(
+    client: AsyncClient,
+    test_section: Section,
+    caplog: pytest.LogCaptureFixture,
+):
+    with caplog.at_level(logging.INFO, logger="app.utils.query_stats"):
+        response = await client.get("/api/v1/projects", params={"include_total": "true"})
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    match = re.match(r'db;dur=[\d.]+;desc="(\d+) queries", total;dur=[\d.]+$', timing)
+    assert match, timing
+    # Page query plus the count
+    assert int(match.group(1)) == 2
+
+    records = [json.loads(r.message) for r in caplog.records if '"event": "request"' in r.message]
+    assert records[-1]["path"] == "/api/v1/projects"
+    assert records[-1]["queries"] == 2
+    assert "n_plus_one" not in records[-1]
+
+
+@pytest.mark.asyncio
+async def test_update_project_query_budget(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    test_section: Section,
+    assert_max_queries,
+):
+    project = Project(section=test_section, slug="p", title="P", is_published=True)
+    db_session.add(project)
+    await db_session.commit()
+
+    # Principal, project + assets, savepoint/update/release, section rebuild,
+    # refresh of the returned project
+    with assert_max_queries(13):
+        response = await client.put(
+            f"/api/v1/projects/{project.id}",
+            headers=auth_headers,
+            json={"title": "Renamed"},
+        )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_flagged(
+    db_session: AsyncSession,
+    test_section: Section,
+):
+    with track_queries() as outer:
+        with track_queries() as stats:
+            for _ in range(5):
+                await db_session.execute(
+                    select(Project.id).where(Project.section_id == test_section.id)
+                )
+            await db_session.execute(select(Section.id))
+
+    assert stats.count == 6
+    assert outer.count == 6
+    [(statement, count)] = stats.repeated(threshold=5)
+    assert count == 5
+    assert "FROM projects" in statement
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that only some routes need; importing the app must not load them.
+DEFERRED_MODULES = ["boto3", "botocore", "PIL", "passlib", "bcrypt", "jose", "asyncpg"]
+
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "2.0"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (DEFERRED_MODULES,)
+
+
+def _import_app() -> dict:
+    env = {**os.environ, "AWS_LAMBDA_FUNCTION_NAME": "import-budget-test"}
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=API_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_cold_import_defers_heavy_dependencies():
+    result = _import_app()
+
+    assert result["loaded"] == []
+
+
+def test_cold_import_time_budget():
+    # Best of three fresh interpreters to keep scheduler noise out
+    elapsed = min(_import_app()["elapsed"] for _ in range(3))
+
+    assert elapsed < IMPORT_TIME_BUDGET_SECONDS, (
+        f"importing app.main took {elapsed:.2f}s "
+        f"(budget {IMPORT_TIME_BUDGET_SECONDS:.2f}s)"
+    )
@@ -21,10 +21,36 @@ const ensureApiBase = () => {
   }
 };
 
+// Optional static export (see api/scripts/export_content.py). When set, content is
+// read from CloudFront via the manifest and the API is only used as a fallback.
+const CONTENT_MANIFEST_URL = process.env.REACT_APP_CONTENT_MANIFEST_URL;
+
+async function fetchStaticContent() {
+  const manifestResponse = await fetch(CONTENT_MANIFEST_URL, { cache: 'no-cache' });
+  if (!manifestResponse.ok) {
+    throw new Error(`Failed to fetch content manifest: ${manifestResponse.status}`);
+  }
+  const manifest = await manifestResponse.json();
+
+  const response = await fetch(manifest.content);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch static content: ${response.status}`);
+  }
+  return response.json();
+}
+
 /**
- * Fetch all content from the API
+ * Fetch all content from the static export, falling back to the API
  */
 export async function fetchAllContent() {
+  if (CONTENT_MANIFEST_URL) {
+    try {
+      return await fetchStaticContent();
+    } catch (err) {
+      console.warn('Static content unavailable, falling back to API:', err.message);
+    }
+  }
+
   ensureApiBase();
   const response = await fetch(`${API_BASE}/content`);
   if (!response.ok) {